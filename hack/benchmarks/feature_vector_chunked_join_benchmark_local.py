@@ -0,0 +1,107 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generates an offline feature vector of an as-of joined local parquet feature set into a parquet directory target
+# with the local engine, in memory and in chunks of entity rows (see the chunksize engine arg of LocalFeatureMerger).
+# The peak memory is measured with tracemalloc, which tracks the pandas and numpy allocations.
+
+import tempfile
+import time
+import tracemalloc
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+
+import mlrun.feature_store as fstore
+import mlrun.utils
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+from mlrun.model import DataTarget
+
+num_entities = 10_000
+num_rows = 2_000_000
+num_entity_rows = 2_000_000
+num_features = 10
+chunksize = 200_000
+
+
+def create_feature_set(tmp_dir: str) -> fstore.FeatureSet:
+    rng = np.random.default_rng()
+    path = f"{tmp_dir}/measurements.parquet"
+    df = pd.DataFrame(
+        {f"feature_{j}": rng.random(num_rows) for j in range(num_features)}
+    )
+    df.insert(0, "id", rng.integers(0, num_entities, num_rows))
+    df.insert(
+        1,
+        "timestamp",
+        pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(num_rows), unit="s"),
+    )
+    df.to_parquet(path, index=False, row_group_size=100_000)
+
+    feature_set = fstore.FeatureSet(
+        "measurements",
+        entities=[fstore.Entity("id", value_type="int")],
+        timestamp_key="timestamp",
+    )
+    for column in df.columns[2:]:
+        feature_set.add_feature(fstore.Feature(name=column, value_type="float"))
+    feature_set.spec.targets = [ParquetTarget(path=path)]
+    feature_set.status.update_target(DataTarget(kind="parquet", path=path))
+    return feature_set
+
+
+def run(
+    feature_set: fstore.FeatureSet,
+    entity_rows: pd.DataFrame,
+    target_path,
+    **engine_args,
+):
+    vector = fstore.FeatureVector("benchmark", ["measurements.*"])
+    vector.feature_set_objects = {"measurements": feature_set}
+    tracemalloc.start()
+    start = time.monotonic()
+    with unittest.mock.patch.object(vector, "save"):
+        LocalFeatureMerger(vector, **engine_args).start(
+            entity_rows=entity_rows,
+            entity_timestamp_column="timestamp",
+            target=ParquetTarget(path=target_path, partitioned=False),
+        )
+    end = time.monotonic()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"chunksize={engine_args.get('chunksize')}: vector in {end - start:.2f} seconds, "
+        f"peak memory {peak / 2**20:.0f} MiB"
+    )
+
+
+def main():
+    mlrun.utils.logger.set_logger_level("WARNING")
+    rng = np.random.default_rng()
+    entity_rows = pd.DataFrame(
+        {
+            "id": rng.integers(0, num_entities, num_entity_rows),
+            "timestamp": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, num_rows, num_entity_rows), unit="s"),
+        }
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        feature_set = create_feature_set(tmp_dir)
+        run(feature_set, entity_rows, f"{tmp_dir}/in-memory/")
+        run(feature_set, entity_rows, f"{tmp_dir}/chunked/", chunksize=chunksize)
+
+
+main()
@@ -0,0 +1,92 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generates an offline feature vector of several local parquet feature sets with the local engine, reading the
+# feature sets one by one and concurrently (see feature_store.offline_concurrent_reads). An artificial latency is
+# added to every datastore read, to mimic reading the feature sets from an object storage.
+
+import tempfile
+import time
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+
+import mlrun
+import mlrun.datastore.base
+import mlrun.feature_store as fstore
+import mlrun.utils
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+from mlrun.model import DataTarget
+
+num_feature_sets = 8
+num_rows = 100_000
+num_features = 10
+read_latency_secs = 0.5
+
+
+def create_feature_sets(tmp_dir: str) -> dict[str, fstore.FeatureSet]:
+    rng = np.random.default_rng()
+    feature_sets = {}
+    for i in range(num_feature_sets):
+        name = f"feature-set-{i}"
+        path = f"{tmp_dir}/{name}.parquet"
+        df = pd.DataFrame(
+            {f"feature_{i}_{j}": rng.random(num_rows) for j in range(num_features)}
+        )
+        df.insert(0, "id", np.arange(num_rows))
+        df.to_parquet(path, index=False)
+
+        feature_set = fstore.FeatureSet(
+            name, entities=[fstore.Entity("id", value_type="int")]
+        )
+        for column in df.columns[1:]:
+            feature_set.add_feature(fstore.Feature(name=column, value_type="float"))
+        feature_set.spec.targets = [ParquetTarget(path=path)]
+        feature_set.status.update_target(DataTarget(kind="parquet", path=path))
+        feature_sets[name] = feature_set
+    return feature_sets
+
+
+def run(feature_sets: dict[str, fstore.FeatureSet], concurrent_reads: int):
+    mlrun.mlconf.feature_store.offline_concurrent_reads = concurrent_reads
+    vector = fstore.FeatureVector("benchmark", [f"{name}.*" for name in feature_sets])
+    vector.feature_set_objects = dict(feature_sets)
+    start = time.monotonic()
+    df = LocalFeatureMerger(vector).start().to_dataframe()
+    end = time.monotonic()
+    print(
+        f"concurrent reads={concurrent_reads}: {df.shape} vector in {end - start:.2f} seconds"
+    )
+
+
+def main():
+    mlrun.utils.logger.set_logger_level("INFO")
+    as_df = mlrun.datastore.base.DataStore.as_df
+
+    def slow_as_df(*args, **kwargs):
+        time.sleep(read_latency_secs)
+        return as_df(*args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        feature_sets = create_feature_sets(tmp_dir)
+        with unittest.mock.patch.object(
+            mlrun.datastore.base.DataStore, "as_df", slow_as_df
+        ):
+            for concurrent_reads in [1, 4, num_feature_sets]:
+                run(feature_sets, concurrent_reads)
+
+
+main()
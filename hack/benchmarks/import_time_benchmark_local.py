@@ -0,0 +1,81 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the time of `import mlrun` in fresh interpreters (`python -X importtime`), prints the slowest imports and
+# exits with an error when the import is slower than the threshold, or when it loads any of the packages that are
+# meant to be loaded only on first use (see the lazy attributes in mlrun/__init__.py).
+
+import os
+import statistics
+import subprocess
+import sys
+
+num_runs = 5
+threshold_secs = 2.5
+num_slowest_imports = 15
+lazy_modules = [
+    "IPython",
+    "kfp",
+    "nuclio",
+    "mlrun.datastore",
+    "mlrun.db",
+    "mlrun.execution",
+    "mlrun.package",
+    "mlrun.projects",
+    "mlrun.run",
+    "mlrun.runtimes",
+]
+
+
+def import_mlrun() -> dict[str, int]:
+    """Import mlrun in a fresh interpreter, returning the cumulative import time (microseconds) of each module"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mlrun"],
+        capture_output=True,
+        text=True,
+        check=True,
+        # with a configured dbpath, importing mlrun connects to the API (which loads the db client)
+        env={key: value for key, value in os.environ.items() if key != "MLRUN_DBPATH"},
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def main():
+    runs = [import_mlrun() for _ in range(num_runs)]
+    import_secs = statistics.median(run["mlrun"] for run in runs) / 1_000_000
+    last_run = runs[-1]
+    for module, cumulative in sorted(
+        last_run.items(), key=lambda item: item[1], reverse=True
+    )[:num_slowest_imports]:
+        print(f"{cumulative / 1_000_000:8.3f}s  {module}")
+    print(f"import mlrun: {import_secs:.2f} seconds (median of {num_runs} runs)")
+
+    errors = []
+    if import_secs > threshold_secs:
+        errors.append(f"import mlrun took more than {threshold_secs} seconds")
+    eagerly_loaded = [module for module in lazy_modules if module in last_run]
+    if eagerly_loaded:
+        errors.append(f"import mlrun loaded lazily loaded modules: {eagerly_loaded}")
+    if errors:
+        print("\n".join(errors))
+        sys.exit(1)
+
+
+main()
@@ -0,0 +1,95 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Writes synthetic monitoring application results to a local SQLite model monitoring store, once per event and
+# once in bulk (see SQLStoreBase.write_application_events), and prints the write throughput of each mode.
+
+import datetime
+import tempfile
+import time
+import unittest.mock
+
+import mlrun.model_monitoring
+import mlrun.utils
+from mlrun.common.schemas.model_monitoring import ResultData, WriterEvent
+
+num_endpoints = 10
+num_applications = 5
+num_results = 10
+batch_size = 100
+
+
+def generate_events(run_index: int) -> list[dict]:
+    end_infer_time = datetime.datetime(2024, 1, 1) + datetime.timedelta(
+        minutes=run_index
+    )
+    events = []
+    for endpoint_index in range(num_endpoints):
+        for application_index in range(num_applications):
+            for result_index in range(num_results):
+                events.append(
+                    {
+                        WriterEvent.ENDPOINT_ID: f"endpoint-{endpoint_index}",
+                        WriterEvent.APPLICATION_NAME: f"app-{application_index}",
+                        WriterEvent.START_INFER_TIME: str(
+                            end_infer_time - datetime.timedelta(minutes=1)
+                        ),
+                        WriterEvent.END_INFER_TIME: str(end_infer_time),
+                        ResultData.RESULT_NAME: f"result-{result_index}",
+                        ResultData.RESULT_KIND: 0,
+                        ResultData.RESULT_VALUE: 0.5,
+                        ResultData.RESULT_STATUS: 0,
+                        ResultData.RESULT_EXTRA_DATA: "",
+                        ResultData.CURRENT_STATS: "",
+                    }
+                )
+    return events
+
+
+def run(store, bulk: bool, run_index: int):
+    events = generate_events(run_index)
+    start = time.monotonic()
+    if bulk:
+        for i in range(0, len(events), batch_size):
+            store.write_application_events(events=events[i : i + batch_size])
+    else:
+        for event in events:
+            store.write_application_event(event=event)
+    end = time.monotonic()
+    mode = "bulk" if bulk else "per-event"
+    print(
+        f"{mode}: {len(events)} results in {end - start:.2f} seconds ({len(events) / (end - start):.0f} results/sec)"
+    )
+
+
+def main():
+    # The per-event writes log every query in debug level, which would dominate their run
+    mlrun.utils.logger.set_logger_level("INFO")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with unittest.mock.patch(
+            "mlrun.model_monitoring.helpers.get_connection_string",
+            return_value=f"sqlite:///{tmp_dir}/benchmark.db",
+        ):
+            store = mlrun.model_monitoring.get_store_object(project="benchmark")
+        store.create_tables()
+        # The first run of each mode inserts the results, the second one updates them
+        for run_index in range(2):
+            run(store, bulk=False, run_index=run_index)
+        store.delete_model_endpoints_resources()
+        store.create_tables()
+        for run_index in range(2):
+            run(store, bulk=True, run_index=run_index)
+
+
+main()
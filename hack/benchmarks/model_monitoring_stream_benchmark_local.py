@@ -0,0 +1,114 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Replays synthetic serving events through the event processing, flattening and feature names mapping steps of the
+# model monitoring stream.
+# The endpoints state is pre-populated, so the benchmark runs locally without a model endpoints store.
+
+import asyncio
+import datetime
+import random
+import time
+
+import storey
+
+import mlrun.model_monitoring.stream_processing as stream_processing
+import mlrun.utils
+from mlrun.common.schemas.model_monitoring.constants import EventFieldType
+
+num_endpoints = 10
+num_requests = 20_000
+rows_per_request = 5
+num_features = 20
+
+
+def generate_events() -> list[dict]:
+    start_time = datetime.datetime.now(tz=datetime.timezone.utc)
+    events = []
+    for i in range(num_requests):
+        endpoint_id = f"endpoint-{i % num_endpoints}"
+        events.append(
+            {
+                EventFieldType.FUNCTION_URI: "benchmark/model-serving",
+                EventFieldType.VERSIONED_MODEL: f"model-{endpoint_id}:latest",
+                EventFieldType.ENDPOINT_ID: endpoint_id,
+                "when": str(start_time + datetime.timedelta(milliseconds=i)),
+                "microsec": random.randint(100, 1000),
+                "request": {
+                    "id": str(i),
+                    "inputs": [
+                        [random.randint(0, 100) for _ in range(num_features)]
+                        for _ in range(rows_per_request)
+                    ],
+                },
+                "resp": {
+                    "outputs": [random.randint(0, 1) for _ in range(rows_per_request)]
+                },
+            }
+        )
+    return events
+
+
+def init_steps():
+    process_endpoint_event = stream_processing.ProcessEndpointEvent(
+        project="benchmark", full_event=True
+    )
+    map_feature_names = stream_processing.MapFeatureNames(
+        project="benchmark", infer_columns_from_data=True
+    )
+    for i in range(num_endpoints):
+        endpoint_id = f"endpoint-{i}"
+        process_endpoint_event.endpoints.add(endpoint_id)
+        map_feature_names.feature_names[endpoint_id] = [
+            f"feature_{j}" for j in range(num_features)
+        ]
+        map_feature_names.label_columns[endpoint_id] = ["label"]
+        map_feature_names.endpoint_type[endpoint_id] = 1
+    return process_endpoint_event, map_feature_names
+
+
+def build_flow():
+    process_endpoint_event, map_feature_names = init_steps()
+    return storey.build_flow(
+        [
+            storey.AsyncEmitSource(),
+            process_endpoint_event,
+            storey.Filter(lambda event: event is not None),
+            storey.FlatMap(lambda event: event),
+            map_feature_names,
+            storey.Reduce(0, lambda count, _: count + 1),
+        ]
+    ).run()
+
+
+async def run(events: list[dict]):
+    controller = build_flow()
+    start = time.monotonic()
+    for event in events:
+        await controller.emit(event, key=event[EventFieldType.ENDPOINT_ID])
+    await controller.terminate()
+    count = await controller.await_termination()
+    end = time.monotonic()
+    print(
+        f"{count} rows in {end - start:.2f} seconds ({count / (end - start):.0f} rows/sec)"
+    )
+
+
+def main():
+    # The mapping step logs every mapped event in debug level, which would dominate the run
+    mlrun.utils.logger.set_logger_level("INFO")
+    asyncio.run(run(events=generate_events()))
+
+
+main()
@@ -0,0 +1,133 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Starts a local API server over a SQLite DB, stores synthetic hyperparameter runs (each with its iterations table) in
+# it, and lists them into a dataframe, once through the JSON listing (list_runs().to_df()) and once through the arrow
+# columnar listing (list_runs(as_df=True)).
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+import mlrun
+import mlrun.db.httpdb
+
+num_runs = 1_000
+num_parameters = 10
+num_iterations = 20
+project = "benchmark"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workdir: str) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    env = os.environ.copy()
+    env["MLRUN_HTTPDB__PORT"] = str(port)
+    env["MLRUN_HTTPDB__DSN"] = (
+        f"sqlite:///{workdir}/mlrun.sqlite3?check_same_thread=false"
+    )
+    env["MLRUN_HTTPDB__LOGS_PATH"] = workdir
+    env["MLRUN_LOG_LEVEL"] = "WARNING"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "server.api.main"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://localhost:{port}"
+    for _ in range(90):
+        try:
+            requests.get(f"{url}/api/v1/healthz").raise_for_status()
+            return process, url
+        except requests.RequestException:
+            time.sleep(1)
+    process.terminate()
+    raise RuntimeError("The server did not start")
+
+
+def generate_run(index: int) -> dict:
+    parameters = {f"param_{i}": index * i for i in range(num_parameters)}
+    iterations = [
+        ["state", "iter"]
+        + [f"param.{key}" for key in parameters]
+        + ["output.accuracy", "output.loss"]
+    ]
+    for iteration in range(1, num_iterations + 1):
+        iterations.append(
+            ["completed", iteration]
+            + list(parameters.values())
+            + [iteration / num_iterations, 1 - iteration / num_iterations]
+        )
+    return {
+        "kind": "job",
+        "metadata": {
+            "name": f"train-{index % 10}",
+            "uid": f"uid-{index}",
+            "project": project,
+            "labels": {"owner": "admin", "kind": "job"},
+        },
+        "spec": {
+            "parameters": parameters,
+            "inputs": {"dataset": "store://datasets/benchmark/dataset"},
+            "handler": "train",
+        },
+        "status": {
+            "state": "completed",
+            "start_time": "2024-01-01T00:00:00+00:00",
+            "results": {"accuracy": 0.9, "loss": 0.1},
+            "iterations": iterations,
+            "artifacts": [
+                {"kind": "model", "metadata": {"key": "model"}, "spec": {}},
+            ],
+        },
+    }
+
+
+def main():
+    mlrun.mlconf.log_level = "WARNING"
+    with tempfile.TemporaryDirectory() as workdir:
+        process, url = start_server(workdir)
+        try:
+            db = mlrun.db.httpdb.HTTPRunDB(url)
+            db.connect()
+            db.create_project(mlrun.new_project(project, save=False))
+            for index in range(num_runs):
+                db.store_run(generate_run(index), f"uid-{index}", project)
+
+            for name, list_runs in [
+                ("json", lambda: db.list_runs(project=project, iter=True).to_df()),
+                ("arrow", lambda: db.list_runs(project=project, iter=True, as_df=True)),
+            ]:
+                start = time.monotonic()
+                df = list_runs()
+                end = time.monotonic()
+                print(
+                    f"{name}: {len(df)} runs to dataframe in {end - start:.2f} seconds"
+                )
+        finally:
+            process.terminate()
+            process.wait()
+
+
+main()
@@ -28,51 +28,133 @@ __all__ = [
     "VolumeMount",
 ]
 
+import importlib
+import typing
 from os import environ, path
 
 import dotenv
-import mlrun_pipelines
 
 from .config import config as mlconf
-from .datastore import DataItem, store_manager
-from .db import get_run_db
 from .errors import MLRunInvalidArgumentError, MLRunNotFoundError
-from .execution import MLClientCtx
-from .model import RunObject, RunTemplate, new_task
-from .package import ArtifactType, DefaultPackager, Packager, handler
-from .projects import (
-    ProjectMetadata,
-    build_function,
-    deploy_function,
-    get_or_create_project,
-    load_project,
-    new_project,
-    pipeline_context,
-    run_function,
-)
-from .projects.project import _add_username_to_project_name_if_needed
-from .run import (
-    _run_pipeline,
-    code_to_function,
-    function_to_module,
-    get_dataitem,
-    get_object,
-    get_or_create_ctx,
-    get_pipeline,
-    import_function,
-    new_function,
-    wait_for_pipeline_completion,
-)
-from .runtimes import new_model_server
-from .secrets import get_secret_or_env
 from .utils.version import Version
 
-__version__ = Version().get()["version"]
+if typing.TYPE_CHECKING:
+    from mlrun_pipelines.common.mounts import VolumeMount
+    from mlrun_pipelines.mounts import auto_mount, mount_v3io, v3io_cred
+
+    from .datastore import DataItem, store_manager
+    from .db import get_run_db
+    from .execution import MLClientCtx
+    from .model import RunObject, RunTemplate, new_task
+    from .package import ArtifactType, DefaultPackager, Packager, handler
+    from .projects import (
+        ProjectMetadata,
+        build_function,
+        deploy_function,
+        get_or_create_project,
+        load_project,
+        new_project,
+        pipeline_context,
+        run_function,
+    )
+    from .projects.project import _add_username_to_project_name_if_needed
+    from .run import (
+        _run_pipeline,
+        code_to_function,
+        function_to_module,
+        get_dataitem,
+        get_object,
+        get_or_create_ctx,
+        get_pipeline,
+        import_function,
+        new_function,
+        wait_for_pipeline_completion,
+    )
+    from .runtimes import new_model_server
+    from .secrets import get_secret_or_env
+
+# The API of the heavy subpackages is loaded on first access (PEP 562), so that importing mlrun (e.g. in a job or a
+# serving function) only loads what the code actually uses. [attribute name] -> (module, attribute in module)
+_lazy_attributes = {
+    **{
+        name: (".datastore", name)
+        for name in [
+            "DataItem",
+            "store_manager",
+        ]
+    },
+    "get_run_db": (".db", "get_run_db"),
+    "MLClientCtx": (".execution", "MLClientCtx"),
+    **{name: (".model", name) for name in ["RunObject", "RunTemplate", "new_task"]},
+    **{
+        name: (".package", name)
+        for name in ["ArtifactType", "DefaultPackager", "Packager", "handler"]
+    },
+    **{
+        name: (".projects", name)
+        for name in [
+            "ProjectMetadata",
+            "build_function",
+            "deploy_function",
+            "get_or_create_project",
+            "load_project",
+            "new_project",
+            "pipeline_context",
+            "run_function",
+        ]
+    },
+    "_add_username_to_project_name_if_needed": (
+        ".projects.project",
+        "_add_username_to_project_name_if_needed",
+    ),
+    **{
+        name: (".run", name)
+        for name in [
+            "_run_pipeline",
+            "code_to_function",
+            "function_to_module",
+            "get_dataitem",
+            "get_object",
+            "get_or_create_ctx",
+            "get_pipeline",
+            "import_function",
+            "new_function",
+            "wait_for_pipeline_completion",
+        ]
+    },
+    "new_model_server": (".runtimes", "new_model_server"),
+    "get_secret_or_env": (".secrets", "get_secret_or_env"),
+    "VolumeMount": ("mlrun_pipelines.common.mounts", "VolumeMount"),
+    **{
+        name: ("mlrun_pipelines.mounts", name)
+        for name in ["mount_v3io", "v3io_cred", "auto_mount"]
+    },
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        module_name, attribute = _lazy_attributes[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+    else:
+        # a subpackage that wasn't imported yet, e.g. `mlrun.runtimes` after `import mlrun`
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
 
-VolumeMount = mlrun_pipelines.common.mounts.VolumeMount
-mount_v3io = mlrun_pipelines.mounts.mount_v3io
-v3io_cred = mlrun_pipelines.mounts.v3io_cred
-auto_mount = mlrun_pipelines.mounts.auto_mount
+
+__version__ = Version().get()["version"]
 
 
 def get_version():
@@ -137,6 +219,8 @@ def set_environment(
         raise ValueError("DB/API path was not detected, please specify its address")
 
     # check connectivity and load remote defaults
+    from .db import get_run_db
+
     get_run_db()
     if api_path:
         environ["MLRUN_DBPATH"] = mlconf.dbpath
@@ -165,6 +249,8 @@ def set_environment(
 
 
 def get_current_project(silent=False):
+    from .projects import pipeline_context
+
     if not pipeline_context.project and not silent:
         raise MLRunInvalidArgumentError(
             "current project is not initialized, use new, get or load project methods first"
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import pathlib
 import re
 import typing
@@ -212,6 +213,120 @@ class ArtifactManager:
         :param kwargs: Arguments to pass to the artifact class.
         :return: The logged artifact.
         """
+        item, db_key, upload = self._prepare_artifact_to_log(
+            producer,
+            item,
+            body=body,
+            target_path=target_path,
+            tag=tag,
+            viewer=viewer,
+            local_path=local_path,
+            artifact_path=artifact_path,
+            format=format,
+            upload=upload,
+            labels=labels,
+            db_key=db_key,
+            project=project,
+            is_retained_producer=is_retained_producer,
+            **kwargs,
+        )
+        if upload:
+            item.upload(artifact_path=artifact_path)
+
+        if db_key:
+            self._log_to_db(db_key, item.project, producer.inputs, item)
+        self._debug_log_artifact(item, db_key)
+        return item
+
+    def log_artifacts(
+        self,
+        artifacts: list[dict],
+        artifact_path=None,
+        project=None,
+    ) -> list[typing.Optional[Artifact]]:
+        """
+        Log multiple artifacts - upload them concurrently and store them in the DB with a single request.
+
+        :param artifacts:       List of :py:meth:`log_artifact` keyword arguments, one per artifact (each must
+                                include ``producer`` and ``item``). An artifact may also set ``skip_if_exists``
+                                to store it only if an artifact with the same key, tag, iteration and producer
+                                does not exist yet.
+        :param artifact_path:   The default path to store the artifacts in.
+        :param project:         The project to log the artifacts to.
+        :return: The logged artifacts, aligned with the given ones (None for artifacts that already existed
+                 and were skipped).
+        """
+        producers, items, db_keys, skip_if_exists = [], [], [], []
+        items_to_upload = []
+        for artifact_kwargs in artifacts:
+            artifact_kwargs = artifact_kwargs.copy()
+            producer = artifact_kwargs.pop("producer")
+            skip_if_exists.append(artifact_kwargs.pop("skip_if_exists", False))
+            artifact_kwargs.setdefault("artifact_path", artifact_path)
+            artifact_kwargs.setdefault("project", project)
+            item, db_key, upload = self._prepare_artifact_to_log(
+                producer, **artifact_kwargs
+            )
+            producers.append(producer)
+            items.append(item)
+            db_keys.append(db_key)
+            if upload:
+                items_to_upload.append((item, artifact_kwargs["artifact_path"]))
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=mlrun.mlconf.artifacts.upload_max_workers
+        ) as executor:
+            futures = [
+                executor.submit(item.upload, artifact_path=item_artifact_path)
+                for item, item_artifact_path in items_to_upload
+            ]
+            for future in futures:
+                # re-raise the upload failure, if any
+                future.result()
+
+        logged_artifacts = list(items)
+        indexes_to_store = [index for index, db_key in enumerate(db_keys) if db_key]
+        if self.artifact_db and indexes_to_store:
+            for index in indexes_to_store:
+                self._prepare_artifact_for_db(producers[index].inputs, items[index])
+            uids = self.artifact_db.store_artifacts(
+                [items[index].to_dict() for index in indexes_to_store],
+                project=project or items[indexes_to_store[0]].project,
+                skip_if_exists=[skip_if_exists[index] for index in indexes_to_store],
+            )
+            for index, uid in zip(indexes_to_store, uids):
+                if skip_if_exists[index] and uid is None:
+                    self.artifacts.pop(items[index].key, None)
+                    logged_artifacts[index] = None
+
+        for logged_artifact, db_key in zip(logged_artifacts, db_keys):
+            if logged_artifact:
+                self._debug_log_artifact(logged_artifact, db_key)
+        return logged_artifacts
+
+    def _prepare_artifact_to_log(
+        self,
+        producer: typing.Union["ArtifactProducer", "mlrun.MLClientCtx"],
+        item: Artifact,
+        body=None,
+        target_path="",
+        tag="",
+        viewer="",
+        local_path="",
+        artifact_path=None,
+        format=None,
+        upload=None,
+        labels=None,
+        db_key=None,
+        project=None,
+        is_retained_producer=None,
+        **kwargs,
+    ) -> tuple[Artifact, str, bool]:
+        """
+        Enrich and validate an artifact before logging it (see :py:meth:`log_artifact` for the parameters).
+
+        :return: A tuple of the artifact, its db key and whether it should be uploaded.
+        """
         if isinstance(item, str):
             key = item
             if local_path and isdir(local_path):
@@ -308,20 +423,21 @@ class ArtifactManager:
         item.before_log()
         self.artifacts[key] = item
 
+        should_upload = False
         if ((upload is None and item.kind != "dir") or upload) and not item.is_inline():
             # before uploading the item, we want to ensure that its tags are valid,
             # so that we don't upload something that won't be stored later
             validate_tag_name(item.metadata.tag, "artifact.metadata.tag")
-            item.upload(artifact_path=artifact_path)
+            should_upload = True
 
-        if db_key:
-            self._log_to_db(db_key, project, producer.inputs, item)
+        return item, db_key, should_upload
+
+    def _debug_log_artifact(self, item: Artifact, db_key: str):
         size = str(item.size) or "?"
         db_str = "Y" if (self.artifact_db and db_key) else "N"
         logger.debug(
-            f"log artifact {key} at {item.target_path}, size: {size}, db: {db_str}"
+            f"log artifact {item.key} at {item.target_path}, size: {size}, db: {db_str}"
         )
-        return item
 
     def update_artifact(self, producer, item):
         self.artifacts[item.key] = item
@@ -337,9 +453,7 @@ class ArtifactManager:
         :param tag: The name of the Tag of the artifact.
         """
         if self.artifact_db:
-            item.updated = None
-            if sources:
-                item.sources = [{"name": k, "path": str(v)} for k, v in sources.items()]
+            self._prepare_artifact_for_db(sources, item)
             self.artifact_db.store_artifact(
                 key,
                 item.to_dict(),
@@ -349,6 +463,12 @@ class ArtifactManager:
                 tree=item.tree,
             )
 
+    @staticmethod
+    def _prepare_artifact_for_db(sources, item):
+        item.updated = None
+        if sources:
+            item.sources = [{"name": k, "path": str(v)} for k, v in sources.items()]
+
     def link_artifact(
         self,
         project,
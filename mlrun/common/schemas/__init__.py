@@ -38,6 +38,9 @@ from .artifact import (
     ArtifactIdentifier,
     ArtifactMetadata,
     ArtifactSpec,
+    StoreArtifactItem,
+    StoreArtifactsRequest,
+    StoreArtifactsResponse,
 )
 from .auth import (
     AuthInfo,
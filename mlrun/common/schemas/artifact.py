@@ -101,6 +101,21 @@ class Artifact(pydantic.BaseModel):
     status: ObjectStatus
 
 
+class StoreArtifactItem(pydantic.BaseModel):
+    artifact: Artifact
+    # store the artifact only if an artifact with the same key, tag, iteration and producer does not exist
+    skip_if_exists: bool = False
+
+
+class StoreArtifactsRequest(pydantic.BaseModel):
+    artifacts: list[StoreArtifactItem]
+
+
+class StoreArtifactsResponse(pydantic.BaseModel):
+    # aligned with the request artifacts, None for artifacts that were skipped
+    uids: list[typing.Optional[str]]
+
+
 class ArtifactsDeletionStrategies(mlrun.common.types.StrEnum):
     """Artifacts deletion strategies types."""
 
@@ -15,8 +15,6 @@
 import typing
 
 import pydantic
-from nuclio.auth import AuthInfo as NuclioAuthInfo
-from nuclio.auth import AuthKinds as NuclioAuthKinds
 
 import mlrun.common.types
 
@@ -129,6 +127,10 @@ class AuthInfo(pydantic.BaseModel):
     planes: list[str] = []
 
     def to_nuclio_auth_info(self):
+        # imported here as the nuclio package loads IPython, which is only needed when working with nuclio
+        from nuclio.auth import AuthInfo as NuclioAuthInfo
+        from nuclio.auth import AuthKinds as NuclioAuthKinds
+
         if self.session != "":
             return NuclioAuthInfo(password=self.session, mode=NuclioAuthKinds.iguazio)
         return None
@@ -151,6 +151,8 @@ default_config = {
         # migration progress.
         "artifact_migration_batch_size": 200,
         "artifact_migration_state_file_path": "./db/_artifact_migration_state.json",
+        # max number of artifacts uploaded concurrently when logging multiple artifacts (e.g. project registration)
+        "upload_max_workers": 8,
         "datasets": {
             "max_preview_columns": 100,
         },
@@ -166,6 +168,8 @@ default_config = {
     "redis": {
         "url": "",
         "type": "standalone",  # deprecated.
+        # max number of commands sent to redis in a single pipeline (round-trip), 1 disables pipelining
+        "pipeline_size": 512,
     },
     "sql": {
         "url": "",
@@ -329,6 +333,21 @@ default_config = {
         "state": "online",
         "retry_api_call_on_exception": "enabled",
         "http_connection_timeout_keep_alive": 11,
+        # compression of the api responses, negotiated with the client by its accept-encoding header
+        "compression": {
+            # comma separated encodings to compress with, by order of preference (when the client accepts more than
+            # one of them). zstd is used only when the zstandard package is installed. set to "" to disable
+            "encodings": "zstd,gzip",
+            # responses smaller than this (in bytes) aren't compressed
+            "minimum_size": 1024,
+            "gzip_level": 6,
+            "zstd_level": 3,
+        },
+        "metrics": {
+            # when enabled, the api server metrics (http requests, db queries and threadpools) are served in the
+            # prometheus text format on the /api/v1/metrics endpoint, to authenticated requests only
+            "enabled": False,
+        },
         # http client used by httpdb
         "http": {
             # when True, the client will verify the server's TLS
@@ -436,6 +455,18 @@ default_config = {
             "pull_logs_default_interval": 3,  # seconds
             "pull_logs_backoff_no_logs_default_interval": 10,  # seconds
             "pull_logs_default_size_limit": 1024 * 1024,  # 1 MB
+            "follow": {
+                # enabled - watch logs over a single long-lived streaming request, in which the server pushes new
+                # logs and state transitions as they appear (falls back to polling if the server doesn't support it)
+                # disabled - poll the logs every "pull_logs_default_interval" seconds
+                "mode": "enabled",
+                # server side - interval for checking for new logs and state transitions of a followed run
+                "poll_interval": 1,  # seconds
+                # server side - interval for sending a keep-alive event when there is nothing new
+                "heartbeat_interval": 15,  # seconds
+                # server side - max duration of a single follow request, after which the client reconnects
+                "max_duration": 60 * 60,  # seconds
+            },
         },
         "authorization": {
             "mode": "none",  # one of none, opa
@@ -445,6 +476,14 @@ default_config = {
                 "permission_query_path": "",
                 "permission_filter_path": "",
                 "log_level": 0,
+                # the ttl of the cached decisions of opa, per user (and groups), action and resource. a user who was
+                # allowed a wildcard resource of a project (e.g. /projects/<name>/functions/*) is allowed any of its
+                # resources (of that type) until it expires. set to "0 seconds" to disable the cache
+                "decisions_cache_ttl": "10 seconds",
+                "decisions_cache_max_size": 100000,
+                # large lists are filtered in concurrent requests of up to this number of resources
+                "filter_request_chunk_size": 1000,
+                "max_concurrent_filter_requests": 4,
             },
         },
         "scheduling": {
@@ -550,6 +589,20 @@ default_config = {
         "default_http_sink_app": "http://nuclio-{project}-{application_name}.{namespace}.svc.cluster.local:8080",
         "parquet_batching_max_events": 10_000,
         "parquet_batching_timeout_secs": timedelta(minutes=1).total_seconds(),
+        # The monitoring stream writes the model endpoints records behind, coalescing the updates of each endpoint.
+        # The updates are written every flush_interval_secs seconds (0 to write each update immediately), or once
+        # max_pending_updates events were coalesced
+        "endpoint_updates": {
+            "flush_interval_secs": 5,
+            "max_pending_updates": 1_000,
+        },
+        # When the application results are stored in a SQL store, the monitoring writer buffers them and writes
+        # them together every flush_interval_secs seconds (0 to write each result immediately), or once max_events
+        # results were buffered
+        "writer_batching": {
+            "max_events": 100,
+            "flush_interval_secs": 1,
+        },
         # See mlrun.model_monitoring.db.stores.ObjectStoreFactory for available options
         "endpoint_store_connection": "",
         # See mlrun.model_monitoring.db.tsdb.ObjectTSDBFactory for available options
@@ -586,6 +639,14 @@ default_config = {
             "auth_secret_name": "mlrun-auth-secrets.{hashed_access_key}",
             "env_variable_prefix": "MLRUN_K8S_SECRET__",
             "global_function_env_secret_name": None,
+            # the api server reads the secrets through a cache that is kept up to date by watching the secrets of the
+            # namespace (and invalidated on its own writes). the ttl (in seconds) bounds how long a cached secret is
+            # served, in case a watch event was missed
+            "secrets_cache": {
+                "enabled": True,
+                "ttl": 300,
+                "watch_timeout": 300,
+            },
         },
     },
     "feature_store": {
@@ -599,6 +660,22 @@ default_config = {
         "default_targets": "parquet,nosql",
         "default_job_image": "mlrun/mlrun",
         "flush_interval": None,
+        # Maximum number of feature sets that are read concurrently when generating an offline feature vector
+        # (local and dask engines), set to 1 to read them one by one
+        "offline_concurrent_reads": 8,
+        # Push the entity keys and the query predicates of offline feature vectors down to the parquet reads
+        "offline_pushdown": {
+            "enabled": True,
+            # Don't push down the entity keys when the entity rows have more distinct keys than this
+            "max_entity_keys": 10_000,
+        },
+        # Store the results of offline feature vectors (local engine), reuse them until the feature sets are
+        # ingested again, and join only the newly ingested rows when possible
+        "offline_materialization": {
+            "enabled": False,
+            # Defaults to the data prefix of the parquet targets, with "materialized" as the kind
+            "path": "",
+        },
     },
     "ui": {
         "projects_prefix": "projects",  # The UI link prefix for projects
@@ -630,6 +707,12 @@ default_config = {
         # e.g. Windows client (on host) and Linux container (Jupyter, Nuclio..) need to access the same files/artifacts
         # need to map container path to host windows paths, e.g. "\data::c:\\mlrun_data" ("::" used as splitter)
         "item_to_real_path": "",
+        "download": {
+            # objects larger than the chunk size are downloaded in concurrent ranged reads (by the stores that support
+            # them), bounding the memory used by the download to chunk_size * max_concurrency
+            "chunk_size": 64 * 1024 * 1024,
+            "max_concurrency": 8,
+        },
     },
     "default_function_pod_resources": {
         "requests": {"cpu": None, "memory": None, "gpu": None},
@@ -667,6 +750,16 @@ default_config = {
     "debug": {
         "expose_internal_api_endpoints": False,
     },
+    "projects": {
+        "sync_functions": {
+            # max number of functions loaded concurrently when syncing project functions (loading a function may
+            # mean fetching it from the hub/db or compiling a code file)
+            "max_workers": 8,
+            # max number of compiled code (.py/.ipynb) functions to keep in the in-process cache, the cache is keyed
+            # by the code file contents and the function definition. 0 disables the cache
+            "compiled_functions_cache_size": 128,
+        },
+    },
     "workflows": {
         "default_workflow_runner_name": "workflow-runner-{}",
         # Default timeout seconds for retrieving workflow id after execution
@@ -741,6 +834,15 @@ default_config = {
         # maximum allowed value for count in criteria field inside AlertConfig
         "max_criteria_count": 100,
     },
+    "notifications": {
+        # async notifications are pushed from a long-lived event loop which owns a pooled http session
+        "max_concurrent_pushes": 100,
+        "max_connections": 100,
+        "max_connections_per_target": 10,
+        # maximum number of requests per second sent to the same target (host), 0 for unlimited
+        "rate_limit_per_target": 10,
+        "request_timeout": 60,
+    },
     "auth_with_client_id": {
         "enabled": False,
         "request_timeout": 5,
@@ -27,6 +27,7 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class OSSStore(DataStore):
     using_bucket = True
+    supports_ranged_get = True
 
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         super().__init__(parent, name, schema, endpoint, secrets)
@@ -127,5 +128,6 @@ class OSSStore(DataStore):
     @staticmethod
     def get_range(size, offset):
         if size:
-            return [offset, size]
+            # the range end is inclusive
+            return [offset, offset + size - 1]
         return [offset, None]
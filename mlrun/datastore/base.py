@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
+import math
 import tempfile
 import urllib.parse
 from base64 import b64encode
@@ -47,6 +49,8 @@ class FileStats:
 
 class DataStore:
     using_bucket = False
+    # whether get() reads only the requested byte range, so large objects can be downloaded in concurrent ranges
+    supports_ranged_get = False
 
     def __init__(self, parent, name, kind, endpoint="", secrets: dict = None):
         self._parent = parent
@@ -175,6 +179,17 @@ class DataStore:
         raise ValueError("data store doesnt support listdir")
 
     def download(self, key, target_path):
+        """
+        Download the object to a local file. When the store supports ranged reads, objects larger than the download
+        chunk size are fetched in concurrent byte ranges, each written at its offset in the (preallocated) file, so the
+        memory used is bounded by the chunk size times the concurrency rather than by the object size.
+        """
+        chunk_size = int(mlrun.mlconf.storage.download.chunk_size)
+        size = self._get_size(key) if self.supports_ranged_get else None
+        if size is not None and size > chunk_size:
+            self._download_ranges(key, target_path, size, chunk_size)
+            return
+
         data = self.get(key)
         mode = "wb"
         if isinstance(data, str):
@@ -183,6 +198,52 @@ class DataStore:
             fp.write(data)
             fp.close()
 
+    def _get_size(self, key) -> Optional[int]:
+        try:
+            file_stats = self.stat(key)
+        except Exception as exc:
+            logger.debug(
+                "Failed to get the object size, downloading it in a single read",
+                key=key,
+                exc=err_to_str(exc),
+            )
+            return None
+        return file_stats.size if file_stats else None
+
+    def _download_ranges(self, key, target_path, size, chunk_size):
+        with open(target_path, "wb") as fp:
+            fp.truncate(size)
+
+        def download_range(offset):
+            range_size = min(chunk_size, size - offset)
+            data = self.get(key, size=range_size, offset=offset)
+            if len(data) != range_size:
+                raise mlrun.errors.MLRunRuntimeError(
+                    f"Failed to download {key}, got {len(data)} bytes instead of {range_size} at offset {offset}"
+                )
+            with open(target_path, "r+b") as fp:
+                fp.seek(offset)
+                fp.write(data)
+
+        max_workers = min(
+            int(mlrun.mlconf.storage.download.max_concurrency),
+            math.ceil(size / chunk_size),
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(download_range, offset)
+                for offset in range(0, size, chunk_size)
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                concurrent.futures.wait(futures)
+                remove(target_path)
+                raise
+
     def upload(self, key, src_path):
         pass
 
@@ -674,7 +735,8 @@ class DataItem:
 def get_range(size, offset):
     byterange = f"bytes={offset}-"
     if size:
-        byterange += str(offset + size)
+        # the range end is inclusive
+        byterange += str(offset + size - 1)
     return byterange
 
 
@@ -160,6 +160,26 @@ class GoogleCloudStorageStore(DataStore):
             )
             self.filesystem.put_file(src_path, united_path, overwrite=True)
 
+    def download(self, key, target_path):
+        path = self._make_path(key)
+        if self.filesystem.size(path) <= self.chunk_size:
+            self.filesystem.get_file(path, target_path)
+            return
+
+        bucket = self.storage_client.bucket(self.endpoint)
+        blob = bucket.blob(key.strip("/"))
+
+        try:
+            transfer_manager.download_chunks_concurrently(
+                blob, target_path, chunk_size=self.chunk_size, max_workers=self.workers
+            )
+        except Exception as download_chunks_concurrently_exception:
+            logger.warning(
+                f"gcs: failed to concurrently download {path},"
+                f" exception: {download_chunks_concurrently_exception}. Retrying with single part download."
+            )
+            self.filesystem.get_file(path, target_path)
+
     def stat(self, key):
         path = self._make_path(key)
 
@@ -40,6 +40,8 @@ class InMemoryStore(DataStore):
 
     def get(self, key, size=None, offset=0):
         item = self._get_item(key)
+        if (size or offset) and isinstance(item, (bytes, str)):
+            item = item[offset : offset + size if size else None]
         return item
 
     def put(self, key, data, append=False):
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
 from urllib.parse import urlparse
 
 import redis
 import redis.cluster
+from storey.dtypes import RedisError
+from storey.redis_driver import RedisDriver
 
 import mlrun
 
@@ -157,14 +161,190 @@ class RedisStore(DataStore):
 
         if recursive:
             key += "*" if key.endswith("/") else "/*"
-            for k in self.redis.scan_iter(key):
-                self.redis.delete(k)
-            key = f"_spark:{key}"
-            for k in self.redis.scan_iter(key):
-                self.redis.delete(k)
+            self._delete_keys_by_pattern(key)
+            self._delete_keys_by_pattern(f"_spark:{key}")
         else:
             self.redis.delete(key)
 
+    def _delete_keys_by_pattern(self, pattern):
+        # delete in pipelines rather than a round-trip per key (every key is in its own hash slot)
+        pipeline_size = max(int(mlrun.mlconf.redis.pipeline_size), 1)
+        pipeline = self.redis.pipeline(transaction=False)
+        keys = self.redis.scan_iter(pattern, count=pipeline_size)
+        for index, key in enumerate(keys, start=1):
+            pipeline.delete(key)
+            if index % pipeline_size == 0:
+                pipeline.execute()
+        pipeline.execute()
+
     @property
     def spark_url(self):
         return ""
+
+
+class RedisPipelineDriver(RedisDriver):
+    """
+    Storey Redis driver which pipelines the commands of concurrent key writes and lookups
+
+    The storey table writes (on flush) and looks up (e.g. for the entities of an online feature service request)
+    every key in its own task, each costing a round-trip. This driver queues the commands of the keys that are
+    handled concurrently and sends them together in a (non-transactional) pipeline. On a Redis cluster, the
+    pipeline is split by the client per node, according to the hash slots of the keys.
+
+    :param redis_client:  Redis client, created from the redis_url when not provided
+    :param key_prefix:    Prefix of the keys of the tables
+    :param redis_url:     URL of the Redis server
+    :param pipeline_size: Maximum number of commands to send in a pipeline, defaults to
+                          mlrun.mlconf.redis.pipeline_size (1 disables pipelining)
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        key_prefix: str = None,
+        redis_url: str = None,
+        pipeline_size: int = None,
+    ):
+        super().__init__(
+            redis_client=redis_client, key_prefix=key_prefix, redis_url=redis_url
+        )
+        self._pipeline_size = int(
+            pipeline_size
+            if pipeline_size is not None
+            else mlrun.mlconf.redis.pipeline_size
+        )
+        self._pending_commands = []
+        self._flush_task = None
+        self._pipeline_tasks = set()
+
+    async def _execute(self, command: str, *args):
+        """Queue a command to the next pipeline, and wait for its response"""
+        if self._pipeline_size <= 1:
+            return await self.asyncify(getattr(self.redis, command))(*args)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_commands.append((command, args, future))
+        if len(self._pending_commands) >= self._pipeline_size:
+            self._send_pending_commands()
+        elif self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_pending_commands())
+        return await future
+
+    async def _flush_pending_commands(self):
+        # let the other tasks that are ready to run queue their commands first
+        await asyncio.sleep(0)
+        self._flush_task = None
+        self._send_pending_commands()
+
+    def _send_pending_commands(self):
+        if not self._pending_commands:
+            return
+        commands, self._pending_commands = self._pending_commands, []
+        task = asyncio.get_running_loop().create_task(self._send_pipeline(commands))
+        self._pipeline_tasks.add(task)
+        task.add_done_callback(self._pipeline_tasks.discard)
+
+    async def _send_pipeline(self, commands: list):
+        try:
+            responses = await self.asyncify(self._execute_pipeline)(commands)
+        except Exception as exc:
+            responses = [exc] * len(commands)
+        for (_, _, future), response in zip(commands, responses):
+            if future.done():
+                # the waiting task was cancelled
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+    def _execute_pipeline(self, commands: list) -> list:
+        pipeline = self.redis.pipeline(transaction=False)
+        for command, args, _ in commands:
+            getattr(pipeline, command)(*args)
+        return pipeline.execute(raise_on_error=False)
+
+    async def _save_key(
+        self, container, table_path, key, aggr_item, partitioned_by_key, additional_data
+    ):
+        # same as RedisDriver._save_key, with the update scripts evaluated in pipelines
+        redis_key_prefix = self._make_key(container, table_path, key)
+        static_redis_key_prefix = self._static_data_key(redis_key_prefix)
+        (
+            update_expression,
+            mtime_condition,
+            _,
+            redis_keys_involved,
+        ) = self._build_feature_store_lua_update_script(
+            redis_key_prefix, aggr_item, partitioned_by_key, additional_data
+        )
+        if not update_expression:
+            return
+        current_time = int(time.time_ns() / 1000)
+        update_mtime = f'redis.call("HSET","{static_redis_key_prefix}","{self._mtime_name}",{current_time});'
+        if mtime_condition is not None:
+            update_expression = (
+                f'if redis.call("HGET", "{static_redis_key_prefix}","{self._mtime_name}") == "{mtime_condition}" '
+                f"then\n{update_expression}{update_mtime}\nreturn 1;else return 0;end;"
+            )
+        else:
+            update_expression = f"{update_expression}{update_mtime}return 1;"
+
+        redis_keys_involved.append(static_redis_key_prefix)
+        update_ok = await self._execute(
+            "eval", update_expression, len(redis_keys_involved), *redis_keys_involved
+        )
+        if update_ok:
+            if aggr_item:
+                aggr_item.storage_specific_cache[self._mtime_name] = current_time
+            return
+
+        # the mtime condition evaluated to false, update unconditionally and fetch the latest state of the key
+        (
+            update_expression,
+            _,
+            _,
+            redis_keys_involved,
+        ) = self._build_feature_store_lua_update_script(
+            redis_key_prefix, aggr_item, False, additional_data
+        )
+        update_expression = f"{update_expression}{update_mtime}return 1;"
+        update_ok = await self._execute(
+            "eval", update_expression, len(redis_keys_involved), *redis_keys_involved
+        )
+        if update_ok and aggr_item:
+            await self._fetch_state_by_key(aggr_item, container, table_path, key)
+
+    async def _get_specific_fields(self, redis_key: str, attributes: list[str]):
+        non_aggregation_attrs = [
+            name
+            for name in attributes
+            if not name.startswith(RedisDriver.INTERFNAL_FIELD_PREFIX)
+        ]
+        try:
+            values = await self._execute("hmget", redis_key, non_aggregation_attrs)
+        except redis.ResponseError as exc:
+            raise RedisError(
+                f"Failed to get key {redis_key}. Response error was: {exc}"
+            ) from exc
+        return {
+            name: RedisDriver.convert_redis_value_to_python_obj(value)
+            for name, value in zip(non_aggregation_attrs, values)
+            if value is not None
+        }
+
+    async def redis_hscan(self, redis_key, match):
+        cursor = 0
+        values = {}
+        try:
+            while True:
+                cursor, page = await self._execute("hscan", redis_key, cursor, match)
+                values.update(page)
+                if cursor == 0:
+                    break
+        except redis.ResponseError as exc:
+            raise RedisError(
+                f"Failed to get key {redis_key}. Response error was: {exc}"
+            ) from exc
+        return values
@@ -178,6 +178,11 @@ class S3Store(DataStore):
         bucket, key = self.get_bucket_and_key(key)
         self.s3.Bucket(bucket).upload_file(src_path, key, Config=self.config)
 
+    def download(self, key, target_path):
+        bucket, key = self.get_bucket_and_key(key)
+        # objects above the multipart threshold are downloaded in concurrent ranged reads
+        self.s3.Bucket(bucket).download_file(key, target_path, Config=self.config)
+
     def get(self, key, size=None, offset=0):
         bucket, key = self.get_bucket_and_key(key)
         obj = self.s3.Object(bucket, key)
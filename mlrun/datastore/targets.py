@@ -1523,7 +1523,8 @@ class RedisNoSqlTarget(NoSqlBaseTarget):
 
     def get_table_object(self):
         from storey import Table
-        from storey.redis_driver import RedisDriver
+
+        from mlrun.datastore.redis import RedisPipelineDriver
 
         endpoint, uri = self.get_server_endpoint(
             self.get_target_path(), self.credentials_prefix
@@ -1531,7 +1532,7 @@ class RedisNoSqlTarget(NoSqlBaseTarget):
 
         return Table(
             uri,
-            RedisDriver(redis_url=endpoint, key_prefix="/"),
+            RedisPipelineDriver(redis_url=endpoint, key_prefix="/"),
             flush_interval_secs=mlrun.mlconf.feature_store.flush_interval,
         )
 
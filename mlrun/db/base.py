@@ -23,6 +23,7 @@ import mlrun.common
 import mlrun.common.formatters
 import mlrun.common.runtimes.constants
 import mlrun.common.schemas
+import mlrun.errors
 import mlrun.model_monitoring
 
 
@@ -93,6 +94,7 @@ class RunDBInterface(ABC):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        as_df: bool = False,
     ):
         pass
 
@@ -117,6 +119,54 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    def store_artifacts(
+        self,
+        artifacts: list[dict],
+        project: str = "",
+        skip_if_exists: Optional[list[bool]] = None,
+    ) -> list[Optional[str]]:
+        """
+        Store multiple artifacts. The key, tag, iteration and tree of each artifact are taken from its metadata.
+        DBs that do not support storing artifacts in bulk store them one by one.
+
+        :return: The uids of the stored artifacts (None for skipped artifacts).
+        """
+        # to avoid circular imports we import here
+        import mlrun.artifacts.base
+
+        skip_if_exists = skip_if_exists or [False] * len(artifacts)
+        uids = []
+        for artifact, skip in zip(artifacts, skip_if_exists):
+            metadata = artifact.get("metadata", {})
+            key = artifact.get("spec", {}).get("db_key") or metadata.get("key")
+            if skip:
+                try:
+                    if self.read_artifact(
+                        key,
+                        tag=metadata.get("tag"),
+                        iter=metadata.get("iter"),
+                        project=project,
+                        tree=metadata.get("tree"),
+                    ):
+                        uids.append(None)
+                        continue
+                except mlrun.errors.MLRunNotFoundError:
+                    pass
+            self.store_artifact(
+                key,
+                artifact,
+                iter=metadata.get("iter"),
+                tag=metadata.get("tag"),
+                project=project,
+                tree=metadata.get("tree"),
+            )
+            uids.append(
+                mlrun.artifacts.base.fill_artifact_object_hash(
+                    artifact, metadata.get("iter"), metadata.get("tree")
+                )
+            )
+        return uids
+
     @abstractmethod
     def read_artifact(
         self,
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
 import enum
 import http
+import json
 import re
 import time
 import traceback
@@ -25,6 +27,7 @@ from os import path, remove
 from typing import Optional, Union
 from urllib.parse import urlparse
 
+import pandas as pd
 import pydantic
 import requests
 import semver
@@ -35,6 +38,7 @@ import mlrun.common.formatters
 import mlrun.common.runtimes
 import mlrun.common.schemas
 import mlrun.common.types
+import mlrun.lists
 import mlrun.model_monitoring.model_endpoint
 import mlrun.platforms
 import mlrun.projects
@@ -69,6 +73,14 @@ _artifact_keys = [
     "viewer",
 ]
 
+# states in which the logs of a run are still watched for new contents
+_watched_log_states = [
+    mlrun.common.runtimes.constants.RunStates.pending,
+    mlrun.common.runtimes.constants.RunStates.running,
+    mlrun.common.runtimes.constants.RunStates.created,
+    mlrun.common.runtimes.constants.RunStates.aborting,
+]
+
 
 def bool2str(val):
     return "yes" if val else "no"
@@ -199,6 +211,7 @@ class HTTPRunDB(RunDBInterface):
         headers=None,
         timeout=45,
         version=None,
+        stream=False,
     ) -> requests.Response:
         """Perform a direct REST API call on the :py:mod:`mlrun` API server.
 
@@ -216,6 +229,7 @@ class HTTPRunDB(RunDBInterface):
         :param timeout: API call timeout
         :param version: API version to use, None (the default) will mean to use the default value from config,
          for un-versioned api set an empty string.
+        :param stream: Whether to stream the response body instead of downloading it immediately
 
         :returns: `requests.Response` HTTP response object
         """
@@ -231,6 +245,9 @@ class HTTPRunDB(RunDBInterface):
             if value is not None
         }
 
+        if stream:
+            kw["stream"] = True
+
         if self.user:
             kw["auth"] = (self.user, self.password)
         elif self.token_provider:
@@ -605,10 +622,21 @@ class HTTPRunDB(RunDBInterface):
             state, offset = self.watch_log(uid, project, watch=False, offset=offset)
             return state, offset
 
+        resp = self._get_log_response(uid, project, offset=offset, size=size)
+        return self._parse_log_response(resp)
+
+    def _get_log_response(
+        self, uid, project="", offset=0, size=None, follow=False
+    ) -> requests.Response:
         params = {"offset": offset, "size": size}
+        if follow:
+            params["follow"] = True
         path = self._path_of("logs", project, uid)
         error = f"get log {project}/{uid}"
-        resp = self.api_call("GET", path, error, params=params)
+        return self.api_call("GET", path, error, params=params, stream=follow)
+
+    @staticmethod
+    def _parse_log_response(resp: requests.Response) -> tuple[str, bytes]:
         if resp.headers:
             state = resp.headers.get("x-mlrun-run-state", "")
             return state.lower(), resp.content
@@ -632,6 +660,9 @@ class HTTPRunDB(RunDBInterface):
         """Retrieve logs of a running process by chunks of 1MB, and watch the progress of the execution until it
         completes. This method will print out the logs and continue to periodically poll for, and print,
         new logs as long as the state of the runtime which generates this log is either ``pending`` or ``running``.
+        When ``mlrun.mlconf.httpdb.logs.follow.mode`` is enabled (the default), the logs are followed over a single
+        streaming request in which the server pushes new logs as they appear, rather than polled. Polling is used as a
+        fallback for servers that don't support following logs.
 
         :param uid: The uid of the log object to watch.
         :param project: Project that the log belongs to.
@@ -641,7 +672,23 @@ class HTTPRunDB(RunDBInterface):
         :returns: The final state of the log being watched and the final offset.
         """
 
-        state, text = self.get_log(uid, project, offset=offset)
+        if watch and mlrun.mlconf.httpdb.logs.follow.mode == "enabled":
+            resp = self._get_log_response(
+                uid,
+                project,
+                offset=offset,
+                size=int(mlrun.mlconf.httpdb.logs.pull_logs_default_size_limit),
+                follow=True,
+            )
+            if self._is_log_follow_response(resp):
+                return self._follow_log(resp, uid, project, offset)
+
+            # the server doesn't support following logs (and ignored the follow param), handle the response as a
+            # regular log response and fall back to polling
+            state, text = self._parse_log_response(resp)
+        else:
+            state, text = self.get_log(uid, project, offset=offset)
+
         if text:
             print(text.decode(errors=mlrun.mlconf.httpdb.logs.decode.errors))
         nil_resp = 0
@@ -667,12 +714,7 @@ class HTTPRunDB(RunDBInterface):
             else:
                 nil_resp += 1
 
-            if watch and state in [
-                mlrun.common.runtimes.constants.RunStates.pending,
-                mlrun.common.runtimes.constants.RunStates.running,
-                mlrun.common.runtimes.constants.RunStates.created,
-                mlrun.common.runtimes.constants.RunStates.aborting,
-            ]:
+            if watch and state in _watched_log_states:
                 continue
             else:
                 # the whole log was retrieved
@@ -681,6 +723,68 @@ class HTTPRunDB(RunDBInterface):
 
         return state, offset
 
+    def _follow_log(self, resp: requests.Response, uid, project="", offset=0):
+        """Consume a followed logs stream - print new logs as they are pushed by the server, and reconnect from the
+        last offset if the stream ends (or breaks) while the run is still in progress"""
+        state = ""
+        printed_logs = False
+        while True:
+            try:
+                for event, data in self._iter_log_follow_events(resp):
+                    if event == "state":
+                        state = data["state"].lower()
+                    elif event == "log":
+                        text = base64.b64decode(data["content"])
+                        offset = data["offset"] + len(text)
+                        # the first log chunk is printed with a newline, the same as when polling the logs
+                        print(
+                            text.decode(errors=mlrun.mlconf.httpdb.logs.decode.errors),
+                            end="" if printed_logs else "\n",
+                        )
+                        printed_logs = True
+            except requests.RequestException as exc:
+                logger.debug(
+                    "Logs stream broke, reconnecting",
+                    uid=uid,
+                    project=project,
+                    offset=offset,
+                    exc=err_to_str(exc),
+                )
+            finally:
+                resp.close()
+
+            # an unknown state (the stream ended before the state was sent) keeps following
+            if state and state not in _watched_log_states:
+                return state, offset
+
+            # don't hot-loop on a server that keeps closing the stream while the run is in progress
+            time.sleep(int(mlrun.mlconf.httpdb.logs.pull_logs_default_interval))
+            resp = self._get_log_response(uid, project, offset=offset, follow=True)
+
+    @staticmethod
+    def _is_log_follow_response(resp: requests.Response) -> bool:
+        return resp.headers.get("content-type", "").startswith("text/event-stream")
+
+    @staticmethod
+    def _iter_log_follow_events(resp: requests.Response):
+        event, data = None, []
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line:
+                # an empty line dispatches the event
+                if event:
+                    yield event, json.loads("\n".join(data))
+                event, data = None, []
+            elif line.startswith(":"):
+                # comment (keep-alive)
+                continue
+            else:
+                field, _, value = line.partition(":")
+                value = value.removeprefix(" ")
+                if field == "event":
+                    event = value
+                elif field == "data":
+                    data.append(value)
+
     def store_run(self, struct, uid, project="", iter=0):
         """Store run details in the DB. This method is usually called from within other :py:mod:`mlrun` flows
         and not called directly by the user."""
@@ -791,7 +895,8 @@ class HTTPRunDB(RunDBInterface):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
-    ) -> RunList:
+        as_df: bool = False,
+    ) -> Union[RunList, pd.DataFrame]:
         """
         Retrieve a list of runs, filtered by various options.
         If no filter is provided, will return runs from the last week.
@@ -836,6 +941,8 @@ class HTTPRunDB(RunDBInterface):
         :param max_partitions: Maximal number of partitions to include in the result. Default is `0` which means no
             limit.
         :param with_notifications: Return runs with notifications, and join them to the response. Default is `False`.
+        :param as_df: Return the runs as a dataframe (like ``RunList.to_df()``). The server sends only the dataframe
+            columns, in a columnar (arrow) format, which is much faster for listing many runs. Default is `False`.
         """
 
         project = project or config.default_project
@@ -910,6 +1017,22 @@ class HTTPRunDB(RunDBInterface):
             )
         error = "list runs"
         _path = self._path_of("runs", project)
+        if as_df:
+            # all the runs are listed in a single (not paginated) response
+            response = self.api_call(
+                "GET",
+                _path,
+                error,
+                params=params,
+                headers={"Accept": mlrun.lists.arrow_stream_media_type},
+            )
+            if response.headers.get("content-type", "").startswith(
+                mlrun.lists.arrow_stream_media_type
+            ):
+                return mlrun.lists.runs_df_from_arrow_stream(response.content)
+            # servers that don't support the arrow stream respond with json
+            return RunList(response.json().get("runs", [])).to_df()
+
         responses = self.paginated_api_call("GET", _path, error, params=params)
         return RunList(self.process_paginated_responses(responses, "runs"))
 
@@ -1003,6 +1126,39 @@ class HTTPRunDB(RunDBInterface):
             "PUT", endpoint_path, error, body=body, params=params, version="v2"
         )
 
+    def store_artifacts(
+        self,
+        artifacts: list[dict],
+        project: str = "",
+        skip_if_exists: Optional[list[bool]] = None,
+    ) -> list[Optional[str]]:
+        """Store multiple artifacts in the DB with a single request (and a single DB transaction).
+
+        :param artifacts: The artifacts (as dicts) to store. The key, tag, iteration and tree of each artifact are
+            taken from its metadata (and its db key from the spec).
+        :param project: Project that the artifacts belong to.
+        :param skip_if_exists: Per artifact flag - if set, the artifact is stored only if an artifact with the same
+            key, tag, iteration and tree does not exist yet.
+        :return: The uids of the stored artifacts, aligned with the given artifacts (None for skipped artifacts).
+        """
+        project = project or mlrun.mlconf.default_project
+        skip_if_exists = skip_if_exists or [False] * len(artifacts)
+        body = {
+            "artifacts": [
+                {"artifact": artifact, "skip_if_exists": skip}
+                for artifact, skip in zip(artifacts, skip_if_exists)
+            ]
+        }
+        error = f"store artifacts {project}"
+        response = self.api_call(
+            "POST",
+            f"projects/{project}/artifacts/bulk-store",
+            error,
+            body=dict_to_json(body),
+            version="v2",
+        )
+        return response.json()["uids"]
+
     def read_artifact(
         self,
         key,
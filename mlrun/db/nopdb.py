@@ -124,7 +124,10 @@ class NopDB(RunDBInterface):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        as_df: bool = False,
     ):
+        if as_df:
+            return mlrun.lists.RunList().to_df()
         return mlrun.lists.RunList()
 
     def del_run(self, uid, project="", iter=0):
@@ -13,18 +13,122 @@
 # limitations under the License.
 #
 import abc
+import ast
+import collections
+import concurrent.futures
+import io
+import math
+import tokenize
 import typing
 from datetime import datetime
 
 import pandas as pd
 
 import mlrun
-from mlrun.datastore.targets import CSVTarget, ParquetTarget
+from mlrun.data_types import ValueType
+from mlrun.datastore.targets import (
+    CSVTarget,
+    ParquetTarget,
+    TargetTypes,
+    get_offline_target,
+)
 from mlrun.feature_store.feature_set import FeatureSet
 from mlrun.feature_store.feature_vector import JoinGraph
 
 from ...utils import logger, str_to_timestamp
 from ..feature_vector import OfflineVectorResponse
+from .materialization import VectorMaterialization
+
+# Query comparison operators that can be pushed down to the offline reads, none of them is true for a missing value
+_pushdown_operators = {
+    ast.Eq: "==",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+}
+_reversed_pushdown_operators = {"==": "==", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+
+def _query_to_filters(query: str) -> list[tuple]:
+    """
+    Extract the `<column> <operator> <literal>` conjuncts of a DataFrame query as (column, operator, value) filter
+    tuples. Other parts of the query (disjunctions, negations, expressions, etc.) are ignored.
+    """
+    try:
+        # like pandas, treat `&`, `|` and `~` as the boolean operators
+        boolean_operators = {"&": "and", "|": "or", "~": "not"}
+        tokens = [
+            (tokenize.NAME, boolean_operators[token.string])
+            if token.type == tokenize.OP and token.string in boolean_operators
+            else (token.type, token.string)
+            for token in tokenize.generate_tokens(io.StringIO(query).readline)
+        ]
+        expression = ast.parse(tokenize.untokenize(tokens).strip(), mode="eval").body
+    except (SyntaxError, ValueError, tokenize.TokenError):
+        return []
+
+    filters = []
+    nodes = [expression]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+            nodes.extend(node.values)
+        elif isinstance(node, ast.Compare):
+            operands = [node.left] + node.comparators
+            for left, operator, right in zip(operands, node.ops, operands[1:]):
+                filter_tuple = _comparison_to_filter(left, operator, right)
+                if filter_tuple:
+                    filters.append(filter_tuple)
+    return filters
+
+
+def _comparison_to_filter(
+    left: ast.expr, operator: ast.cmpop, right: ast.expr
+) -> typing.Optional[tuple]:
+    operator = _pushdown_operators.get(type(operator))
+    if operator is None:
+        return None
+    if not isinstance(left, ast.Name):
+        if operator == "in" or not isinstance(right, ast.Name):
+            return None
+        left, right, operator = right, left, _reversed_pushdown_operators[operator]
+    try:
+        value = ast.literal_eval(right)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+    if isinstance(value, (list, tuple, set)):
+        # `column == [a, b]` is a membership test in DataFrame queries
+        if operator not in ["==", "in"] or not value:
+            return None
+        operator, value = "in", list(value)
+    elif operator == "in":
+        return None
+    values = value if operator == "in" else [value]
+    if any(
+        not isinstance(item, (bool, int, float, str))
+        or (isinstance(item, float) and math.isnan(item))
+        for item in values
+    ):
+        return None
+    return left.id, operator, value
+
+
+def _value_type_matches(value_type, values: list) -> bool:
+    """Whether the values can be compared with a column of the given feature/entity value type on read"""
+    value_type = str(getattr(value_type, "value", value_type) or "")
+    if value_type == ValueType.STRING:
+        return all(isinstance(value, str) for value in values)
+    if value_type == ValueType.BOOL:
+        return all(isinstance(value, bool) for value in values)
+    if value_type.startswith(("int", "uint", "float", "bfloat")):
+        return all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in values
+        )
+    return False
 
 
 class BaseMerger(abc.ABC):
@@ -36,6 +140,10 @@ class BaseMerger(abc.ABC):
     # In order to be an offline merger, the merger should implement
     # `_order_by`, `_filter`, `_drop_columns_from_result`, `_rename_columns_and_select`, `_get_engine_df` functions.
     support_offline = False
+    # Whether the feature sets data frames (`_get_engine_df`) can be loaded concurrently
+    support_concurrent_loading = False
+    # Whether the vector result can be materialized (see feature_store.offline_materialization)
+    support_materialization = False
     engine = None
 
     def __init__(self, vector, **engine_args):
@@ -53,6 +161,12 @@ class BaseMerger(abc.ABC):
         self._origin_alias = dict()
         self._entity_rows_node_name = "__mlrun__$entity_rows$"
 
+        # when set, `_write_to_offline_target` only keeps the result timestamp key
+        self._defer_target_write = False
+        self._result_timestamp_key = None
+        # when set, only the rows of the first feature set after this time are joined
+        self._materialization_watermark = None
+
     def _append_drop_column(self, key):
         if key and key not in self._drop_columns:
             self._drop_columns.append(key)
@@ -121,13 +235,14 @@ class BaseMerger(abc.ABC):
 
         start_time = str_to_timestamp(start_time)
         end_time = str_to_timestamp(end_time)
+        requested_end_time = end_time
         if start_time and not end_time:
             # if end_time is not specified set it to now()
             end_time = pd.Timestamp.now()
 
-        return self._generate_offline_vector(
-            entity_rows,
-            entity_timestamp_column,
+        generate_args = dict(
+            entity_rows=entity_rows,
+            entity_timestamp_column=entity_timestamp_column,
             feature_set_objects=feature_set_objects,
             feature_set_fields=feature_set_fields,
             start_time=start_time,
@@ -137,8 +252,82 @@ class BaseMerger(abc.ABC):
             order_by=order_by,
             additional_filters=additional_filters,
         )
+        if (
+            self.support_materialization
+            and mlrun.mlconf.feature_store.offline_materialization.enabled
+        ):
+            materialization = VectorMaterialization(
+                self.vector,
+                feature_set_objects,
+                engine=self.engine,
+                left_feature_set_name=self._get_graph(
+                    feature_set_objects, feature_set_fields
+                )
+                .steps[0]
+                .right_feature_set_name,
+                entity_rows=entity_rows,
+                entity_timestamp_column=entity_timestamp_column,
+                drop_columns=self._drop_columns,
+                drop_indexes=self._drop_indexes,
+                start_time=start_time,
+                end_time=requested_end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                order_by=order_by,
+                additional_filters=additional_filters,
+            )
+            return self._generate_materialized_vector(materialization, generate_args)
+        return self._generate_offline_vector(**generate_args)
+
+    def _generate_materialized_vector(
+        self, materialization: VectorMaterialization, generate_args: dict
+    ):
+        materialization.load_state()
+        ingestion_state = materialization.get_ingestion_state()
+        if materialization.is_valid(ingestion_state):
+            logger.info(
+                "Reusing the materialized feature vector", path=materialization.path
+            )
+            self._result_df = materialization.load_result()
+            timestamp_key = materialization.timestamp_key
+        else:
+            watermark = materialization.get_append_watermark(ingestion_state)
+            target = self._target
+            self._target = None
+            self._defer_target_write = True
+            self._materialization_watermark = watermark
+            try:
+                self._generate_offline_vector(**generate_args)
+            finally:
+                self._target = target
+                self._defer_target_write = False
+                self._materialization_watermark = None
+            timestamp_key = self._result_timestamp_key
+            if watermark:
+                logger.info(
+                    "Appending the rows after the watermark to the materialized feature vector",
+                    path=materialization.path,
+                    watermark=watermark,
+                    rows=len(self._result_df),
+                )
+                self._result_df = materialization.append(
+                    self._result_df, ingestion_state, timestamp_key
+                )
+            else:
+                logger.info(
+                    "Materializing the feature vector", path=materialization.path
+                )
+                self._result_df = materialization.write(
+                    self._result_df, ingestion_state, timestamp_key
+                )
+        self._write_to_offline_target(timestamp_key=timestamp_key)
+        return OfflineVectorResponse(self)
 
     def _write_to_offline_target(self, timestamp_key=None):
+        if self._defer_target_write:
+            # the result is written by the caller once it's complete
+            self._result_timestamp_key = timestamp_key
+            return
         save_vector = False
         if not self._drop_indexes and timestamp_key not in self._drop_columns:
             self.vector.status.timestamp_key = timestamp_key
@@ -150,9 +339,7 @@ class BaseMerger(abc.ABC):
                     "target path was not specified"
                 )
             self._target.set_resource(self.vector)
-            size = self._target.write_dataframe(
-                self._result_df, timestamp_key=self.vector.status.timestamp_key
-            )
+            size = self._write_result_to_target()
             if is_persistent_vector:
                 target_status = self._target.update_resource_status("ready", size=size)
                 logger.info(f"wrote target: {target_status}")
@@ -160,6 +347,11 @@ class BaseMerger(abc.ABC):
         if save_vector:
             self.vector.save()
 
+    def _write_result_to_target(self):
+        return self._target.write_dataframe(
+            self._result_df, timestamp_key=self.vector.status.timestamp_key
+        )
+
     def _set_indexes(self, df):
         if self._index_columns and not self._drop_indexes:
             if df.index is None or df.index.name is None:
@@ -208,6 +400,14 @@ class BaseMerger(abc.ABC):
         join_graph = self._get_graph(
             feature_set_objects, feature_set_fields, entity_rows_keys
         )
+        pushdown_filters = self._plan_pushdown_filters(
+            join_graph,
+            feature_set_objects,
+            feature_set_fields,
+            entity_rows if entity_rows_keys else None,
+            entity_timestamp_column,
+            query,
+        )
         if entity_rows_keys:
             entity_rows = self._convert_entity_rows_to_engine_df(entity_rows)
             dfs.append(entity_rows)
@@ -216,6 +416,8 @@ class BaseMerger(abc.ABC):
             join_types.append(None)
 
         timestamp_filtered = False
+        # the arguments of each feature set read, which are all known before reading any of them
+        feature_set_reads = []
         for step in join_graph.steps:
             name = step.right_feature_set_name
             feature_set = feature_set_objects[name]
@@ -254,17 +456,49 @@ class BaseMerger(abc.ABC):
                 self._append_drop_column(time_column)
             if (start_time or end_time) and time_column:
                 timestamp_filtered = True
+            read_start_time = start_time if time_column else None
+            if self._materialization_watermark and not feature_set_reads:
+                read_start_time = pd.Timestamp(self._materialization_watermark)
+
+            feature_set_reads.append(
+                (
+                    step,
+                    feature_set,
+                    columns,
+                    column_names,
+                    saved_columns_for_relation,
+                    (
+                        feature_set,
+                        name,
+                        list(column_names),
+                        read_start_time,
+                        end_time if time_column else None,
+                        time_column,
+                        additional_filters,
+                        pushdown_filters.get(name),
+                    ),
+                )
+            )
 
-            df = self._get_engine_df(
-                feature_set,
-                name,
-                column_names,
-                start_time if time_column else None,
-                end_time if time_column else None,
-                time_column,
-                additional_filters,
+        # None of the feature sets was timestamp filtered as required
+        if not timestamp_filtered and (start_time or end_time):
+            raise mlrun.errors.MLRunRuntimeError(
+                "start_time and end_time can only be provided in conjunction with "
+                "a timestamp column, or when the at least one feature_set has a timestamp key"
             )
 
+        feature_set_dfs = self._load_feature_set_dfs(
+            [read_args for *_, read_args in feature_set_reads]
+        )
+        for df, (
+            step,
+            feature_set,
+            columns,
+            column_names,
+            saved_columns_for_relation,
+            _,
+        ) in zip(feature_set_dfs, feature_set_reads):
+            name = step.right_feature_set_name
             fs_entities_and_timestamp = list(feature_set.spec.entities.keys())
             column_names += fs_entities_and_timestamp
             saved_columns_for_relation += fs_entities_and_timestamp
@@ -306,13 +540,6 @@ class BaseMerger(abc.ABC):
                     new_columns.append((column, alias))
             self._update_alias(dictionary={name: alias for name, alias in new_columns})
 
-        # None of the feature sets was timestamp filtered as required
-        if not timestamp_filtered and (start_time or end_time):
-            raise mlrun.errors.MLRunRuntimeError(
-                "start_time and end_time can only be provided in conjunction with "
-                "a timestamp column, or when the at least one feature_set has a timestamp key"
-            )
-
         # join the feature data frames
         result_timestamp = self.merge(
             entity_timestamp_column=entity_timestamp_column,
@@ -367,6 +594,248 @@ class BaseMerger(abc.ABC):
         self._write_to_offline_target(timestamp_key=result_timestamp)
         return OfflineVectorResponse(self)
 
+    def _load_feature_set_dfs(self, feature_set_reads: list[tuple]):
+        """
+        Load the feature set data frames (`_get_feature_set_df` arguments per feature set), yielding them in order.
+        Engines that support it load the data frames concurrently - the reads of the following feature sets are
+        started ahead while the current one is processed, and the number of reads that are started ahead is bounded,
+        so that no more than that number of loaded data frames are pending on top of the processed ones.
+        """
+        max_workers = min(
+            int(mlrun.mlconf.feature_store.offline_concurrent_reads or 1),
+            len(feature_set_reads),
+        )
+        if not self.support_concurrent_loading or max_workers <= 1:
+            for read_args in feature_set_reads:
+                yield self._get_feature_set_df(*read_args)
+            return
+
+        logger.debug(
+            "Loading the feature sets concurrently",
+            feature_sets=len(feature_set_reads),
+            max_workers=max_workers,
+        )
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mlrun-feature-set-reader"
+        )
+        try:
+            pending_reads = collections.deque(
+                executor.submit(self._get_feature_set_df, *read_args)
+                for read_args in feature_set_reads[:max_workers]
+            )
+            next_read_index = max_workers
+            while pending_reads:
+                df = pending_reads.popleft().result()
+                if next_read_index < len(feature_set_reads):
+                    pending_reads.append(
+                        executor.submit(
+                            self._get_feature_set_df,
+                            *feature_set_reads[next_read_index],
+                        )
+                    )
+                    next_read_index += 1
+                yield df
+                del df
+        finally:
+            # don't wait for the reads that are no longer needed (e.g. after a failed read)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_feature_set_df(
+        self,
+        feature_set,
+        feature_set_name,
+        column_names,
+        start_time,
+        end_time,
+        time_column,
+        additional_filters,
+        pushdown_filters,
+    ):
+        if not pushdown_filters:
+            return self._get_engine_df(
+                feature_set,
+                feature_set_name,
+                column_names,
+                start_time,
+                end_time,
+                time_column,
+                additional_filters,
+            )
+
+        logger.debug(
+            "Pushing down filters to the feature set read",
+            feature_set=feature_set_name,
+            filters=[
+                (column, operator, value if operator != "in" else f"<{len(value)}>")
+                for column, operator, value in pushdown_filters
+            ],
+        )
+        try:
+            return self._get_engine_df(
+                feature_set,
+                feature_set_name,
+                column_names,
+                start_time,
+                end_time,
+                time_column,
+                list(additional_filters or []) + pushdown_filters,
+            )
+        except Exception as exc:
+            # the filters are only an optimization, e.g. the stored column type may not match the declared one
+            logger.warning(
+                "Failed to read the feature set with the pushed down filters, reading it without them",
+                feature_set=feature_set_name,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            return self._get_engine_df(
+                feature_set,
+                feature_set_name,
+                column_names,
+                start_time,
+                end_time,
+                time_column,
+                additional_filters,
+            )
+
+    def _plan_pushdown_filters(
+        self,
+        join_graph,
+        feature_set_objects,
+        feature_set_fields,
+        entity_rows,
+        entity_timestamp_column,
+        query,
+    ) -> dict[str, list[tuple]]:
+        """
+        Plan the filters that are pushed down to the offline (parquet) reads of the feature sets, so that rows that
+        can't be a part of the result are not read at all. The filters only narrow down the reads, the joins and the
+        query are applied to the read data as usual:
+
+        * The entity keys of the entity rows, for feature sets which are joined on them as long as the result
+          only holds rows of the entity rows (inner and left joins).
+        * The query conjuncts comparing a feature to a literal. These are never true for a missing value, so the
+          rows filtered out on read could only have produced result rows that the query drops. Feature sets which
+          are the right side of an as-of join are excluded, as filtering them changes which row is the latest.
+
+        :return: the filters to push down to each feature set (by name)
+        """
+        pushdown_config = mlrun.mlconf.feature_store.offline_pushdown
+        if not pushdown_config.enabled:
+            return {}
+
+        query_filters = self._plan_query_filters(
+            query, feature_set_objects, feature_set_fields, entity_rows
+        )
+        filters = collections.defaultdict(list)
+        # follow the join selection of `merge`
+        join_type = self._join_type
+        timestamp_column = entity_timestamp_column
+        entity_rows_preserved = entity_rows is not None
+        for i, step in enumerate(join_graph.steps):
+            name = step.right_feature_set_name
+            feature_set = feature_set_objects[name]
+            if entity_rows is None and i == 0:
+                # the first feature set is the left side of all the joins
+                timestamp_column = timestamp_column or feature_set.spec.timestamp_key
+                filters[name].extend(query_filters.get(name, []))
+                continue
+
+            if step.join_type != self._default_join_type:
+                join_type = step.join_type
+                asof_join = step.asof_join
+            else:
+                asof_join = bool(feature_set.spec.timestamp_key and timestamp_column)
+            timestamp_column = timestamp_column or feature_set.spec.timestamp_key
+
+            entity_rows_preserved = entity_rows_preserved and join_type in [
+                "inner",
+                "left",
+            ]
+            if (
+                entity_rows_preserved
+                and step.left_keys
+                and step.left_keys == step.right_keys
+                and all(key in entity_rows.columns for key in step.left_keys)
+            ):
+                filters[name].extend(
+                    self._plan_entity_keys_filters(
+                        feature_set,
+                        step.right_keys,
+                        entity_rows,
+                        pushdown_config.max_entity_keys,
+                    )
+                )
+            if not asof_join:
+                filters[name].extend(query_filters.get(name, []))
+
+        return {
+            name: feature_set_filters
+            for name, feature_set_filters in filters.items()
+            if feature_set_filters
+            and self._supports_filters_pushdown(feature_set_objects[name])
+        }
+
+    @staticmethod
+    def _plan_query_filters(
+        query, feature_set_objects, feature_set_fields, entity_rows
+    ) -> dict[str, list[tuple]]:
+        if not query:
+            return {}
+
+        # the result column name of each feature (set to None when it's ambiguous)
+        result_columns = {}
+        for name, fields in feature_set_fields.items():
+            for feature_name, alias in fields:
+                column = alias or feature_name
+                result_columns[column] = (
+                    None if column in result_columns else (name, feature_name)
+                )
+        if entity_rows is not None:
+            for column in entity_rows.columns:
+                result_columns[column] = None
+
+        filters = collections.defaultdict(list)
+        for column, operator, value in _query_to_filters(query):
+            if not result_columns.get(column):
+                continue
+            name, feature_name = result_columns[column]
+            features = feature_set_objects[name].spec.features
+            values = value if operator == "in" else [value]
+            if feature_name in features.keys() and _value_type_matches(
+                features[feature_name].value_type, values
+            ):
+                filters[name].append((feature_name, operator, value))
+        return filters
+
+    @staticmethod
+    def _plan_entity_keys_filters(
+        feature_set, keys, entity_rows, max_entity_keys
+    ) -> list[tuple]:
+        if not isinstance(entity_rows, pd.DataFrame):
+            return []
+
+        filters = []
+        for key in keys:
+            # missing keys are matched by the joins, and can't be filtered on read
+            if entity_rows[key].isna().any():
+                continue
+            values = entity_rows[key].unique().tolist()
+            if len(values) > max_entity_keys or not _value_type_matches(
+                feature_set.spec.entities[key].value_type, values
+            ):
+                continue
+            filters.append((key, "in", values))
+        return filters
+
+    @staticmethod
+    def _supports_filters_pushdown(feature_set) -> bool:
+        # other offline formats don't support filters on read, and warn when given any
+        if feature_set.spec.passthrough:
+            source = feature_set.spec.source
+            return source is not None and source.kind == TargetTypes.parquet
+        target = get_offline_target(feature_set)
+        return target is not None and target.kind == TargetTypes.parquet
+
     def init_online_vector_service(
         self, entity_keys, fixed_window_type, update_stats=False
     ):
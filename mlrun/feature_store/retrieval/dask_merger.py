@@ -22,6 +22,7 @@ from .base import BaseMerger
 class DaskFeatureMerger(BaseMerger):
     engine = "dask"
     support_offline = True
+    support_concurrent_loading = True
 
     def __init__(self, vector, **engine_args):
         super().__init__(vector, **engine_args)
@@ -15,16 +15,49 @@
 import re
 
 import pandas as pd
+import pyarrow
 
+import mlrun
+import mlrun.errors
+from mlrun.datastore.targets import TargetTypes
+from mlrun.utils import logger
+from mlrun.utils.helpers import is_parquet_file
+
+from ..feature_vector import OfflineVectorResponse
 from .base import BaseMerger
 
 
 class LocalFeatureMerger(BaseMerger):
+    """
+    Feature vector merger of the local (pandas) engine.
+
+    Supported engine args:
+
+    * chunksize - join the entity rows in chunks of this number of rows (ordered by their timestamp), writing
+      each chunk of the vector to the target as it's ready. The as-of joined feature sets are read one time range
+      at a time, along with the latest row of each entity from the previous ranges, so the memory use depends on
+      the chunk size and on the number of entities rather than on the size of the data. Applies when the
+      vector is written to a non partitioned parquet directory target (`partitioned=False`), with entity rows
+      that have a timestamp column, and without a join graph, order_by or a time range filter. Otherwise, the
+      vector is generated in memory.
+    """
+
     engine = "local"
     support_offline = True
+    support_concurrent_loading = True
+    support_materialization = True
 
     def __init__(self, vector, **engine_args):
         super().__init__(vector, **engine_args)
+        self._chunksize = engine_args.get("chunksize")
+
+        # the state of the chunked join, while the chunks are processed
+        self._chunk_time_range = None
+        self._chunks_entity_rows = None
+        self._chunks_pushdown_filters = None
+        self._chunks_carry = {}
+        self._chunks_static_dfs = {}
+        self._chunks_target_size = None
 
     def _asof_join(
         self,
@@ -106,6 +139,186 @@ class LocalFeatureMerger(BaseMerger):
     def _create_engine_env(self):
         pass
 
+    def _generate_offline_vector(
+        self,
+        entity_rows,
+        entity_timestamp_column,
+        feature_set_objects,
+        feature_set_fields,
+        start_time=None,
+        end_time=None,
+        timestamp_for_filtering=None,
+        query=None,
+        order_by=None,
+        additional_filters=None,
+    ):
+        if isinstance(entity_rows, pd.DataFrame) and entity_rows.index.names[0]:
+            entity_rows = entity_rows.reset_index()
+        if not self._can_join_in_chunks(
+            entity_rows,
+            entity_timestamp_column,
+            feature_set_objects,
+            start_time or end_time or timestamp_for_filtering or order_by,
+        ):
+            return super()._generate_offline_vector(
+                entity_rows,
+                entity_timestamp_column,
+                feature_set_objects,
+                feature_set_fields,
+                start_time=start_time,
+                end_time=end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                order_by=order_by,
+                additional_filters=additional_filters,
+            )
+
+        entity_rows = entity_rows.assign(
+            **{
+                entity_timestamp_column: pd.to_datetime(
+                    entity_rows[entity_timestamp_column]
+                )
+            }
+        ).sort_values(by=entity_timestamp_column, ignore_index=True)
+        target = self._target
+        target.set_resource(self.vector)
+        logger.info(
+            "Joining the entity rows in chunks",
+            entity_rows=len(entity_rows),
+            chunksize=self._chunksize,
+            target=target.get_target_path(),
+        )
+
+        # the chunks are written here rather than by the vector generation of each chunk
+        self._target = None
+        self._defer_target_write = True
+        self._chunks_entity_rows = entity_rows
+        chunks_schemas = []
+        target_size = 0
+        lower_time = None
+        try:
+            for chunk_id, chunk_start in enumerate(
+                range(0, len(entity_rows), self._chunksize), start=1
+            ):
+                chunk = entity_rows.iloc[chunk_start : chunk_start + self._chunksize]
+                upper_time = chunk[entity_timestamp_column].iloc[-1]
+                self._chunk_time_range = (lower_time, upper_time)
+                super()._generate_offline_vector(
+                    chunk.reset_index(drop=True),
+                    entity_timestamp_column,
+                    feature_set_objects,
+                    feature_set_fields,
+                    query=query,
+                    additional_filters=additional_filters,
+                )
+                target_size += (
+                    target.write_dataframe(
+                        self._result_df,
+                        timestamp_key=self._result_timestamp_key,
+                        chunk_id=chunk_id,
+                    )
+                    or 0
+                )
+                chunks_schemas.append(
+                    pyarrow.Schema.from_pandas(self._result_df, preserve_index=False)
+                )
+                self._result_df = None
+                lower_time = upper_time
+        finally:
+            self._target = target
+            self._defer_target_write = False
+            self._chunk_time_range = None
+            self._chunks_entity_rows = None
+            self._chunks_pushdown_filters = None
+            self._chunks_carry = {}
+            self._chunks_static_dfs = {}
+
+        self._unify_chunks_schema(target, chunks_schemas)
+        self._chunks_target_size = target_size
+        self._write_to_offline_target(timestamp_key=self._result_timestamp_key)
+        return OfflineVectorResponse(self)
+
+    def _can_join_in_chunks(
+        self,
+        entity_rows,
+        entity_timestamp_column,
+        feature_set_objects,
+        has_unsupported_args,
+    ) -> bool:
+        if not self._chunksize:
+            return False
+
+        target = self._target
+        entity_columns = (
+            list(entity_rows.columns) if isinstance(entity_rows, pd.DataFrame) else []
+        )
+        reason = None
+        if not entity_timestamp_column or entity_timestamp_column not in entity_columns:
+            reason = "entity rows with a timestamp column are required"
+        elif len(entity_rows) <= self._chunksize:
+            reason = "the entity rows fit in a single chunk"
+        elif has_unsupported_args or self.vector.spec.join_graph:
+            reason = "time range filters, order_by and join graphs are not supported"
+        elif not all(
+            feature_set.is_connectable_to_df(entity_columns)
+            for feature_set in feature_set_objects.values()
+        ) or not any(
+            feature_set.spec.timestamp_key
+            for feature_set in feature_set_objects.values()
+        ):
+            reason = "all feature sets must be joined to the entity rows, with at least one as-of join"
+        elif (
+            target is None
+            or target.kind != TargetTypes.parquet
+            or not (target.path or self.vector.metadata.name)
+            or target.partitioned
+            or target.time_partitioning_granularity
+        ):
+            reason = "a non partitioned parquet target is required"
+        else:
+            target.set_resource(self.vector)
+            if is_parquet_file(target.get_target_path()):
+                reason = "the target must be a directory"
+        if reason:
+            logger.info(
+                "Can't join the entity rows in chunks, generating the vector in memory",
+                reason=reason,
+            )
+            return False
+        return True
+
+    def _plan_pushdown_filters(
+        self,
+        join_graph,
+        feature_set_objects,
+        feature_set_fields,
+        entity_rows,
+        entity_timestamp_column,
+        query,
+    ):
+        if self._chunk_time_range is None:
+            return super()._plan_pushdown_filters(
+                join_graph,
+                feature_set_objects,
+                feature_set_fields,
+                entity_rows,
+                entity_timestamp_column,
+                query,
+            )
+
+        # plan by the entity keys of all the chunks, as the latest rows read for a chunk are carried to the
+        # following ones
+        if self._chunks_pushdown_filters is None:
+            self._chunks_pushdown_filters = super()._plan_pushdown_filters(
+                join_graph,
+                feature_set_objects,
+                feature_set_fields,
+                self._chunks_entity_rows,
+                entity_timestamp_column,
+                query,
+            )
+        return self._chunks_pushdown_filters
+
     def _get_engine_df(
         self,
         feature_set,
@@ -115,6 +328,53 @@ class LocalFeatureMerger(BaseMerger):
         end_time=None,
         time_column=None,
         additional_filters=None,
+    ):
+        if self._chunk_time_range is None:
+            return self._read_feature_set_df(
+                feature_set,
+                column_names,
+                start_time,
+                end_time,
+                time_column,
+                additional_filters,
+            )
+
+        timestamp_key = feature_set.spec.timestamp_key
+        if not timestamp_key:
+            # feature sets that aren't as-of joined are read once, and joined to all the chunks
+            if feature_set_name not in self._chunks_static_dfs:
+                self._chunks_static_dfs[feature_set_name] = self._read_feature_set_df(
+                    feature_set, column_names, additional_filters=additional_filters
+                )
+            return self._chunks_static_dfs[feature_set_name].copy(deep=False)
+
+        lower_time, upper_time = self._chunk_time_range
+        df = self._read_feature_set_df(
+            feature_set,
+            column_names,
+            lower_time,
+            upper_time,
+            timestamp_key,
+            additional_filters,
+        )
+        carry = self._chunks_carry.get(feature_set_name)
+        if carry is not None:
+            df = pd.concat([carry, df], ignore_index=True)
+        df.sort_values(by=timestamp_key, kind="stable", ignore_index=True, inplace=True)
+        # the latest row of each entity so far, which the as-of join of the following chunks may pick
+        self._chunks_carry[feature_set_name] = df.groupby(
+            list(feature_set.spec.entities.keys()), dropna=False, sort=False
+        ).tail(1)
+        return df
+
+    @staticmethod
+    def _read_feature_set_df(
+        feature_set,
+        column_names=None,
+        start_time=None,
+        end_time=None,
+        time_column=None,
+        additional_filters=None,
     ):
         df = feature_set.to_dataframe(
             columns=column_names,
@@ -127,6 +387,77 @@ class LocalFeatureMerger(BaseMerger):
             df.reset_index(inplace=True)
         return df
 
+    def _write_result_to_target(self):
+        if self._chunks_target_size is None:
+            return super()._write_result_to_target()
+        return self._chunks_target_size
+
+    @staticmethod
+    def _unify_chunks_schema(target, chunks_schemas: list[pyarrow.Schema]):
+        """
+        The column types of the chunks may differ, e.g. an integer feature is a float in chunks where some
+        entities have no value for it. Rewrite the chunks that don't match the unified types of all the chunks.
+        """
+        fields = []
+        for field in chunks_schemas[0]:
+            types = [
+                schema.field(field.name).type
+                for schema in chunks_schemas
+                if not pyarrow.types.is_null(schema.field(field.name).type)
+            ]
+            if not types or all(type_ == types[0] for type_ in types):
+                field_type = types[0] if types else field.type
+            elif all(
+                pyarrow.types.is_integer(type_) or pyarrow.types.is_floating(type_)
+                for type_ in types
+            ):
+                field_type = pyarrow.float64()
+            else:
+                raise mlrun.errors.MLRunRuntimeError(
+                    f"Column {field.name} has incompatible types in the vector chunks: {set(map(str, types))}"
+                )
+            fields.append(pyarrow.field(field.name, field_type))
+        schema = pyarrow.schema(fields)
+
+        target_path = target.get_target_path()
+        for chunk_id, chunk_schema in enumerate(chunks_schemas, start=1):
+            if chunk_schema.equals(schema):
+                continue
+            chunk_path = mlrun.datastore.targets.generate_path_with_chunk(
+                target, chunk_id, target_path
+            )
+            chunk_df = mlrun.get_dataitem(chunk_path).as_df(format="parquet")
+            chunk_df = (
+                pyarrow.Table.from_pandas(chunk_df, preserve_index=False)
+                .cast(schema)
+                .to_pandas()
+            )
+            # a chunk of a directory target may be a dataset directory, which would keep the original files
+            store, path_in_store, _ = mlrun.store_manager.get_or_create_store(
+                chunk_path
+            )
+            store.rm(path_in_store, recursive=True)
+            target.write_dataframe(chunk_df, chunk_id=chunk_id)
+
+    def get_status(self):
+        if self._result_df is None and self._chunks_target_size is not None:
+            return "completed"
+        return super().get_status()
+
+    def get_df(self, to_pandas=True):
+        if self._result_df is None and self._chunks_target_size is not None:
+            # the vector was written in chunks, and is only loaded when requested
+            self._result_df = self._target.as_df()
+        return super().get_df(to_pandas=to_pandas)
+
+    def to_parquet(self, target_path, **kw):
+        self.get_df()
+        return super().to_parquet(target_path, **kw)
+
+    def to_csv(self, target_path, **kw):
+        self.get_df()
+        return super().to_csv(target_path, **kw)
+
     def _rename_columns_and_select(self, df, rename_col_dict, columns=None):
         df.rename(
             columns=rename_col_dict,
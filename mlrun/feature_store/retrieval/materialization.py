@@ -0,0 +1,345 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import hashlib
+import json
+import typing
+
+import numpy as np
+import pandas as pd
+
+import mlrun
+import mlrun.errors
+from mlrun.datastore.targets import (
+    ParquetTarget,
+    get_default_prefix_for_target,
+    get_offline_target,
+)
+from mlrun.utils import logger
+from mlrun.utils.helpers import calculate_dataframe_hash
+
+from ..feature_set import FeatureSet
+
+
+class VectorMaterialization:
+    """
+    A materialized (cached) offline feature vector.
+
+    The vector result is stored as parquet parts under a path addressed by the fingerprint of the vector definition,
+    the request arguments and the feature sets it reads. Along with the parts, a state file records the ingestion
+    state of the feature sets (their offline target status) the result was generated from, so that the result is
+    reused as long as none of them was ingested since.
+
+    When the result is a time-ordered join of the feature sets (no entity rows, join graph, time filters or
+    order_by), the state also records the latest timestamp of the data (the watermark) and a digest of the data of
+    each timestamped feature set. When the feature sets that were ingested since only got rows after the watermark,
+    the existing rows of the result are still valid, and only the rows of the first feature set that are after the
+    watermark are joined and appended as a new part (after the existing rows, as the order of the rows isn't
+    defined without order_by).
+    """
+
+    state_file = "_state.json"
+
+    def __init__(
+        self,
+        vector,
+        feature_set_objects: dict[str, FeatureSet],
+        engine: str,
+        left_feature_set_name: typing.Optional[str],
+        entity_rows=None,
+        entity_timestamp_column=None,
+        drop_columns=None,
+        drop_indexes=True,
+        start_time=None,
+        end_time=None,
+        timestamp_for_filtering=None,
+        query=None,
+        order_by=None,
+        additional_filters=None,
+    ):
+        self._vector = vector
+        self._feature_set_objects = feature_set_objects
+        self._state = None
+
+        # rows can only be appended to a result that is ordered by the timestamp of its first feature set
+        left_feature_set = feature_set_objects.get(left_feature_set_name)
+        self._left_feature_set_name = (
+            left_feature_set_name
+            if entity_rows is None
+            and left_feature_set is not None
+            and left_feature_set.spec.timestamp_key
+            and not vector.spec.join_graph
+            and not (start_time or end_time or timestamp_for_filtering or order_by)
+            else None
+        )
+
+        definition = {
+            "engine": engine,
+            "features": vector.spec.features,
+            "label_feature": vector.spec.label_feature,
+            "join_graph": vector.spec.join_graph.to_dict()
+            if vector.spec.join_graph
+            else None,
+            "drop_columns": drop_columns,
+            "drop_indexes": drop_indexes,
+            "entity_rows": calculate_dataframe_hash(entity_rows)
+            if entity_rows is not None
+            else None,
+            "entity_timestamp_column": entity_timestamp_column,
+            "start_time": str(start_time) if start_time else None,
+            "end_time": str(end_time) if end_time else None,
+            "timestamp_for_filtering": timestamp_for_filtering,
+            "query": query,
+            "order_by": order_by,
+            "additional_filters": additional_filters,
+            "feature_sets": {
+                name: {
+                    "uri": feature_set.uri,
+                    "entities": list(feature_set.spec.entities.keys()),
+                    "timestamp_key": feature_set.spec.timestamp_key,
+                    "target": self._get_offline_target_path(feature_set),
+                }
+                for name, feature_set in feature_set_objects.items()
+            },
+        }
+        self.fingerprint = hashlib.sha1(
+            json.dumps(definition, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @property
+    def path(self) -> str:
+        path = mlrun.mlconf.feature_store.offline_materialization.path
+        if not path:
+            path = get_default_prefix_for_target("parquet").format(
+                project=self._vector.metadata.project or mlrun.mlconf.default_project,
+                name=self._vector.metadata.name,
+                kind="materialized",
+            )
+        return f"{path.rstrip('/')}/{self.fingerprint}/"
+
+    @property
+    def timestamp_key(self) -> typing.Optional[str]:
+        return self._state["timestamp_key"] if self._state else None
+
+    def load_state(self):
+        try:
+            self._state = json.loads(
+                mlrun.get_dataitem(self.path + self.state_file).get()
+            )
+        except Exception:
+            # not materialized yet
+            self._state = None
+
+    def get_ingestion_state(self) -> dict:
+        """The ingestion state of the feature sets, which changes whenever data is ingested to them"""
+        ingestion_state = {}
+        for name, feature_set in self._feature_set_objects.items():
+            target = self._get_offline_target_status(feature_set)
+            ingestion_state[name] = (
+                {
+                    "updated": str(target.updated),
+                    "size": target.size,
+                    "last_written": str(target.last_written),
+                }
+                if target
+                else None
+            )
+        return ingestion_state
+
+    def is_valid(self, ingestion_state: dict) -> bool:
+        return (
+            self._state is not None
+            and self._state["ingestion_state"] == ingestion_state
+        )
+
+    def get_append_watermark(self, ingestion_state: dict) -> typing.Optional[str]:
+        """
+        Get the watermark after which the rows of the first feature set are to be joined and appended to the
+        result, or None when the result must be regenerated
+        """
+        watermark = self._state and self._state.get("watermark")
+        if not watermark:
+            return None
+        for name, feature_set in self._feature_set_objects.items():
+            if ingestion_state[name] == self._state["ingestion_state"].get(name):
+                continue
+            if not feature_set.spec.timestamp_key:
+                return None
+            # the data up to the watermark must not have changed
+            digest, _ = self._get_data_digest(feature_set, end_time=watermark)
+            if digest != self._state["digests"].get(name):
+                logger.info(
+                    "Feature set data changed before the materialized watermark, regenerating the vector",
+                    feature_set=name,
+                    watermark=watermark,
+                )
+                return None
+        return watermark
+
+    def load_result(self) -> pd.DataFrame:
+        dfs = [
+            mlrun.get_dataitem(self._get_part_path(part)).as_df(format="parquet")
+            for part in range(1, self._state["parts"] + 1)
+        ]
+        df = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+        for column, dtype in df.dtypes.items():
+            # the parquet parts store the timestamps in microseconds, unlike the generated vector
+            if pd.api.types.is_datetime64_any_dtype(dtype):
+                unit = (
+                    dtype.unit
+                    if isinstance(dtype, pd.DatetimeTZDtype)
+                    else np.datetime_data(dtype)[0]
+                )
+                if unit != "ns":
+                    df[column] = df[column].dt.as_unit("ns")
+        return df
+
+    def write(
+        self, df: pd.DataFrame, ingestion_state: dict, timestamp_key: str
+    ) -> pd.DataFrame:
+        """Replace the materialized result with a newly generated one"""
+        self._state = None
+        store, path_in_store, _ = mlrun.store_manager.get_or_create_store(self.path)
+        try:
+            store.rm(path_in_store, recursive=True)
+        except FileNotFoundError:
+            pass
+        ParquetTarget(path=self._get_part_path(1)).write_dataframe(df)
+        self._write_state(
+            ingestion_state,
+            timestamp_key=timestamp_key,
+            parts=1,
+            digests={},
+            feature_sets=self._feature_set_objects.keys(),
+        )
+        return df
+
+    def append(
+        self, df: pd.DataFrame, ingestion_state: dict, timestamp_key: str
+    ) -> pd.DataFrame:
+        """Append the rows that were joined after the watermark to the materialized result"""
+        result_df = self.load_result()
+        parts = self._state["parts"]
+        if len(df):
+            parts += 1
+            ParquetTarget(path=self._get_part_path(parts)).write_dataframe(df)
+            result_df = pd.concat([result_df, df], ignore_index=True)
+        changed_feature_sets = [
+            name
+            for name in self._feature_set_objects
+            if ingestion_state[name] != self._state["ingestion_state"].get(name)
+        ]
+        self._write_state(
+            ingestion_state,
+            timestamp_key=timestamp_key,
+            parts=parts,
+            digests=self._state["digests"],
+            feature_sets=changed_feature_sets,
+            watermark=self._state["watermark"],
+        )
+        return result_df
+
+    def _write_state(
+        self,
+        ingestion_state: dict,
+        timestamp_key: str,
+        parts: int,
+        digests: dict,
+        feature_sets: typing.Iterable[str],
+        watermark: str = None,
+    ):
+        digests = dict(digests)
+        if self._left_feature_set_name:
+            # digest the data of the (newly) ingested timestamped feature sets, for validating later appends. the data
+            # up to the watermark of an appended result was already validated against its digest, so only the rows
+            # after it are read and added to the digest
+            appended_after = watermark
+            for name in feature_sets:
+                feature_set = self._feature_set_objects[name]
+                if not feature_set.spec.timestamp_key:
+                    continue
+                if appended_after and name in digests:
+                    digest, max_time = self._get_data_digest(
+                        feature_set, start_time=appended_after
+                    )
+                    digests[name] = self._add_data_digests(digests[name], digest)
+                else:
+                    digests[name], max_time = self._get_data_digest(feature_set)
+                if max_time and (
+                    not watermark or pd.Timestamp(max_time) > pd.Timestamp(watermark)
+                ):
+                    watermark = max_time
+        self._state = {
+            "ingestion_state": ingestion_state,
+            "timestamp_key": timestamp_key,
+            "parts": parts,
+            "digests": digests,
+            "watermark": watermark if self._left_feature_set_name else None,
+        }
+        mlrun.get_dataitem(self.path + self.state_file).put(json.dumps(self._state))
+
+    def _get_part_path(self, part: int) -> str:
+        return f"{self.path}{part:04}.parquet"
+
+    @staticmethod
+    def _get_data_digest(
+        feature_set: FeatureSet, start_time=None, end_time=None
+    ) -> tuple[list, typing.Optional[str]]:
+        """
+        The number of rows and an order insensitive hash of the data of a feature set (after start_time and up to
+        end_time, which are pushed down to the read), and its latest timestamp
+        """
+        timestamp_key = feature_set.spec.timestamp_key
+        df = feature_set.to_dataframe(
+            start_time=pd.Timestamp(start_time) if start_time else None,
+            end_time=pd.Timestamp(end_time) if end_time else None,
+            time_column=timestamp_key if start_time or end_time else None,
+        )
+        if df.index.names[0]:
+            df = df.reset_index()
+        df = df[sorted(df.columns)]
+        data_hash = (
+            pd.util.hash_pandas_object(df, index=False).to_numpy().sum(dtype=np.uint64)
+        )
+        max_time = df[timestamp_key].max() if len(df) else None
+        return [len(df), str(data_hash)], (
+            pd.Timestamp(max_time).isoformat() if max_time is not None else None
+        )
+
+    @staticmethod
+    def _add_data_digests(digest: list, other_digest: list) -> list:
+        """The digest of the data of two digests of disjoint rows, as the row hashes are summed (modulo 2^64)"""
+        return [
+            digest[0] + other_digest[0],
+            str((int(digest[1]) + int(other_digest[1])) % 2**64),
+        ]
+
+    @staticmethod
+    def _get_offline_target_status(feature_set: FeatureSet):
+        offline_target = get_offline_target(feature_set)
+        if offline_target is None:
+            return None
+        for target in feature_set.status.targets:
+            if target.name == offline_target.name:
+                return target
+        return None
+
+    @staticmethod
+    def _get_offline_target_path(feature_set: FeatureSet) -> typing.Optional[str]:
+        offline_target = get_offline_target(feature_set)
+        if offline_target is None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Feature set {feature_set.metadata.name} has no offline target"
+            )
+        return f"{offline_target.kind}:{offline_target.get_target_path()}"
@@ -35,7 +35,8 @@ class MLRunLogger(Logger):
     * For each epoch:
 
       * Tracking table: epoch, static hyperparameters, dynamic hyperparameters, training metrics, validation metrics.
-      * Per iteration (batch) chart artifacts for the training and validation metrics.
+      * Per iteration (batch) chart artifacts for the training and validation metrics (produced and written to MLRun
+        per the logging frequency).
 
     * At the end of the run:
 
@@ -56,18 +57,26 @@ class MLRunLogger(Logger):
     def __init__(
         self,
         context: mlrun.MLClientCtx,
+        logging_frequency: int = 1,
     ):
         """
         Initialize the MLRun logging interface to work with the given context.
 
-        :param context:              MLRun context to log to. The context parameters can be logged as static
-                                     hyperparameters.
+        :param context:           MLRun context to log to. The context parameters can be logged as static
+                                  hyperparameters.
+        :param logging_frequency: Per how many epochs to write the logs to MLRun (create the metrics charts and log
+                                  them and the epochs results to MLRun). The epochs that were not written yet are
+                                  written at the end of the run. Default: 1.
         """
         super().__init__(context=context)
 
         # Prepare the artifacts collection:
         self._artifacts = {}  # type: Dict[str, Artifact]
 
+        # Store the logging frequency and count the epochs that were not written to MLRun yet:
+        self._logging_frequency = max(logging_frequency, 1)
+        self._unwritten_epochs = 0
+
     def log_epoch_to_context(
         self,
         epoch: int,
@@ -84,31 +93,38 @@ class MLRunLogger(Logger):
           * Last iteration recorded training results for loss and metrics.
           * Validation results summaries for loss and metrics.
 
-        * Plot artifacts:
+        * Plot artifacts (every `logging_frequency` epochs):
 
           * A chart for each of the metrics iteration results in training.
           * A chart for each of the metrics iteration results in validation.
 
         :param epoch: The epoch number that has just ended.
         """
-        # Log the collected hyperparameters and values as results (the most recent value collected (-1 index)):
-        for static_parameter, value in self._static_hyperparameters.items():
-            self._context.log_result(static_parameter, value)
+        # Collect the hyperparameters and values as results (the most recent value collected (-1 index)):
+        results = dict(self._static_hyperparameters)
         if self._mode == LoggingMode.TRAINING:
             for dynamic_parameter, values in self._dynamic_hyperparameters.items():
-                self._context.log_result(dynamic_parameter, values[-1])
-            for metric, results in self._training_summaries.items():
-                self._context.log_result(
-                    f"{self._Loops.TRAINING}_{metric}", results[-1]
-                )
-        for metric, results in self._validation_summaries.items():
-            self._context.log_result(
+                results[dynamic_parameter] = values[-1]
+            for metric, metric_results in self._training_summaries.items():
+                results[f"{self._Loops.TRAINING}_{metric}"] = metric_results[-1]
+        for metric, metric_results in self._validation_summaries.items():
+            results[
                 f"{self._Loops.EVALUATION}_{metric}"
                 if self._mode == LoggingMode.EVALUATION
-                else f"{self._Loops.VALIDATION}_{metric}",
-                results[-1],
-            )
+                else f"{self._Loops.VALIDATION}_{metric}"
+            ] = metric_results[-1]
 
+        # Log all the results at once, they are written to MLRun with the charts:
+        self._context.log_results(results)
+        self._unwritten_epochs += 1
+        if self._unwritten_epochs >= self._logging_frequency:
+            self._write_epochs_to_context()
+
+    def _write_epochs_to_context(self):
+        """
+        Produce the metrics results chart artifacts of all the epochs so far, and write them along the logged results to
+        MLRun.
+        """
         # Log the epochs metrics results as chart artifacts:
         loops = (
             [self._Loops.EVALUATION]
@@ -139,6 +155,7 @@ class MLRunLogger(Logger):
 
         # Commit and commit children for MLRun flag bug:
         self._context.commit(completed=False)
+        self._unwritten_epochs = 0
 
     def log_run(
         self,
@@ -167,6 +184,10 @@ class MLRunLogger(Logger):
         :param parameters:    Parameters to log with the model.
         :param extra_data:    Extra data to log with the model.
         """
+        # Write the epochs that were not written yet (per the logging frequency):
+        if self._unwritten_epochs:
+            self._write_epochs_to_context()
+
         # If in training mode, log the summaries and hyperparameters artifacts:
         if self._mode == LoggingMode.TRAINING:
             # Create chart artifacts for summaries:
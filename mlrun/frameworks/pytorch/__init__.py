@@ -53,6 +53,9 @@ def train(
     mlrun_callback_kwargs: dict[str, Any] = None,
     tensorboard_callback_kwargs: dict[str, Any] = None,
     context: mlrun.MLClientCtx = None,
+    mixed_precision: Union[bool, str] = False,
+    gradient_accumulation_steps: int = 1,
+    metrics_frequency: int = 1,
 ) -> PyTorchModelHandler:
     """
     Use MLRun's PyTorch interface to train the model with the given parameters. For more information and further options
@@ -139,6 +142,18 @@ def train(
                                         the documentation of the class 'TensorboardLoggingCallback'. Note that both
                                         'context' and 'auto_log' parameters are already given here.
     :param context:                     The context to use for the logs.
+    :param mixed_precision:             Whether to infer the model and calculate the loss in mixed precision (autocast).
+                                        Can be True for the default precision of the device - 'bfloat16' on CPU and
+                                        'float16' on CUDA, or the precision name: 'bfloat16' or 'float16' (CUDA only,
+                                        the gradients are scaled to avoid underflow). Default: False.
+    :param gradient_accumulation_steps: Amount of batches to accumulate their gradients before each optimizer step, for
+                                        a larger effective batch size in the same memory. A scheduler step that is due
+                                        in the middle of an accumulation is done along the next optimizer step.
+                                        Default: 1.
+    :param metrics_frequency:           Per how many training batches to update the progress bar and log the loss and
+                                        metrics. The loss and metrics are the average of the batches since the last
+                                        update, summed on the device, so the training doesn't wait on the device every
+                                        batch. Default: 1.
 
     :return: A model handler with the provided model and parameters.
 
@@ -195,6 +210,9 @@ def train(
         callbacks=callbacks_list,
         use_cuda=use_cuda,
         use_horovod=use_horovod,
+        mixed_precision=mixed_precision,
+        gradient_accumulation_steps=gradient_accumulation_steps,
+        metrics_frequency=metrics_frequency,
     )
 
     return handler
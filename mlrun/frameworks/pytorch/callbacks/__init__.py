@@ -14,6 +14,8 @@
 #
 # flake8: noqa  - this is until we take care of the F401 violations with respect to __all__ & sphinx
 from .callback import Callback
+from .checkpoint_callback import CheckpointCallback
+from .early_stopping_callback import EarlyStoppingCallback
 from .logging_callback import HyperparametersKeys, LoggingCallback
 from .mlrun_logging_callback import MLRunLoggingCallback
 from .tensorboard_logging_callback import TensorboardLoggingCallback
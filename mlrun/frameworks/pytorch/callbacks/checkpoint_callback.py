@@ -0,0 +1,305 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import copy
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+from torch.nn import Module
+from torch.optim import Optimizer
+from torch.utils.data import DataLoader
+
+import mlrun
+
+from ..utils import PyTorchTypes
+from .callback import Callback
+from .metric_monitor import MetricMonitor
+
+
+class CheckpointCallback(Callback):
+    """
+    Callback for keeping the best checkpoints (the model's state dictionary) of the training by a monitored validation
+    summary (the loss or one of the metrics). Only the top 'k' checkpoints are kept, the rest are deleted once they drop
+    out of the top.
+
+    To not stall the training loop, at the end of each epoch the model's state dictionary is only copied to the CPU and
+    the serialization (and deletion of the pruned checkpoints) is done on a background thread. Once a checkpoint is
+    written, the background thread logs the kept checkpoints whose rank changed as artifacts to the artifact path of the
+    context, so the best checkpoints are logged throughout the training and not only once it completed.
+
+    The checkpoints are available in this callback post the training process via the 'get_checkpoints' method.
+    """
+
+    def __init__(
+        self,
+        context: mlrun.MLClientCtx = None,
+        top_k: int = 1,
+        monitor: str = MetricMonitor.LOSS,
+        mode: str = MetricMonitor.Mode.MIN,
+        min_delta: float = 0.0,
+        checkpoint_name: str = "checkpoint",
+        output_directory: str = None,
+        log_checkpoints_tag: str = "",
+    ):
+        """
+        Initialize a checkpoint callback.
+
+        :param context:             MLRun context to log the kept checkpoints to once they are written. If None, the
+                                    checkpoints are only kept in the output directory.
+        :param top_k:               The number of best checkpoints to keep. Default: 1.
+        :param monitor:             The name of the validation summary to rank the checkpoints by. Can be "loss" for the
+                                    loss or a metric function name (the class name of a metric module or the name of a
+                                    metric function). Default: "loss".
+        :param mode:                Whether the monitored value is better when it is lower ("min") or higher ("max").
+                                    Default: "min".
+        :param min_delta:           The minimal improvement over the worst kept checkpoint for a new checkpoint to be
+                                    saved once there are already 'top_k' checkpoints. Default: 0.0.
+        :param checkpoint_name:     The name of the checkpoints. The files are named "<name>_epoch_<epoch>.pt" and the
+                                    artifacts are logged by their rank: "<name>_1" is the best checkpoint, "<name>_2"
+                                    the second best and so on (a rank's artifact is updated whenever a new checkpoint
+                                    takes it). Default: "checkpoint".
+        :param output_directory:    The local directory to write the checkpoints into. Default: a new temporary
+                                    directory.
+        :param log_checkpoints_tag: Version tag to give the logged checkpoints.
+
+        :raise MLRunInvalidArgumentError: If 'top_k' is not positive or the monitor configuration is invalid.
+        """
+        super().__init__()
+        if top_k < 1:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The number of checkpoints to keep must be positive, got: {top_k}."
+            )
+        self._context = context
+        self._top_k = top_k
+        self._monitor = MetricMonitor(monitor=monitor, mode=mode, min_delta=min_delta)
+        self._checkpoint_name = checkpoint_name
+        self._output_directory = output_directory
+        self._log_checkpoints_tag = log_checkpoints_tag
+
+        # The kept checkpoints, sorted from the best to the worst, each is a dictionary of the epoch, monitored value
+        # and file path:
+        self._checkpoints = []  # type: list[dict]
+        self._current_value = None  # type: float
+        self._executor = None  # type: ThreadPoolExecutor
+        # The futures of the submitted writes (and logging) of the checkpoints:
+        self._futures = []  # type: list
+
+    def get_checkpoints(self) -> list[dict]:
+        """
+        Get the kept checkpoints, sorted from the best to the worst. Each checkpoint is a dictionary with its "epoch"
+        (counting from 1), monitored "value" and local "path".
+
+        :return: The kept checkpoints.
+        """
+        return [
+            {key: checkpoint[key] for key in ["epoch", "value", "path"]}
+            for checkpoint in self._checkpoints
+        ]
+
+    def on_horovod_check(self, rank: int) -> bool:
+        """
+        Check whether this callback is fitting to run by the given horovod rank (worker).
+
+        :param rank: The horovod rank (worker) id.
+
+        :return: True if the callback is ok to run on this rank and false if not.
+        """
+        return rank == 0
+
+    def on_setup(
+        self,
+        model: Module = None,
+        training_set: DataLoader = None,
+        validation_set: DataLoader = None,
+        loss_function: Module = None,
+        optimizer: Optimizer = None,
+        metric_functions: list[PyTorchTypes.MetricFunctionType] = None,
+        scheduler=None,
+    ):
+        """
+        Store the given objects in the callback's objects dictionary and verify a validation set was given.
+
+        :param model:            The model to be stored in this callback.
+        :param training_set:     The training set to be stored in this callback.
+        :param validation_set:   The validation set to be stored in this callback.
+        :param loss_function:    The loss function to be stored in this callback.
+        :param optimizer:        The optimizer to be stored in this callback.
+        :param metric_functions: The metric functions to be stored in this callback.
+        :param scheduler:        The scheduler to be stored in this callback.
+
+        :raise MLRunInvalidArgumentError: If there is no validation set to rank the checkpoints by.
+        """
+        if validation_set is None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Checkpointing the best epochs requires a validation set to monitor."
+            )
+        super().on_setup(
+            model=model,
+            training_set=training_set,
+            validation_set=validation_set,
+            loss_function=loss_function,
+            optimizer=optimizer,
+            metric_functions=metric_functions,
+            scheduler=scheduler,
+        )
+
+    def on_run_begin(self):
+        """
+        After the run begins, this method will be called to prepare the output directory and the writing thread.
+        """
+        if self._output_directory is None:
+            self._output_directory = tempfile.mkdtemp()
+        os.makedirs(self._output_directory, exist_ok=True)
+        self._checkpoints = []
+        self._current_value = None
+        self._futures = []
+        # A single worker, so the writes and deletions are done in the order they were submitted:
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mlrun-pytorch-checkpoints"
+        )
+
+    def on_run_end(self):
+        """
+        Before the run ends, this method will be called to wait for the checkpoints writing and logging to finish.
+        """
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+        # Raise the writing errors (if any) only after all the writes finished:
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def on_validation_end(
+        self, loss_value: PyTorchTypes.MetricValueType, metric_values: list[float]
+    ) -> bool:
+        """
+        Before the validation ends, this method will be called to collect the monitored value of this epoch.
+
+        :param loss_value:    The loss summary of this validation.
+        :param metric_values: The metrics summaries of this validation.
+
+        :return: True.
+        """
+        self._current_value = self._monitor.get_value(
+            loss_function=self._objects[self._ObjectKeys.LOSS_FUNCTION],
+            metric_functions=self._objects[self._ObjectKeys.METRIC_FUNCTIONS],
+            loss_value=loss_value,
+            metric_values=metric_values,
+        )
+        return True
+
+    def on_epoch_end(self, epoch: int) -> bool:
+        """
+        Before the epoch ends, this method will be called to checkpoint the model if it is one of the top 'k' epochs
+        and prune the checkpoint that dropped out of the top.
+
+        :param epoch: The epoch that has just ended.
+
+        :return: True.
+        """
+        value, self._current_value = self._current_value, None
+        if value is None:
+            return True
+        if len(self._checkpoints) == self._top_k and not self._monitor.is_improvement(
+            value=value, best_value=self._checkpoints[-1]["value"]
+        ):
+            return True
+
+        # Copy the state dictionary on the training thread, as the training keeps updating the parameters in place:
+        state_dict = {
+            key: tensor.detach().to(device="cpu", copy=True)
+            if isinstance(tensor, torch.Tensor)
+            else copy.deepcopy(tensor)
+            for key, tensor in self._objects[self._ObjectKeys.MODEL]
+            .state_dict()
+            .items()
+        }
+        path = os.path.join(
+            self._output_directory, f"{self._checkpoint_name}_epoch_{epoch + 1}.pt"
+        )
+        checkpoint = {"epoch": epoch + 1, "value": value, "path": path}
+
+        # Insert by rank (after the equally good checkpoints, so the earlier epoch is kept on ties):
+        index = len(self._checkpoints)
+        while index > 0 and self._monitor.is_better(
+            value=value, other_value=self._checkpoints[index - 1]["value"]
+        ):
+            index -= 1
+        self._checkpoints.insert(index, checkpoint)
+        pruned = (
+            self._checkpoints.pop() if len(self._checkpoints) > self._top_k else None
+        )
+
+        # Write the checkpoint and log the checkpoints from its rank onwards, as their ranks have changed (the rest were
+        # written earlier, so they are done by then):
+        self._futures.append(
+            self._executor.submit(
+                self._write_checkpoint,
+                state_dict,
+                path,
+                {
+                    rank: dict(ranked_checkpoint)
+                    for rank, ranked_checkpoint in enumerate(
+                        self._checkpoints[index:], start=index + 1
+                    )
+                },
+            )
+        )
+
+        # Prune the checkpoint that dropped out of the top (after the logging, so its file is no longer needed):
+        if pruned is not None:
+            self._futures.append(
+                self._executor.submit(self._delete_checkpoint, pruned["path"])
+            )
+        return True
+
+    def _write_checkpoint(
+        self, state_dict: dict, path: str, ranked_checkpoints: dict[int, dict]
+    ):
+        """
+        Write a checkpoint file and log the given checkpoints by their ranks via the stored context (if given).
+
+        :param state_dict:         The model's state dictionary to write.
+        :param path:               The checkpoint file path.
+        :param ranked_checkpoints: The checkpoints to log by their rank.
+        """
+        torch.save(state_dict, path)
+        if self._context is None:
+            return
+        for rank, checkpoint in ranked_checkpoints.items():
+            self._context.log_artifact(
+                f"{self._checkpoint_name}_{rank}",
+                local_path=checkpoint["path"],
+                artifact_path=self._context.artifact_path,
+                tag=self._log_checkpoints_tag,
+                labels={
+                    "epoch": checkpoint["epoch"],
+                    self._monitor.monitor: checkpoint["value"],
+                },
+            )
+
+    @staticmethod
+    def _delete_checkpoint(path: str):
+        """
+        Delete a checkpoint file.
+
+        :param path: The checkpoint file path.
+        """
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,198 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from torch.nn import Module
+from torch.optim import Optimizer
+from torch.utils.data import DataLoader
+
+import mlrun
+
+from ..utils import PyTorchTypes
+from .callback import Callback
+from .metric_monitor import MetricMonitor
+
+
+class EarlyStoppingCallback(Callback):
+    """
+    Callback for stopping the training once a monitored validation summary (the loss or one of the metrics) stopped
+    improving. The callback counts the epochs without an improvement of more than 'min_delta' and when they reach the
+    'patience', the training is stopped at the end of the epoch.
+
+    The callback is running on all the horovod ranks, as the validation summaries are averaged between them, so all the
+    ranks stop together.
+    """
+
+    def __init__(
+        self,
+        monitor: str = MetricMonitor.LOSS,
+        mode: str = MetricMonitor.Mode.MIN,
+        patience: int = 5,
+        min_delta: float = 0.0,
+    ):
+        """
+        Initialize an early stopping callback.
+
+        :param monitor:   The name of the validation summary to monitor. Can be "loss" for the loss or a metric function
+                          name (the class name of a metric module or the name of a metric function). Default: "loss".
+        :param mode:      Whether the monitored value is improving when it decreases ("min") or increases ("max").
+                          Default: "min".
+        :param patience:  The number of epochs without an improvement to wait before stopping the training. Default: 5.
+        :param min_delta: The minimal change in the monitored value to count as an improvement. Default: 0.0.
+
+        :raise MLRunInvalidArgumentError: If the patience is not positive or the monitor configuration is invalid.
+        """
+        super().__init__()
+        if patience < 1:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The patience must be a positive number of epochs, got: {patience}."
+            )
+        self._monitor = MetricMonitor(monitor=monitor, mode=mode, min_delta=min_delta)
+        self._patience = patience
+
+        # The state of the run:
+        self._best_value = None  # type: float
+        self._best_epoch = None  # type: int
+        self._epochs_without_improvement = 0
+        self._stopped_epoch = None  # type: int
+        self._current_value = None  # type: float
+
+    def get_best_value(self) -> float:
+        """
+        Get the best monitored value seen during the run.
+
+        :return: The best value. None if no validation ran yet.
+        """
+        return self._best_value
+
+    def get_best_epoch(self) -> int:
+        """
+        Get the epoch (counting from 1) of the best monitored value.
+
+        :return: The best epoch. None if no validation ran yet.
+        """
+        return self._best_epoch
+
+    def get_stopped_epoch(self) -> int:
+        """
+        Get the epoch (counting from 1) in which the training was stopped by this callback.
+
+        :return: The stopped epoch. None if the training was not stopped.
+        """
+        return self._stopped_epoch
+
+    def on_horovod_check(self, rank: int) -> bool:
+        """
+        Check whether this callback is fitting to run by the given horovod rank (worker).
+
+        :param rank: The horovod rank (worker) id.
+
+        :return: Always True, as all the ranks must stop together.
+        """
+        return True
+
+    def on_setup(
+        self,
+        model: Module = None,
+        training_set: DataLoader = None,
+        validation_set: DataLoader = None,
+        loss_function: Module = None,
+        optimizer: Optimizer = None,
+        metric_functions: list[PyTorchTypes.MetricFunctionType] = None,
+        scheduler=None,
+    ):
+        """
+        Store the given objects in the callback's objects dictionary and verify a validation set was given.
+
+        :param model:            The model to be stored in this callback.
+        :param training_set:     The training set to be stored in this callback.
+        :param validation_set:   The validation set to be stored in this callback.
+        :param loss_function:    The loss function to be stored in this callback.
+        :param optimizer:        The optimizer to be stored in this callback.
+        :param metric_functions: The metric functions to be stored in this callback.
+        :param scheduler:        The scheduler to be stored in this callback.
+
+        :raise MLRunInvalidArgumentError: If there is no validation set to monitor.
+        """
+        if validation_set is None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Early stopping requires a validation set to monitor."
+            )
+        super().on_setup(
+            model=model,
+            training_set=training_set,
+            validation_set=validation_set,
+            loss_function=loss_function,
+            optimizer=optimizer,
+            metric_functions=metric_functions,
+            scheduler=scheduler,
+        )
+
+    def on_run_begin(self):
+        """
+        After the run begins, this method will be called to reset the state of the callback.
+        """
+        self._best_value = None
+        self._best_epoch = None
+        self._epochs_without_improvement = 0
+        self._stopped_epoch = None
+        self._current_value = None
+
+    def on_validation_end(
+        self, loss_value: PyTorchTypes.MetricValueType, metric_values: list[float]
+    ) -> bool:
+        """
+        Before the validation ends, this method will be called to collect the monitored value of this epoch.
+
+        :param loss_value:    The loss summary of this validation.
+        :param metric_values: The metrics summaries of this validation.
+
+        :return: True, the decision to stop is made at the end of the epoch.
+        """
+        self._current_value = self._monitor.get_value(
+            loss_function=self._objects[self._ObjectKeys.LOSS_FUNCTION],
+            metric_functions=self._objects[self._ObjectKeys.METRIC_FUNCTIONS],
+            loss_value=loss_value,
+            metric_values=metric_values,
+        )
+        return True
+
+    def on_epoch_end(self, epoch: int) -> bool:
+        """
+        Before the epoch ends, this method will be called to check whether the monitored value improved and stop the
+        training if it did not improve for 'patience' epochs.
+
+        :param epoch: The epoch that has just ended.
+
+        :return: False to stop the training and True to continue it.
+        """
+        if self._current_value is None:
+            return True
+        if self._monitor.is_improvement(
+            value=self._current_value, best_value=self._best_value
+        ):
+            self._best_value = self._current_value
+            self._best_epoch = epoch + 1
+            self._epochs_without_improvement = 0
+        else:
+            self._epochs_without_improvement += 1
+        self._current_value = None
+
+        if self._epochs_without_improvement >= self._patience:
+            self._stopped_epoch = epoch + 1
+            print(
+                f"Early stopping: '{self._monitor.monitor}' did not improve for {self._epochs_without_improvement} "
+                f"epochs, the best value {self._best_value} was reached in epoch {self._best_epoch}."
+            )
+            return False
+        return True
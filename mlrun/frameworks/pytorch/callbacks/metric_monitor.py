@@ -0,0 +1,145 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Union
+
+from torch.nn import Module
+
+import mlrun
+
+from ..utils import PyTorchTypes
+
+
+class MetricMonitor:
+    """
+    A monitor of a single validation summary (the loss or one of the metrics) used by the callbacks that act upon the
+    improvement of the model (early stopping, best checkpoints).
+    """
+
+    class Mode:
+        """
+        The direction in which the monitored value is improving.
+        """
+
+        MIN = "min"
+        MAX = "max"
+
+    # The monitor name to use for the loss regardless of the loss function's name:
+    LOSS = "loss"
+
+    def __init__(
+        self, monitor: str = LOSS, mode: str = Mode.MIN, min_delta: float = 0.0
+    ):
+        """
+        Initialize a monitor.
+
+        :param monitor:   The name of the validation summary to monitor. Can be "loss" or the loss function name for the
+                          loss, or a metric function name (the class name of a metric module or the name of a metric
+                          function). Default: "loss".
+        :param mode:      Whether the monitored value is improving when it decreases ("min") or increases ("max").
+                          Default: "min".
+        :param min_delta: The minimal change in the monitored value to count as an improvement. Default: 0.0.
+
+        :raise MLRunInvalidArgumentError: If the mode is not "min" or "max" or the minimal delta is negative.
+        """
+        if mode not in [self.Mode.MIN, self.Mode.MAX]:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The monitoring mode must be '{self.Mode.MIN}' or '{self.Mode.MAX}', got: '{mode}'."
+            )
+        if min_delta < 0:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The minimal delta must be non-negative, got: {min_delta}."
+            )
+        self._monitor = monitor
+        self._mode = mode
+        self._min_delta = min_delta
+
+    @property
+    def monitor(self) -> str:
+        """
+        Get the name of the monitored validation summary.
+
+        :return: The monitored name.
+        """
+        return self._monitor
+
+    def get_value(
+        self,
+        loss_function: Module,
+        metric_functions: list[PyTorchTypes.MetricFunctionType],
+        loss_value: PyTorchTypes.MetricValueType,
+        metric_values: list[PyTorchTypes.MetricValueType],
+    ) -> float:
+        """
+        Get the monitored value out of the validation summaries.
+
+        :param loss_function:    The loss function of the run.
+        :param metric_functions: The metric functions of the run.
+        :param loss_value:       The loss summary of the validation.
+        :param metric_values:    The metrics summaries of the validation.
+
+        :return: The monitored value.
+
+        :raise MLRunInvalidArgumentError: If the monitored name is not the loss or one of the metrics.
+        """
+        if self._monitor in [self.LOSS, self._get_metric_name(loss_function)]:
+            return float(loss_value)
+        for metric_function, metric_value in zip(metric_functions, metric_values):
+            if self._monitor == self._get_metric_name(metric_function):
+                return float(metric_value)
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"The monitored value '{self._monitor}' is not the loss or one of the metrics: "
+            f"{[self._get_metric_name(metric_function) for metric_function in metric_functions]}."
+        )
+
+    def is_improvement(self, value: float, best_value: Union[float, None]) -> bool:
+        """
+        Check whether the given value is an improvement over the best value by more than the minimal delta.
+
+        :param value:      The value to check.
+        :param best_value: The best value so far. None if there is no value yet (counted as an improvement).
+
+        :return: True if the value is an improvement and False otherwise.
+        """
+        if best_value is None:
+            return True
+        if self._mode == self.Mode.MIN:
+            return value < best_value - self._min_delta
+        return value > best_value + self._min_delta
+
+    def is_better(self, value: float, other_value: float) -> bool:
+        """
+        Check whether the given value is better than the other value, regardless of the minimal delta.
+
+        :param value:       The value to check.
+        :param other_value: The value to compare to.
+
+        :return: True if the value is better and False otherwise.
+        """
+        if self._mode == self.Mode.MIN:
+            return value < other_value
+        return value > other_value
+
+    @staticmethod
+    def _get_metric_name(metric_function: PyTorchTypes.MetricFunctionType) -> str:
+        """
+        Get the given metric name, the same way the logging callbacks are naming it.
+
+        :param metric_function: The metric function to get its name.
+
+        :return: The metric name.
+        """
+        if isinstance(metric_function, Module):
+            return metric_function.__class__.__name__
+        return metric_function.__name__
@@ -69,6 +69,7 @@ class MLRunLoggingCallback(LoggingCallback):
             str, Union[PyTorchTypes.TrackableType, tuple[str, list[Union[str, int]]]]
         ] = None,
         auto_log: bool = False,
+        logging_frequency: int = 1,
     ):
         """
         Initialize an mlrun logging callback with the given hyperparameters and logging configurations. Notice: In order
@@ -106,6 +107,10 @@ class MLRunLoggingCallback(LoggingCallback):
                                          }
         :param auto_log:                 Whether or not to enable auto logging for logging the context parameters and
                                          trying to track common static and dynamic hyperparameters.
+        :param logging_frequency:        Per how many epochs to write the logs to MLRun (create the metrics charts and
+                                         log them and the epochs results to MLRun). Writing every epoch with many
+                                         metrics may slow the training time. The remaining epochs are written at the
+                                         end of the run. Default: 1.
         """
         super().__init__(
             dynamic_hyperparameters=dynamic_hyperparameters,
@@ -115,7 +120,7 @@ class MLRunLoggingCallback(LoggingCallback):
 
         # Replace the logger with an MLRunLogger:
         del self._logger
-        self._logger = MLRunLogger(context=context)
+        self._logger = MLRunLogger(context=context, logging_frequency=logging_frequency)
 
         # Store the given handler:
         self._model_handler = model_handler
@@ -661,6 +661,7 @@ class CallbacksHandler:
             if self._callbacks[callback].on_call_check():
                 method = getattr(self._callbacks[callback], method_name)
                 result = method(*args, **kwargs)
-                if result:
-                    all_result &= result
+                # Callbacks that do not return a value (None) do not affect the result:
+                if result is not None:
+                    all_result &= bool(result)
         return all_result
@@ -78,12 +78,18 @@ class PyTorchMLRunInterface:
         self._callbacks = []  # type: List[Callback]
         self._use_cuda = None  # type: bool
         self._use_horovod = None  # type: bool
+        self._mixed_precision = None  # type: Union[bool, str]
+        self._gradient_accumulation_steps = None  # type: int
+        self._metrics_frequency = None  # type: int
 
         # Prepare inner attributes:
         self._hvd = None
         self._training_sampler = None  # type: DistributedSampler
         self._validation_sampler = None  # type: DistributedSampler
         self._callbacks_handler = None  # type: CallbacksHandler
+        self._device_type = None  # type: str
+        self._autocast_dtype = None  # type: torch.dtype
+        self._gradient_scaler = None  # type: Union[torch.amp.GradScaler, None]
 
     @property
     def model(self) -> Module:
@@ -118,6 +124,9 @@ class PyTorchMLRunInterface:
         callbacks: list[Callback] = None,
         use_cuda: bool = True,
         use_horovod: bool = None,
+        mixed_precision: Union[bool, str] = False,
+        gradient_accumulation_steps: int = 1,
+        metrics_frequency: int = 1,
     ):
         """
         Initiate a training process on this interface configuration.
@@ -143,6 +152,18 @@ class PyTorchMLRunInterface:
         :param use_cuda:                 Whether to use cuda. Only relevant if cuda is available. Default: True.
         :param use_horovod:              Whether to use horovod - a distributed training framework. Default: None,
                                          meaning it will be read from context if available and if not - False.
+        :param mixed_precision:          Whether to infer the model and calculate the loss in mixed precision
+                                         (autocast). Can be True for the default precision of the device - 'bfloat16'
+                                         on CPU and 'float16' on CUDA, or the precision name: 'bfloat16' or 'float16'
+                                         (CUDA only, the gradients are scaled to avoid underflow). Default: False.
+        :param gradient_accumulation_steps: Amount of batches to accumulate their gradients before each optimizer step,
+                                         for a larger effective batch size in the same memory. A scheduler step that is
+                                         due in the middle of an accumulation is done along the next optimizer step.
+                                         Default: 1.
+        :param metrics_frequency:        Per how many training batches to update the progress bar and pass the loss and
+                                         metrics to the callbacks. The loss and metrics are the average of the batches
+                                         since the last update, summed on the device, so the training doesn't wait on
+                                         the device every batch. Default: 1.
         """
         # Load the input:
         self._parse_and_store(
@@ -159,6 +180,9 @@ class PyTorchMLRunInterface:
             callbacks=callbacks,
             use_cuda=use_cuda,
             use_horovod=use_horovod,
+            mixed_precision=mixed_precision,
+            gradient_accumulation_steps=gradient_accumulation_steps,
+            metrics_frequency=metrics_frequency,
         )
 
         # Set up the inner attributes (initializing horovod and creating the callbacks handler):
@@ -411,6 +435,9 @@ class PyTorchMLRunInterface:
         callbacks: list[Callback] = None,
         use_cuda: bool = True,
         use_horovod: bool = None,
+        mixed_precision: Union[bool, str] = False,
+        gradient_accumulation_steps: int = 1,
+        metrics_frequency: int = 1,
     ):
         """
         Parse and store the given input so the interface can starting training / evaluating.
@@ -437,6 +464,12 @@ class PyTorchMLRunInterface:
                                          True.
         :param use_horovod:              Whether or not to use horovod - a distributed training framework. Default:
                                          None, meaning it will be read from context if available and if not - False.
+        :param mixed_precision:          Whether to infer the model and calculate the loss in mixed precision: True for
+                                         the device default, 'bfloat16' or 'float16'. Default: False.
+        :param gradient_accumulation_steps: Amount of batches to accumulate their gradients before each optimizer step.
+                                         Default: 1.
+        :param metrics_frequency:        Per how many training batches to pass the average loss and metrics to the
+                                         callbacks and the progress bar. Default: 1.
 
         :raise MLRunInvalidArgumentError: In case one of the given parameters is invalid.
         """
@@ -499,6 +532,26 @@ class PyTorchMLRunInterface:
             scheduler_step_frequency = int(
                 training_iterations * scheduler_step_frequency
             )
+        # # Mixed precision:
+        if not isinstance(mixed_precision, bool) and mixed_precision not in [
+            "bfloat16",
+            "float16",
+        ]:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The 'mixed_precision' parameter can be a boolean or one of the precisions 'bfloat16' and 'float16', "
+                f"received: {mixed_precision}"
+            )
+        # # Gradient accumulation steps:
+        if gradient_accumulation_steps < 1:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The 'gradient_accumulation_steps' parameter must be bigger or equal to one, received: "
+                f"{gradient_accumulation_steps}"
+            )
+        # # Metrics frequency:
+        if metrics_frequency < 1:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The 'metrics_frequency' parameter must be bigger or equal to one, received: {metrics_frequency}"
+            )
         # # Callbacks:
         if callbacks is None:
             callbacks = []
@@ -524,6 +577,9 @@ class PyTorchMLRunInterface:
         self._callbacks += callbacks
         self._use_cuda = use_cuda
         self._use_horovod = use_horovod
+        self._mixed_precision = mixed_precision
+        self._gradient_accumulation_steps = gradient_accumulation_steps
+        self._metrics_frequency = metrics_frequency
 
     def _objects_to_cuda(self):
         """
@@ -588,6 +644,30 @@ class PyTorchMLRunInterface:
             # Log horovod worker device:
             print(f"Horovod worker #{self._hvd.rank()} is using CPU")
 
+        # Setup mixed precision:
+        self._device_type = (
+            "cuda" if self._use_cuda and torch.cuda.is_available() else "cpu"
+        )
+        if self._mixed_precision is True:
+            self._autocast_dtype = (
+                torch.float16 if self._device_type == "cuda" else torch.bfloat16
+            )
+        elif self._mixed_precision:
+            self._autocast_dtype = getattr(torch, self._mixed_precision)
+        if self._autocast_dtype == torch.float16 and self._device_type == "cpu":
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Mixed precision of 'float16' is only supported on CUDA, use 'bfloat16' on CPU"
+            )
+        # Scale the loss (and unscale the gradients) to avoid float16 gradients underflow, bfloat16 doesn't need it
+        # ('torch.amp.GradScaler' is only available since torch 2.3, older versions use the CUDA one):
+        self._gradient_scaler = None
+        if self._autocast_dtype == torch.float16:
+            self._gradient_scaler = (
+                torch.amp.GradScaler(self._device_type)
+                if hasattr(torch.amp, "GradScaler")
+                else torch.cuda.amp.GradScaler()
+            )
+
         # Initialize a callbacks handler:
         if self._use_horovod:
             self._callbacks_handler = CallbacksHandler(
@@ -640,7 +720,9 @@ class PyTorchMLRunInterface:
                 self._hvd.broadcast_optimizer_state(self._optimizer, root_rank=0)
                 # Add Horovod Distributed Optimizer:
                 self._optimizer = self._hvd.DistributedOptimizer(
-                    self._optimizer, named_parameters=self._model.named_parameters()
+                    self._optimizer,
+                    named_parameters=self._model.named_parameters(),
+                    backward_passes_per_step=self._gradient_accumulation_steps,
                 )
 
         # Setup the callbacks functions:
@@ -668,10 +750,21 @@ class PyTorchMLRunInterface:
             description="Training",
             metrics=[self._loss_function] + self._metric_functions,
         )
+        # The loss and metrics are summed on the device between the metrics updates, so the host doesn't wait on them
+        # every batch:
+        running_loss = None  # type: Tensor
+        running_metrics = None  # type: List[PyTorchTypes.MetricValueType]
+        running_batches = 0
+        # A scheduler step that is due in the middle of a gradients accumulation is done along the optimizer step:
+        is_scheduler_step_due = False
         for batch, (x, y_true) in progress_bar:
             # Check if iteration exceeded:
             if batch == self._training_iterations:
                 break
+            is_last_batch = batch + 1 == self._training_iterations
+            is_metrics_batch = (
+                batch + 1
+            ) % self._metrics_frequency == 0 or is_last_batch
 
             # Move to GPU if needed:
             if self._use_cuda and torch.cuda.is_available():
@@ -682,56 +775,144 @@ class PyTorchMLRunInterface:
                 batch=batch, x=x, y_true=y_true
             )
 
-            # Zero the parameters gradients:
-            self._optimizer.zero_grad()
+            # Zero the parameters gradients at the beginning of each accumulation:
+            if batch % self._gradient_accumulation_steps == 0:
+                self._optimizer.zero_grad()
 
-            # Infer the input:
-            self._callbacks_handler.on_inference_begin(x=x)
-            y_pred = self._model(x)
-            self._callbacks_handler.on_inference_end(y_pred=y_pred, y_true=y_true)
+            with torch.autocast(
+                device_type=self._device_type,
+                dtype=self._autocast_dtype,
+                enabled=self._autocast_dtype is not None,
+            ):
+                # Infer the input:
+                self._callbacks_handler.on_inference_begin(x=x)
+                y_pred = self._model(x)
+                self._callbacks_handler.on_inference_end(y_pred=y_pred, y_true=y_true)
 
-            # Calculate loss:
-            self._callbacks_handler.on_train_loss_begin()
-            loss_value = self._loss_function(y_pred, y_true)
-            self._callbacks_handler.on_train_loss_end(loss_value=loss_value)
+                # Calculate loss:
+                if is_metrics_batch:
+                    self._callbacks_handler.on_train_loss_begin()
+                loss_value = self._loss_function(y_pred, y_true)
 
             # Measure accuracies:
-            self._callbacks_handler.on_train_metrics_begin()
-            metric_values = self._metrics(y_pred=y_pred, y_true=y_true)
-            self._callbacks_handler.on_train_metrics_end(metric_values=metric_values)
-
-            # Update the progress bar with the recent values:
-            self._update_progress_bar(
-                progress_bar=progress_bar,
-                metrics=[self._loss_function] + self._metric_functions,
-                values=[loss_value] + metric_values,
+            with torch.no_grad():
+                metric_values = self._metrics(y_pred=y_pred.detach(), y_true=y_true)
+            running_loss = (
+                loss_value.detach()
+                if running_loss is None
+                else running_loss + loss_value.detach()
+            )
+            running_metrics = self._add_metric_values(
+                running_values=running_metrics, metric_values=metric_values
             )
+            running_batches += 1
 
-            # Perform backward propagation:
+            if is_metrics_batch:
+                self._log_training_results(
+                    progress_bar=progress_bar,
+                    loss_value=running_loss / running_batches,
+                    metric_values=[
+                        metric_value / running_batches
+                        for metric_value in running_metrics
+                    ],
+                )
+                running_loss, running_metrics, running_batches = None, None, 0
+
+            # Perform backward propagation, averaging the gradients over the accumulated batches (the last accumulation
+            # of the epoch may have fewer batches):
+            accumulated_batches = min(
+                self._gradient_accumulation_steps,
+                self._training_iterations
+                - (batch // self._gradient_accumulation_steps)
+                * self._gradient_accumulation_steps,
+            )
             self._callbacks_handler.on_backward_begin()
-            loss_value.backward()
+            backward_value = loss_value / accumulated_batches
+            if self._gradient_scaler is not None:
+                backward_value = self._gradient_scaler.scale(backward_value)
+            backward_value.backward()
             self._callbacks_handler.on_backward_end()
 
-            # Step optimizer:
-            self._callbacks_handler.on_optimizer_step_begin()
-            self._optimizer.step()
-            self._callbacks_handler.on_optimizer_step_end()
+            # Step optimizer at the end of each accumulation:
+            is_optimizer_step = (
+                batch + 1
+            ) % self._gradient_accumulation_steps == 0 or is_last_batch
+            if is_optimizer_step:
+                self._callbacks_handler.on_optimizer_step_begin()
+                self._optimizer_step()
+                self._callbacks_handler.on_optimizer_step_end()
 
-            # Step scheduler:
+            # Step scheduler (only after the optimizer stepped):
             if (
                 self._scheduler is not None
                 and (batch + 1) % self._scheduler_step_frequency == 0
             ):
+                is_scheduler_step_due = True
+            if is_scheduler_step_due and is_optimizer_step:
                 self._callbacks_handler.on_scheduler_step_begin()
                 self._scheduler.step()
                 self._callbacks_handler.on_scheduler_step_end()
+                is_scheduler_step_due = False
 
             # End of batch callbacks:
             if not self._callbacks_handler.on_train_batch_end(
                 batch=batch, x=x, y_pred=y_pred, y_true=y_true
             ):
+                # Log the results of the batches since the last update before stopping:
+                if running_batches:
+                    self._callbacks_handler.on_train_loss_begin()
+                    self._log_training_results(
+                        progress_bar=progress_bar,
+                        loss_value=running_loss / running_batches,
+                        metric_values=[
+                            metric_value / running_batches
+                            for metric_value in running_metrics
+                        ],
+                    )
                 break
 
+    def _optimizer_step(self):
+        """
+        Step the optimizer, through the gradient scaler if the loss was scaled.
+        """
+        if self._gradient_scaler is None:
+            self._optimizer.step()
+            return
+        if self._use_horovod:
+            # The gradients must be reduced between the ranks before they are unscaled, so the step itself must not
+            # wait for the reduction again:
+            self._optimizer.synchronize()
+            self._gradient_scaler.unscale_(self._optimizer)
+            with self._optimizer.skip_synchronize():
+                self._gradient_scaler.step(self._optimizer)
+        else:
+            self._gradient_scaler.step(self._optimizer)
+        self._gradient_scaler.update()
+
+    def _log_training_results(
+        self,
+        progress_bar: tqdm,
+        loss_value: Tensor,
+        metric_values: list[PyTorchTypes.MetricValueType],
+    ):
+        """
+        Pass the training loss and metrics to the callbacks and update the progress bar.
+
+        :param progress_bar:  The training progress bar.
+        :param loss_value:    The average loss of the batches since the last update.
+        :param metric_values: The average metrics of the batches since the last update.
+        """
+        self._callbacks_handler.on_train_loss_end(loss_value=loss_value)
+        self._callbacks_handler.on_train_metrics_begin()
+        self._callbacks_handler.on_train_metrics_end(metric_values=metric_values)
+
+        # Update the progress bar with the recent values:
+        self._update_progress_bar(
+            progress_bar=progress_bar,
+            metrics=[self._loss_function] + self._metric_functions,
+            values=[loss_value] + metric_values,
+        )
+
     def _validate(
         self, is_evaluation: bool = False
     ) -> tuple[PyTorchTypes.MetricValueType, list[PyTorchTypes.MetricValueType]]:
@@ -747,9 +928,10 @@ class PyTorchMLRunInterface:
         # Set model to evaluate mode:
         self._model.eval()
 
-        # Start the validation:
-        losses = []
-        metrics = []
+        # Start the validation (the loss and metrics are summed on the device):
+        running_loss = None  # type: Tensor
+        running_metrics = None  # type: List[PyTorchTypes.MetricValueType]
+        running_batches = 0
         progress_bar = self._create_progress_bar(
             dataset=self._validation_set,
             iterations=self._validation_iterations,
@@ -771,14 +953,21 @@ class PyTorchMLRunInterface:
                     batch=batch, x=x, y_true=y_true
                 )
 
-                # Infer the input:
-                self._callbacks_handler.on_inference_begin(x=x)
-                y_pred = self._model(x)
-                self._callbacks_handler.on_inference_end(y_pred=y_pred, y_true=y_true)
+                with torch.autocast(
+                    device_type=self._device_type,
+                    dtype=self._autocast_dtype,
+                    enabled=self._autocast_dtype is not None,
+                ):
+                    # Infer the input:
+                    self._callbacks_handler.on_inference_begin(x=x)
+                    y_pred = self._model(x)
+                    self._callbacks_handler.on_inference_end(
+                        y_pred=y_pred, y_true=y_true
+                    )
 
-                # Calculate loss:
-                self._callbacks_handler.on_validation_loss_begin()
-                loss_value = self._loss_function(y_pred, y_true)
+                    # Calculate loss:
+                    self._callbacks_handler.on_validation_loss_begin()
+                    loss_value = self._loss_function(y_pred, y_true)
                 self._callbacks_handler.on_validation_loss_end(loss_value=loss_value)
 
                 # Measure accuracies:
@@ -789,15 +978,21 @@ class PyTorchMLRunInterface:
                 )
 
                 # Update the progress bar with the recent values:
-                self._update_progress_bar(
-                    progress_bar=progress_bar,
-                    metrics=[self._loss_function] + self._metric_functions,
-                    values=[loss_value] + metric_values,
-                )
+                if (batch + 1) % self._metrics_frequency == 0:
+                    self._update_progress_bar(
+                        progress_bar=progress_bar,
+                        metrics=[self._loss_function] + self._metric_functions,
+                        values=[loss_value] + metric_values,
+                    )
 
                 # Collect results:
-                losses.append(loss_value)
-                metrics.append(metric_values)
+                running_loss = (
+                    loss_value if running_loss is None else running_loss + loss_value
+                )
+                running_metrics = self._add_metric_values(
+                    running_values=running_metrics, metric_values=metric_values
+                )
+                running_batches += 1
 
                 # End of batch callbacks:
                 if not self._callbacks_handler.on_validation_batch_end(
@@ -809,12 +1004,10 @@ class PyTorchMLRunInterface:
                     break
 
         # Calculate the final average of the loss and accuracy values:
-        loss_value = sum(losses) / len(losses)
-        metric_values = (
-            [(sum(metric) / len(metric)) for metric in metrics]
-            if len(metrics) > 0
-            else []
-        )
+        loss_value = running_loss / running_batches
+        metric_values = [
+            metric_value / running_batches for metric_value in running_metrics
+        ]
         return loss_value, metric_values
 
     def _print_results(self, loss_value: Tensor, metric_values: list[float]):
@@ -846,6 +1039,26 @@ class PyTorchMLRunInterface:
             accuracies.append(metric_function(y_pred, y_true))
         return accuracies
 
+    @staticmethod
+    def _add_metric_values(
+        running_values: Union[list[PyTorchTypes.MetricValueType], None],
+        metric_values: list[PyTorchTypes.MetricValueType],
+    ) -> list[PyTorchTypes.MetricValueType]:
+        """
+        Add the given batch's metrics to the running sums of the metrics (tensors are summed on their device).
+
+        :param running_values: The running sums of the metrics. None if no batch was summed yet.
+        :param metric_values:  The batch's metrics results.
+
+        :return: The updated running sums.
+        """
+        if running_values is None:
+            return list(metric_values)
+        return [
+            running_value + metric_value
+            for running_value, metric_value in zip(running_values, metric_values)
+        ]
+
     def _metric_average(self, rank_value: Union[Tensor, float], name: str) -> float:
         """
         Wait for all ranks and calculate the average of the metric provided.
@@ -892,12 +1105,18 @@ class PyTorchMLRunInterface:
         self._callbacks = []  # type: List[Callback]
         self._use_cuda = None  # type: bool
         self._use_horovod = None  # type: bool
+        self._mixed_precision = None  # type: Union[bool, str]
+        self._gradient_accumulation_steps = None  # type: int
+        self._metrics_frequency = None  # type: int
 
         # Clear the inner attributes:
         self._hvd = None
         self._training_sampler = None  # type: DistributedSampler
         self._validation_sampler = None  # type: DistributedSampler
         self._callbacks_handler = None  # type: CallbacksHandler
+        self._device_type = None  # type: str
+        self._autocast_dtype = None  # type: torch.dtype
+        self._gradient_scaler = None  # type: Union[torch.amp.GradScaler, None]
 
     @staticmethod
     def _insert_sampler_to_data_loader(
@@ -62,6 +62,7 @@ class MLRunLoggingCallback(LoggingCallback):
             str, Union[TFKerasTypes, list[Union[str, int]]]
         ] = None,
         auto_log: bool = False,
+        logging_frequency: int = 1,
     ):
         """
         Initialize an mlrun logging callback with the given hyperparameters and logging configurations.
@@ -96,6 +97,10 @@ class MLRunLoggingCallback(LoggingCallback):
         :param auto_log:                 Whether or not to enable auto logging for logging the context parameters and
                                          trying to track common static and dynamic hyperparameters such as learning
                                          rate.
+        :param logging_frequency:        Per how many epochs to write the logs to MLRun (create the metrics charts and
+                                         log them and the epochs results to MLRun). Writing every epoch with many
+                                         metrics may slow the training time. The remaining epochs are written at the
+                                         end of the run. Default: 1.
         """
         super().__init__(
             dynamic_hyperparameters=dynamic_hyperparameters,
@@ -105,7 +110,7 @@ class MLRunLoggingCallback(LoggingCallback):
 
         # Replace the logger with an MLRunLogger:
         del self._logger
-        self._logger = MLRunLogger(context=context)
+        self._logger = MLRunLogger(context=context, logging_frequency=logging_frequency)
 
         # Store the attributes to log along the model:
         self._log_model_tag = log_model_tag
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 from copy import copy
 
 import pandas as pd
@@ -40,6 +41,11 @@ list_header = [
     "error",
 ]
 
+# the media type of the runs listing as an arrow IPC stream (see RunList.to_arrow_stream)
+arrow_stream_media_type = "application/vnd.apache.arrow.stream"
+# the metadata key of the arrow fields whose values are json encoded (values that aren't all strings or integers)
+_arrow_json_field_metadata_key = b"mlrun.json"
+
 iter_index = list_header.index("iter")
 state_index = list_header.index("state")
 parameters_index = list_header.index("parameters")
@@ -49,11 +55,14 @@ results_index = list_header.index("results")
 class RunList(list):
     def to_rows(self, extend_iterations=False):
         """return the run list as flattened rows"""
+        return self._to_rows(extend_iterations, default_project=config.default_project)
+
+    def _to_rows(self, extend_iterations, default_project):
         rows = []
         for run in self:
             iterations = get_in(run, "status.iterations", "")
             row = [
-                get_in(run, "metadata.project", config.default_project),
+                get_in(run, "metadata.project", default_project),
                 get_in(run, "metadata.uid", ""),
                 get_in(run, "metadata.iteration", ""),
                 get_in(run, "status.start_time", ""),
@@ -102,15 +111,49 @@ class RunList(list):
             return self._df
         rows = self.to_rows(extend_iterations=extend_iterations)
         df = pd.DataFrame(rows[1:], columns=rows[0])  # .set_index('iter')
-        df["start"] = pd.to_datetime(df["start"])
-
-        if flat:
-            df = flatten(df, "labels")
-            df = flatten(df, "parameters", "param.")
-            df = flatten(df, "results", "output.")
+        df = _process_runs_df(df, flat=flat)
         self._df = df
         return df
 
+    def to_arrow_stream(self, extend_iterations: bool = False) -> bytes:
+        """
+        Convert the run list rows (see to_rows) to an arrow IPC stream, which is decoded to the same dataframe as
+        to_df by runs_df_from_arrow_stream.
+        Columns of strings or integers are stored as is, and the other columns (e.g. the parameters) as json.
+        """
+        # imported here as pyarrow is only needed for the (server side) arrow listing, not by every runtime
+        import pyarrow
+
+        # the project of runs without one is left empty, to be set to the default project of the reader, like to_df
+        rows = self._to_rows(extend_iterations, default_project=None)
+        header, rows = rows[0], rows[1:]
+        arrays = []
+        fields = []
+        for index, name in enumerate(header):
+            values = [row[index] for row in rows]
+            if all(value is None or isinstance(value, str) for value in values):
+                field = pyarrow.field(name, pyarrow.string())
+            elif all(
+                isinstance(value, int) and not isinstance(value, bool)
+                for value in values
+            ):
+                field = pyarrow.field(name, pyarrow.int64())
+            else:
+                field = pyarrow.field(
+                    name,
+                    pyarrow.string(),
+                    metadata={_arrow_json_field_metadata_key: b"true"},
+                )
+                values = [json.dumps(value, default=str) for value in values]
+            fields.append(field)
+            arrays.append(pyarrow.array(values, type=field.type))
+
+        schema = pyarrow.schema(fields)
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, schema) as writer:
+            writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+        return sink.getvalue().to_pybytes()
+
     def show(self, display=True, classes=None, short=False, extend_iterations=False):
         """show the run list as a table in Jupyter"""
         html = runs_to_html(
@@ -162,6 +205,30 @@ class RunList(list):
         )
 
 
+def runs_df_from_arrow_stream(data: bytes, flat: bool = False) -> pd.DataFrame:
+    """Decode the runs arrow IPC stream (see RunList.to_arrow_stream) to a dataframe, like RunList.to_df"""
+    import pyarrow
+
+    with pyarrow.ipc.open_stream(data) as reader:
+        table = reader.read_all()
+    df = table.to_pandas()
+    for field in table.schema:
+        if (field.metadata or {}).get(_arrow_json_field_metadata_key):
+            df[field.name] = [json.loads(value) for value in df[field.name]]
+    df["project"] = df["project"].fillna(config.default_project)
+    return _process_runs_df(df, flat=flat)
+
+
+def _process_runs_df(df: pd.DataFrame, flat: bool = False) -> pd.DataFrame:
+    df["start"] = pd.to_datetime(df["start"])
+
+    if flat:
+        df = flatten(df, "labels")
+        df = flatten(df, "parameters", "param.")
+        df = flatten(df, "results", "output.")
+    return df
+
+
 class ArtifactList(list):
     def __init__(self, *args):
         super().__init__(*args)
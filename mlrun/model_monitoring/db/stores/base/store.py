@@ -56,6 +56,16 @@ class StoreBase(ABC):
         """
         pass
 
+    def update_model_endpoints(self, endpoints: dict[str, dict[str, typing.Any]]):
+        """
+        Update several model endpoint records, each with its given attributes.
+
+        :param endpoints: Dictionary of endpoint id to the attributes that will be used for updating the model
+                          endpoint (see `update_model_endpoint`).
+        """
+        for endpoint_id, attributes in endpoints.items():
+            self.update_model_endpoint(endpoint_id=endpoint_id, attributes=attributes)
+
     @abstractmethod
     def delete_model_endpoint(self, endpoint_id: str):
         """
@@ -130,6 +140,21 @@ class StoreBase(ABC):
         :param kind: The type of the event, can be either "result" or "metric".
         """
 
+    def write_application_events(
+        self,
+        events: list[dict[str, typing.Any]],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """
+        Write several events of the same kind in the target table.
+
+        :param events: List of event dictionaries that represent the application results (see
+                       `write_application_event`).
+        :param kind:   The type of the events, can be either "result" or "metric".
+        """
+        for event in events:
+            self.write_application_event(event=event, kind=kind)
+
     @abstractmethod
     def get_last_analyzed(self, endpoint_id: str, application_name: str) -> int:
         """
@@ -18,6 +18,8 @@ import uuid
 
 import pandas as pd
 import sqlalchemy
+import sqlalchemy.dialects.mysql
+import sqlalchemy.dialects.sqlite
 import sqlalchemy.exc
 import sqlalchemy.orm
 from sqlalchemy.engine import Engine, make_url
@@ -127,6 +129,91 @@ class SQLStoreBase(StoreBase):
             event_df = pd.DataFrame([event])
             event_df.to_sql(table_name, con=connection, index=False, if_exists="append")
 
+    def write_many(
+        self,
+        table_name: str,
+        records: list[dict[str, typing.Any]],
+        update_on_conflict: bool = False,
+    ) -> None:
+        """
+        Create new records in the SQL table, with a single executemany insert per set of record keys.
+
+        :param table_name:         Target table name.
+        :param records:            List of record dictionaries that will be written into the DB.
+        :param update_on_conflict: If True, records with an existing primary key update the existing records. The
+                                   dialect's upsert statement is used when supported (MySQL and SQLite), otherwise
+                                   the existing records are updated one by one.
+        """
+        if not records:
+            return
+        table = self._tables[table_name].__table__
+
+        # executemany requires the same keys in all the records of a statement
+        records_by_keys: dict[tuple[str, ...], list[dict[str, typing.Any]]] = {}
+        for record in records:
+            records_by_keys.setdefault(tuple(record), []).append(record)
+
+        with self.engine.begin() as connection:
+            for keys, keys_records in records_by_keys.items():
+                if not update_on_conflict:
+                    connection.execute(table.insert(), keys_records)
+                    continue
+                upsert_statement = self._get_upsert_statement(
+                    table=table, keys=keys, dialect=connection.dialect.name
+                )
+                if upsert_statement is not None:
+                    connection.execute(upsert_statement, keys_records)
+                else:
+                    self._insert_or_update_records(
+                        connection=connection, table=table, records=keys_records
+                    )
+
+    @staticmethod
+    def _get_upsert_statement(
+        table: sqlalchemy.Table, keys: tuple[str, ...], dialect: str
+    ) -> typing.Optional[sqlalchemy.sql.Insert]:
+        primary_keys = {column.name for column in table.primary_key.columns}
+        update_keys = [key for key in keys if key not in primary_keys]
+        if dialect == "sqlite":
+            statement = sqlalchemy.dialects.sqlite.insert(table)
+            return statement.on_conflict_do_update(
+                index_elements=list(primary_keys),
+                set_={key: statement.excluded[key] for key in update_keys},
+            )
+        if dialect == "mysql":
+            statement = sqlalchemy.dialects.mysql.insert(table)
+            return statement.on_duplicate_key_update(
+                {key: statement.inserted[key] for key in update_keys}
+            )
+        return None
+
+    @staticmethod
+    def _insert_or_update_records(
+        connection: sqlalchemy.engine.Connection,
+        table: sqlalchemy.Table,
+        records: list[dict[str, typing.Any]],
+    ) -> None:
+        (primary_key,) = table.primary_key.columns
+        existing_keys = set(
+            connection.execute(
+                sqlalchemy.select(primary_key).where(
+                    primary_key.in_([record[primary_key.name] for record in records])
+                )
+            ).scalars()
+        )
+        new_records = []
+        for record in records:
+            if record[primary_key.name] in existing_keys:
+                connection.execute(
+                    table.update()
+                    .where(primary_key == record[primary_key.name])
+                    .values(record)
+                )
+            else:
+                new_records.append(record)
+        if new_records:
+            connection.execute(table.insert(), new_records)
+
     def _update(
         self,
         attributes: dict[str, typing.Any],
@@ -232,6 +319,25 @@ class SQLStoreBase(StoreBase):
             criteria=[self.model_endpoints_table.uid == endpoint_id],
         )
 
+    def update_model_endpoints(self, endpoints: dict[str, dict[str, typing.Any]]):
+        """
+        Update several model endpoint records in a single session and transaction.
+
+        :param endpoints: Dictionary of endpoint id to the attributes that will be used for updating the model
+                          endpoint. Note that the keys of the attributes dictionaries should exist in the SQL table.
+        """
+        if not endpoints:
+            return
+        with create_session(dsn=self._sql_connection_string) as session:
+            for endpoint_id, attributes in endpoints.items():
+                attributes.pop(mm_schemas.EventFieldType.ENDPOINT_ID, None)
+                session.query(
+                    self.model_endpoints_table  # pyright: ignore[reportOptionalCall]
+                ).filter(self.model_endpoints_table.uid == endpoint_id).update(
+                    attributes, synchronize_session=False
+                )
+            session.commit()
+
     def delete_model_endpoint(self, endpoint_id: str) -> None:
         """
         Deletes the SQL record of a given model endpoint id.
@@ -362,14 +468,7 @@ class SQLStoreBase(StoreBase):
         :param kind: The type of the event, can be either "result" or "metric".
         """
 
-        if kind == mm_schemas.WriterEventKind.METRIC:
-            table = self.application_metrics_table
-            table_name = mm_schemas.FileTargetKind.APP_METRICS
-        elif kind == mm_schemas.WriterEventKind.RESULT:
-            table = self.application_results_table
-            table_name = mm_schemas.FileTargetKind.APP_RESULTS
-        else:
-            raise ValueError(f"Invalid {kind = }")
+        table, table_name = self._get_application_table(kind)
 
         application_result_uid = self._generate_application_result_uid(event, kind=kind)
         criteria = [table.uid == application_result_uid]
@@ -389,6 +488,57 @@ class SQLStoreBase(StoreBase):
             event[mm_schemas.EventFieldType.UID] = application_result_uid
             self._write(table_name=table_name, event=event)
 
+    def write_application_events(
+        self,
+        events: list[dict[str, typing.Any]],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """
+        Write several application events of the same kind in the target table, with a single bulk upsert. When
+        several events refer to the same application result or metric, the last one is kept.
+
+        :param events: List of event dictionaries that represent the application results or metrics,
+                       should be corresponded to the schema defined in the
+                       :py:class:`~mm_constants.constants.WriterEvent` object.
+        :param kind:   The type of the events, can be either "result" or "metric".
+        """
+        _, table_name = self._get_application_table(kind)
+
+        records = {}
+        for event in events:
+            self._convert_to_datetime(
+                event=event, key=mm_schemas.WriterEvent.START_INFER_TIME
+            )
+            self._convert_to_datetime(
+                event=event, key=mm_schemas.WriterEvent.END_INFER_TIME
+            )
+            application_result_uid = self._generate_application_result_uid(
+                event, kind=kind
+            )
+            event[mm_schemas.EventFieldType.UID] = application_result_uid
+            records[application_result_uid] = event
+
+        self.write_many(
+            table_name=table_name,
+            records=list(records.values()),
+            update_on_conflict=True,
+        )
+
+    def _get_application_table(
+        self, kind: mm_schemas.WriterEventKind
+    ) -> tuple[sqlalchemy.orm.decl_api.DeclarativeMeta, str]:
+        if kind == mm_schemas.WriterEventKind.METRIC:
+            return (
+                self.application_metrics_table,
+                mm_schemas.FileTargetKind.APP_METRICS,
+            )
+        elif kind == mm_schemas.WriterEventKind.RESULT:
+            return (
+                self.application_results_table,
+                mm_schemas.FileTargetKind.APP_RESULTS,
+            )
+        raise ValueError(f"Invalid {kind = }")
+
     @staticmethod
     def _convert_to_datetime(event: dict[str, typing.Any], key: str) -> None:
         if isinstance(event[key], str):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import collections
 import datetime
 import json
@@ -286,6 +287,8 @@ class EventStreamProcessor:
                 name="UpdateEndpoint",
                 after="ProcessBeforeEndpointUpdate",
                 project=self.project,
+                flush_interval_secs=mlrun.mlconf.model_endpoint_monitoring.endpoint_updates.flush_interval_secs,
+                max_pending_updates=mlrun.mlconf.model_endpoint_monitoring.endpoint_updates.max_pending_updates,
             )
 
         apply_update_endpoint()
@@ -597,6 +600,16 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
                 else [predictions]
             )
 
+        # The last request is the current event's timestamp, which is already parsed. Parsing it is costly, so it is
+        # done once for all the sub-events, and only timezone naive timestamps are enriched through the string
+        last_request_timestamp = (
+            timestamp.timestamp()
+            if timestamp.tzinfo is not None
+            else mlrun.utils.enrich_datetime_with_tz_info(
+                self.last_request[endpoint_id]
+            ).timestamp()
+        )
+
         events = []
         for i, (feature, prediction) in enumerate(zip(features, predictions)):
             if not isinstance(prediction, list):
@@ -618,9 +631,7 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
                     EventFieldType.PREDICTION: prediction,
                     EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
                     EventFieldType.LAST_REQUEST: self.last_request[endpoint_id],
-                    EventFieldType.LAST_REQUEST_TIMESTAMP: mlrun.utils.enrich_datetime_with_tz_info(
-                        self.last_request[endpoint_id]
-                    ).timestamp(),
+                    EventFieldType.LAST_REQUEST_TIMESTAMP: last_request_timestamp,
                     EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
                     EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
                     EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
@@ -866,7 +877,7 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         # Add endpoint type to the event
         event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
 
-        logger.info("Mapped event", event=event)
+        logger.debug("Mapped event", event=event)
         return event
 
     @staticmethod
@@ -896,28 +907,116 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
 
 class UpdateEndpoint(mlrun.feature_store.steps.MapClass):
-    def __init__(self, project: str, **kwargs):
+    def __init__(
+        self,
+        project: str,
+        flush_interval_secs: typing.Optional[float] = None,
+        max_pending_updates: typing.Optional[int] = None,
+        **kwargs,
+    ):
         """
         Update the model endpoint record in the DB. Note that the event at this point includes metadata and stats about
         the average latency and the amount of predictions over time. This data will be used in the monitoring dashboards
         such as "Model Monitoring - Performance" which can be found in Grafana.
+        The updates are written behind: only the latest attributes of each endpoint are kept, and they are written
+        to the DB together once every `flush_interval_secs` seconds or once `max_pending_updates` events were received
+        since the last write (whichever comes first), and when the flow terminates.
+
+        :param project:             Project name.
+        :param flush_interval_secs: Maximum number of seconds to hold the endpoints updates before writing them.
+                                    Set to 0 to write each update immediately.
+        :param max_pending_updates: Maximum number of events to coalesce before writing the endpoints updates.
 
         :returns: Event as a dictionary (without any changes) for the next step (InferSchema).
         """
         super().__init__(**kwargs)
         self.project = project
+        updates_config = mlrun.mlconf.model_endpoint_monitoring.endpoint_updates
+        self._flush_interval_secs = (
+            flush_interval_secs
+            if flush_interval_secs is not None
+            else updates_config.flush_interval_secs
+        )
+        self._max_pending_updates = (
+            max_pending_updates or updates_config.max_pending_updates
+        )
+
+        self._store: typing.Optional[StoreBase] = None
+
+        # Latest attributes (value) of each endpoint (key) that were not written yet
+        self._pending_updates: dict[str, dict[str, typing.Any]] = {}
+        self._pending_updates_count = 0
+        self._flush_timer: typing.Optional[asyncio.TimerHandle] = None
 
     def do(self, event: dict):
         # Remove labels from the event
         event.pop(EventFieldType.LABELS)
 
-        update_endpoint_record(
-            project=self.project,
-            endpoint_id=event.pop(EventFieldType.ENDPOINT_ID),
-            attributes=event,
-        )
+        endpoint_id = event.pop(EventFieldType.ENDPOINT_ID)
+        self._pending_updates.setdefault(endpoint_id, {}).update(event)
+        self._pending_updates_count += 1
+
+        if (
+            not self._flush_interval_secs
+            or self._pending_updates_count >= self._max_pending_updates
+        ):
+            self.flush()
+        elif self._flush_timer is None:
+            self._schedule_flush()
         return event
 
+    def flush(self):
+        """Write the pending endpoints updates to the DB"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending_updates:
+            return
+
+        pending_updates, self._pending_updates = self._pending_updates, {}
+        pending_updates_count, self._pending_updates_count = (
+            self._pending_updates_count,
+            0,
+        )
+        self._get_store().update_model_endpoints(pending_updates)
+        logger.debug(
+            "Updated model endpoints records",
+            endpoints_count=len(pending_updates),
+            events_count=pending_updates_count,
+        )
+
+    async def _do(self, event):
+        if event is storey.dtypes._termination_obj:
+            self.flush()
+        return await super()._do(event)
+
+    def _schedule_flush(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not running within a flow (e.g. when the step is used directly), the updates are written by the
+            # following events or by an explicit flush
+            return
+        self._flush_timer = loop.call_later(
+            self._flush_interval_secs, self._timed_flush
+        )
+
+    def _timed_flush(self):
+        self._flush_timer = None
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.warning(
+                "Failed to update model endpoints records",
+                exc=mlrun.errors.err_to_str(exc),
+            )
+
+    def _get_store(self) -> StoreBase:
+        # The store object (and its DB connection pool) is created once and reused by all the flushes
+        if self._store is None:
+            self._store = mlrun.model_monitoring.get_store_object(project=self.project)
+        return self._store
+
 
 class InferSchema(mlrun.feature_store.steps.MapClass):
     def __init__(
@@ -12,17 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import collections
 import json
-from typing import Any, Callable, NewType
+from typing import Any, Callable, NewType, Optional
+
+import storey
 
 import mlrun.common.model_monitoring
 import mlrun.common.schemas
 import mlrun.common.schemas.alert as alert_objects
+import mlrun.errors
 import mlrun.model_monitoring
 from mlrun.common.schemas.model_monitoring.constants import (
     EventFieldType,
     HistogramDataDriftApplicationConstants,
     MetricData,
+    ModelEndpointTarget,
     ResultData,
     ResultKindApp,
     ResultStatusApp,
@@ -95,7 +101,7 @@ Extra data: `{self._event[ResultData.RESULT_EXTRA_DATA]}`\
         logger.debug("A notification should have been sent")
 
 
-class ModelMonitoringWriter(StepToDict):
+class ModelMonitoringWriter(StepToDict, storey.MapClass):
     """
     Write monitoring application results to the target databases
     """
@@ -106,9 +112,30 @@ class ModelMonitoringWriter(StepToDict):
         self,
         project: str,
         secret_provider: Callable = None,
+        store_batch_max_events: Optional[int] = None,
+        store_batch_flush_interval_secs: Optional[float] = None,
     ) -> None:
+        """
+        :param project:                         The name of the project.
+        :param secret_provider:                 An optional secret provider to get the connection strings.
+        :param store_batch_max_events:          When the application results are stored in a SQL store, they are
+                                                buffered and written together once this number of events is buffered.
+        :param store_batch_flush_interval_secs: Maximum number of seconds to buffer the application results before
+                                                writing them to the SQL store. Set to 0 to write each event
+                                                immediately.
+        """
+        super().__init__()
         self.project = project
         self.name = project  # required for the deployment process
+        batching_config = mlrun.mlconf.model_endpoint_monitoring.writer_batching
+        self._store_batch_max_events = (
+            store_batch_max_events or batching_config.max_events
+        )
+        self._store_batch_flush_interval_secs = (
+            store_batch_flush_interval_secs
+            if store_batch_flush_interval_secs is not None
+            else batching_config.flush_interval_secs
+        )
 
         self._custom_notifier = CustomNotificationPusher(
             notification_types=[NotificationKind.slack]
@@ -122,6 +149,13 @@ class ModelMonitoringWriter(StepToDict):
         )
         self._endpoints_records = {}
 
+        # Application events (value) of each kind (key) that were not written to the store yet
+        self._store_events: dict[WriterEventKind, list[_AppResultEvent]] = (
+            collections.defaultdict(list)
+        )
+        self._store_events_count = 0
+        self._store_flush_timer: Optional[asyncio.TimerHandle] = None
+
     def _generate_event_on_drift(
         self,
         entity_id: str,
@@ -203,11 +237,87 @@ class ModelMonitoringWriter(StepToDict):
 
         return result_event, kind
 
+    def _write_to_store(self, event: _AppResultEvent, kind: WriterEventKind) -> None:
+        # SQL stores write the buffered events with a single bulk statement, other stores write each event anyway
+        if (
+            not self._store_batch_flush_interval_secs
+            or self._app_result_store.type != ModelEndpointTarget.SQL
+        ):
+            self._app_result_store.write_application_event(event=event, kind=kind)
+            return
+
+        self._store_events[kind].append(event)
+        self._store_events_count += 1
+        if self._store_events_count >= self._store_batch_max_events:
+            self.flush()
+        elif self._store_flush_timer is None:
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered application events to the store. If the write fails, the events that were not written are
+        kept in the buffer (to be written by the next flush) and the error is raised.
+        """
+        if self._store_flush_timer is not None:
+            self._store_flush_timer.cancel()
+            self._store_flush_timer = None
+        store_events, self._store_events = (
+            self._store_events,
+            collections.defaultdict(list),
+        )
+        self._store_events_count = 0
+        for kind in list(store_events):
+            try:
+                self._app_result_store.write_application_events(
+                    events=store_events[kind], kind=kind
+                )
+            except Exception:
+                self._requeue(store_events)
+                raise
+            logger.debug(
+                "Wrote application events to the store",
+                kind=kind,
+                events_count=len(store_events.pop(kind)),
+            )
+
+    def _requeue(self, store_events: dict[WriterEventKind, list[_AppResultEvent]]):
+        # the events that failed to be written go back to the buffer before the events that were buffered since
+        for kind, events in store_events.items():
+            self._store_events[kind][:0] = events
+            self._store_events_count += len(events)
+
+    def _schedule_flush(self) -> None:
+        try:
+            self._store_flush_timer = asyncio.get_running_loop().call_later(
+                self._store_batch_flush_interval_secs, self._timed_flush
+            )
+        except RuntimeError:
+            # Not running within a flow, the events are written by the following events or an explicit flush
+            pass
+
+    def _timed_flush(self) -> None:
+        self._store_flush_timer = None
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.warning(
+                "Failed to write application events to the store, retrying",
+                events_count=self._store_events_count,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            self._schedule_flush()
+
+    async def _do(self, event):
+        if event is storey.dtypes._termination_obj:
+            # Write the buffered application events before the flow terminates
+            self.flush()
+        return await super()._do(event)
+
     def do(self, event: _RawEvent) -> None:
         event, kind = self._reconstruct_event(event)
         logger.info("Starting to write event", event=event)
         self._tsdb_connector.write_application_event(event=event.copy(), kind=kind)
-        self._app_result_store.write_application_event(event=event.copy(), kind=kind)
+        self._write_to_store(event=event.copy(), kind=kind)
 
         logger.info("Completed event DB writes")
 
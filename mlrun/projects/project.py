@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
+import contextvars
 import datetime
 import getpass
 import glob
+import hashlib
 import http
 import importlib.util as imputil
 import json
@@ -22,6 +26,7 @@ import os
 import pathlib
 import shutil
 import tempfile
+import threading
 import typing
 import uuid
 import warnings
@@ -36,6 +41,7 @@ import git.exc
 import mlrun_pipelines.common.models
 import mlrun_pipelines.mounts
 import nuclio.utils
+import pandas as pd
 import requests
 import yaml
 from mlrun_pipelines.models import PipelineNodeWrapper
@@ -1475,6 +1481,7 @@ class MlrunProject(ModelObj):
             self.spec.artifact_path or mlrun.mlconf.artifact_path, self.metadata.name
         )
         project_tag = self._get_project_tag()
+        artifacts_to_log = []
         for artifact_dict in self.spec.artifacts:
             if _is_imported_artifact(artifact_dict):
                 import_from = artifact_dict["import_from"]
@@ -1497,22 +1504,24 @@ class MlrunProject(ModelObj):
                 producer, is_retained_producer = self._resolve_artifact_producer(
                     artifact, project_tag
                 )
-                # log the artifact only if it doesn't already exist
-                if (
-                    producer.name != self.metadata.name
-                    and self._resolve_existing_artifact(
-                        artifact,
-                    )
-                ):
-                    continue
-                artifact_manager.log_artifact(
-                    producer,
-                    artifact,
-                    artifact_path=artifact_path,
-                    project=self.metadata.name,
-                    is_retained_producer=is_retained_producer,
+                artifacts_to_log.append(
+                    {
+                        "producer": producer,
+                        "item": artifact,
+                        "is_retained_producer": is_retained_producer,
+                        # log the artifact only if it doesn't already exist
+                        "skip_if_exists": producer.name != self.metadata.name,
+                    }
                 )
 
+        # upload the artifacts concurrently and store them with a single request
+        if artifacts_to_log:
+            artifact_manager.log_artifacts(
+                artifacts_to_log,
+                artifact_path=artifact_path,
+                project=self.metadata.name,
+            )
+
     def _get_artifact_manager(self):
         if self._artifact_manager:
             return self._artifact_manager
@@ -2867,7 +2876,8 @@ class MlrunProject(ModelObj):
             names = self.spec._function_definitions.keys()
             functions = {}
 
-        origin = mlrun.runtimes.utils.add_code_metadata(self.spec.context)
+        reused_functions = {}
+        names_to_load = []
         for name in names:
             function_definition = self.spec._function_definitions.get(name)
             if not function_definition:
@@ -2885,45 +2895,31 @@ class MlrunProject(ModelObj):
             )
             # If this function is already available locally, don't recreate it unless always=True
             if is_base_runtime and not always:
-                functions[name] = function_object
+                reused_functions[name] = function_object
                 continue
 
-            # Reload the function
-            if hasattr(function_definition, "to_dict"):
-                name, func = _init_function_from_obj(function_definition, self, name)
-            elif isinstance(function_definition, dict):
-                try:
-                    name, func = _init_function_from_dict(
-                        function_definition, self, name
-                    )
-                except FileNotFoundError as exc:
-                    message = f"File {exc.filename} not found while syncing project functions."
-                    if silent:
-                        message += " Skipping function reload"
-                        logger.warn(message, name=name)
-                        continue
-
-                    raise mlrun.errors.MLRunMissingDependencyError(message) from exc
-
-                except Exception as exc:
-                    if silent:
-                        logger.warn(
-                            "Failed to instantiate function",
-                            name=name,
-                            error=mlrun.utils.err_to_str(exc),
-                        )
-                        continue
-                    raise exc
-            else:
-                message = f"Function {name} must be an object or dict."
-                if silent:
-                    message += " Skipping function reload"
-                    logger.warn(message, name=name)
-                    continue
-                raise ValueError(message)
+            names_to_load.append(name)
+
+        # the git metadata is resolved once for the whole project (rather than per function), and the functions are
+        # loaded concurrently since loading may involve I/O (hub/db fetches, reading and compiling code files)
+        with mlrun.runtimes.utils.code_metadata_cache():
+            origin = mlrun.runtimes.utils.add_code_metadata(self.spec.context)
+            loaded_functions = dict(
+                zip(names_to_load, self._load_functions(names_to_load, silent))
+            )
 
+        for name in names:
+            if name in reused_functions:
+                functions[name] = reused_functions[name]
+                continue
+
+            # functions which failed loading are skipped (when silent)
+            if not loaded_functions.get(name):
+                continue
+
+            function_name, func = loaded_functions[name]
             func.spec.build.code_origin = origin
-            functions[name] = func
+            functions[function_name] = func
             if save:
                 func.save(versioned=False)
 
@@ -2931,6 +2927,81 @@ class MlrunProject(ModelObj):
         self._initialized = True
         return self.spec._function_objects
 
+    def _load_functions(
+        self, names: list[str], silent: bool = False
+    ) -> list[Optional[tuple[str, mlrun.runtimes.BaseRuntime]]]:
+        """
+        load function definitions concurrently, the results are returned in the order of the given names (None for
+        functions that were skipped)
+        """
+        # the code origin reads the project's git repository, which isn't thread safe, so it is resolved once before
+        # the functions are loaded
+        code_origin = _resolve_code_origin(self)
+        if len(names) <= 1:
+            return [self._load_function(name, silent, code_origin) for name in names]
+
+        max_workers = min(
+            len(names), int(mlrun.mlconf.projects.sync_functions.max_workers)
+        )
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(max_workers, 1)
+        ) as pool:
+            # run with a copy of the current context so the workers share the code metadata cache
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._load_function,
+                    name,
+                    silent,
+                    code_origin,
+                )
+                for name in names
+            ]
+        return [future.result() for future in futures]
+
+    def _load_function(
+        self, name: str, silent: bool = False, code_origin: Optional[str] = None
+    ) -> Optional[tuple[str, mlrun.runtimes.BaseRuntime]]:
+        """load a function from its definition, returns None if the function was skipped (when silent)"""
+        function_definition = self.spec._function_definitions.get(name)
+        if hasattr(function_definition, "to_dict"):
+            return _init_function_from_obj(
+                function_definition, self, name, code_origin=code_origin
+            )
+
+        if isinstance(function_definition, dict):
+            try:
+                return _init_function_from_dict(
+                    function_definition, self, name, code_origin=code_origin
+                )
+            except FileNotFoundError as exc:
+                message = (
+                    f"File {exc.filename} not found while syncing project functions."
+                )
+                if silent:
+                    message += " Skipping function reload"
+                    logger.warn(message, name=name)
+                    return None
+
+                raise mlrun.errors.MLRunMissingDependencyError(message) from exc
+
+            except Exception as exc:
+                if silent:
+                    logger.warn(
+                        "Failed to instantiate function",
+                        name=name,
+                        error=mlrun.utils.err_to_str(exc),
+                    )
+                    return None
+                raise exc
+
+        message = f"Function {name} must be an object or dict."
+        if silent:
+            message += " Skipping function reload"
+            logger.warn(message, name=name)
+            return None
+        raise ValueError(message)
+
     def with_secrets(self, kind, source, prefix=""):
         """register a secrets source (file, env or dict)
 
@@ -3983,8 +4054,9 @@ class MlrunProject(ModelObj):
         start_time_to: Optional[datetime.datetime] = None,
         last_update_time_from: Optional[datetime.datetime] = None,
         last_update_time_to: Optional[datetime.datetime] = None,
+        as_df: bool = False,
         **kwargs,
-    ) -> mlrun.lists.RunList:
+    ) -> typing.Union[mlrun.lists.RunList, pd.DataFrame]:
         """Retrieve a list of runs, filtered by various options.
 
         The returned result is a `` (list of dict), use `.to_objects()` to convert it to a list of RunObjects,
@@ -4024,6 +4096,8 @@ class MlrunProject(ModelObj):
         :param last_update_time_from: Filter by run last update time in ``(last_update_time_from,
             last_update_time_to)``.
         :param last_update_time_to: Filter by run last update time in ``(last_update_time_from, last_update_time_to)``.
+        :param as_df: Return the runs as a dataframe (like ``RunList.to_df()``), which is much faster for listing many
+            runs. Default is `False`.
         """
         if state:
             # TODO: Remove this in 1.9.0
@@ -4048,6 +4122,7 @@ class MlrunProject(ModelObj):
             start_time_to=start_time_to,
             last_update_time_from=last_update_time_from,
             last_update_time_to=last_update_time_to,
+            as_df=as_df,
             **kwargs,
         )
 
@@ -4483,6 +4558,7 @@ def _init_function_from_dict(
     f: dict,
     project: MlrunProject,
     name: typing.Optional[str] = None,
+    code_origin: typing.Optional[str] = None,
 ) -> tuple[str, mlrun.runtimes.BaseRuntime]:
     name = name or f.get("name", "")
     url = f.get("url", "")
@@ -4519,7 +4595,7 @@ def _init_function_from_dict(
 
     elif url.endswith(".ipynb"):
         # not defaulting kind to job here cause kind might come from magic annotations in the notebook
-        func = code_to_function(
+        func = _code_to_function_cached(
             name, filename=url, image=image, kind=kind, handler=handler, tag=tag
         )
 
@@ -4544,7 +4620,7 @@ def _init_function_from_dict(
                 tag=tag,
             )
         else:
-            func = code_to_function(
+            func = _code_to_function_cached(
                 name,
                 filename=url,
                 image=image,
@@ -4577,23 +4653,69 @@ def _init_function_from_dict(
             overwrite=True,
         )
 
-    return _init_function_from_obj(func, project)
+    return _init_function_from_obj(func, project, code_origin=code_origin)
+
+
+# compiled code functions cache, see _code_to_function_cached
+_compiled_functions_cache: collections.OrderedDict[tuple, dict] = (
+    collections.OrderedDict()
+)
+_compiled_functions_cache_lock = threading.Lock()
+
+
+def _code_to_function_cached(
+    name: str, filename: str, **kwargs
+) -> mlrun.runtimes.BaseRuntime:
+    """
+    code_to_function with an in-process LRU cache of the compiled function specs, keyed by the code file contents and
+    the function definition. Compiling a notebook/py file is relatively expensive and is done on every project load.
+    """
+    cache_size = int(mlrun.mlconf.projects.sync_functions.compiled_functions_cache_size)
+    if cache_size <= 0 or not os.path.isfile(filename):
+        return code_to_function(name, filename=filename, **kwargs)
+
+    with open(filename, "rb") as fp:
+        file_hash = hashlib.sha1(fp.read()).hexdigest()
+    key = (
+        os.path.abspath(filename),
+        file_hash,
+        name,
+        json.dumps(kwargs, sort_keys=True, default=str),
+        # the compiled spec depends on the configuration (defaults of the function spec, images, etc.)
+        _config_hash(),
+    )
+    with _compiled_functions_cache_lock:
+        function_struct = _compiled_functions_cache.get(key)
+        if function_struct is not None:
+            _compiled_functions_cache.move_to_end(key)
+
+    if function_struct is not None:
+        logger.debug("Using cached compiled function", name=name, filename=filename)
+        return new_function(runtime=function_struct)
+
+    func = code_to_function(name, filename=filename, **kwargs)
+    with _compiled_functions_cache_lock:
+        _compiled_functions_cache[key] = func.to_dict()
+        while len(_compiled_functions_cache) > cache_size:
+            _compiled_functions_cache.popitem(last=False)
+    return func
+
+
+def _config_hash() -> str:
+    return hashlib.sha1(
+        json.dumps(mlrun.mlconf.to_dict(), sort_keys=True, default=str).encode()
+    ).hexdigest()
 
 
 def _init_function_from_obj(
     func: mlrun.runtimes.BaseRuntime,
     project: MlrunProject,
     name: typing.Optional[str] = None,
+    code_origin: typing.Optional[str] = None,
 ) -> tuple[str, mlrun.runtimes.BaseRuntime]:
-    build = func.spec.build
-    if project.spec.origin_url:
-        origin = project.spec.origin_url
-        try:
-            if project.spec.repo:
-                origin += "#" + project.spec.repo.head.commit.hexsha
-        except Exception:
-            pass
-        build.code_origin = origin
+    code_origin = code_origin or _resolve_code_origin(project)
+    if code_origin:
+        func.spec.build.code_origin = code_origin
     if project.metadata.name:
         func.metadata.project = project.metadata.name
 
@@ -4606,6 +4728,19 @@ def _init_function_from_obj(
     return func.metadata.name, func
 
 
+def _resolve_code_origin(project: MlrunProject) -> typing.Optional[str]:
+    """the origin url of the project with the current commit of its repo (None if the project has no origin url)"""
+    if not project.spec.origin_url:
+        return None
+    origin = project.spec.origin_url
+    try:
+        if project.spec.repo:
+            origin += "#" + project.spec.repo.head.commit.hexsha
+    except Exception:
+        pass
+    return origin
+
+
 def _has_module(handler, kind):
     if not handler:
         return False
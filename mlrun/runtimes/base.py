@@ -30,7 +30,6 @@ import mlrun.common.schemas
 import mlrun.common.schemas.model_monitoring.constants as mm_constants
 import mlrun.db
 import mlrun.errors
-import mlrun.launcher.factory
 import mlrun.utils.helpers
 import mlrun.utils.notifications
 import mlrun.utils.regex
@@ -397,6 +396,9 @@ class BaseRuntime(ModelObj):
                              conjunction with the local=True argument.
         :return: Run context object (RunObject) with run metadata, results and status
         """
+        # import here to avoid circular imports (the launchers import mlrun.run, which imports the runtimes)
+        import mlrun.launcher.factory
+
         launcher = mlrun.launcher.factory.LauncherFactory().create_launcher(
             self._is_remote, local=local, **launcher_kwargs
         )
@@ -869,6 +871,9 @@ class BaseRuntime(ModelObj):
         but because we allow the user to set 'spec.image' for usability purposes,
         we need to check whether this is a built image or it requires to be built on top.
         """
+        # import here to avoid circular imports (the launchers import mlrun.run, which imports the runtimes)
+        import mlrun.launcher.factory
+
         launcher = mlrun.launcher.factory.LauncherFactory().create_launcher(
             is_remote=self._is_remote
         )
@@ -903,6 +908,9 @@ class BaseRuntime(ModelObj):
         return self
 
     def save(self, tag="", versioned=False, refresh=False) -> str:
+        # import here to avoid circular imports (the launchers import mlrun.run, which imports the runtimes)
+        import mlrun.launcher.factory
+
         launcher = mlrun.launcher.factory.LauncherFactory().create_launcher(
             is_remote=self._is_remote
         )
@@ -13,18 +13,22 @@
 # limitations under the License.
 
 import asyncio
+import concurrent.futures
+import itertools
 import json
+import time
 import typing
 import warnings
 from datetime import datetime
 from time import sleep
 
+import aiohttp
 import inflection
 import nuclio
 import nuclio.utils
 import requests
 import semver
-from aiohttp.client import ClientSession
+from aiohttp.client import ClientSession, TCPConnector
 from kubernetes import client
 from mlrun_pipelines.common.mounts import VolumeMount
 from mlrun_pipelines.common.ops import deploy_op
@@ -938,35 +942,10 @@ class RemoteRuntime(KubeResource):
         # clear the mock server when using the real endpoint
         self._mock_server = None
 
-        if "://" not in path:
-            if not self.status.address:
-                # here we check that if default http trigger is disabled, function contains a custom http trigger
-                # Otherwise, the function is not invokable, so we raise an error
-                if (
-                    not self._trigger_of_kind_exists(kind="http")
-                    and self.spec.disable_default_http_trigger
-                ):
-                    raise mlrun.errors.MLRunPreconditionFailedError(
-                        "Default http trigger creation is disabled and there is no any other custom http trigger, "
-                        "so function can not be invoked via http. Either enable default http trigger creation or "
-                        "create custom http trigger"
-                    )
-                state, _, _ = self._get_state(dashboard, auth_info=auth_info)
-                if state not in ["ready", "scaledToZero"]:
-                    logger.warning(f"Function is in the {state} state")
-                if not self.status.address:
-                    raise ValueError("no function address first run .deploy()")
-
-            path = self._resolve_invocation_url(path, force_external_address)
-
-        if headers is None:
-            headers = {}
-
-        # if function is scaled to zero, let the DLX know we want to wake it up
-        full_function_name = get_fullname(
-            self.metadata.name, self.metadata.project, self.metadata.tag
+        path = self._get_invocation_url(
+            path, force_external_address, auth_info, dashboard
         )
-        headers.setdefault("x-nuclio-target", full_function_name)
+        headers = self._enrich_invocation_headers(headers)
         if not http_client_kwargs:
             http_client_kwargs = {}
         if body:
@@ -993,6 +972,123 @@ class RemoteRuntime(KubeResource):
             data = json.loads(data)
         return data
 
+    def load_test(
+        self,
+        path: str,
+        bodies: list[typing.Union[str, bytes, dict]] = None,
+        concurrency: int = 10,
+        duration: float = 10.0,
+        rate: float = None,
+        method: str = None,
+        headers: dict = None,
+        force_external_address: bool = False,
+        auth_info: AuthInfo = None,
+        mock: bool = None,
+    ) -> "LoadTestResults":
+        """Load test the remote (live) function, or its mock server, and return the latency and throughput results
+
+        The test runs in one of two modes:
+
+        * closed-loop (the default) - ``concurrency`` clients send the requests one after the other, each as soon as
+          the response to its previous request arrives, for ``duration`` seconds
+        * open-loop (when ``rate`` is set) - requests are sent at a fixed rate of ``rate`` requests per second for
+          ``duration`` seconds, with up to ``concurrency`` requests in flight. The latency of a request is measured
+          from the time it was scheduled to, so it includes the time it waited for the function to catch up
+
+        When running against the mock server, the requests are processed by the graph in the current process one at a
+        time, so the results reflect the processing time of the graph itself.
+
+        example::
+
+            results = function.load_test(
+                "/v2/models/my-model/infer",
+                bodies=[{"inputs": x} for x in samples],
+                concurrency=20,
+                duration=30,
+            )
+            print(results)
+
+        :param path:        request sub path (e.g. /images), or a full url
+        :param bodies:      request bodies (str, bytes or a dict for json requests), sent in a round-robin order.
+                            when not set, the requests are sent without a body
+        :param concurrency: number of concurrent clients (closed-loop), or max requests in flight (open-loop)
+        :param duration:    test duration in seconds
+        :param rate:        requests per second, for an open-loop test
+        :param method:      HTTP method (GET, PUT, ..), defaults to POST when bodies are set and GET otherwise
+        :param headers:     key/value dict with http headers
+        :param force_external_address:   use the external ingress URL
+        :param auth_info:   service AuthInfo
+        :param mock:        use mock server vs a real Nuclio function (for local simulations)
+
+        :return: the load test results, with the latency percentiles, throughput and errors of the requests
+        """
+        if concurrency < 1:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "concurrency must be a positive integer"
+            )
+        if duration <= 0 or (rate is not None and rate <= 0):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "duration and rate must be positive"
+            )
+        bodies = list(bodies) if bodies else [None]
+        if not method:
+            method = "POST" if bodies[0] is not None else "GET"
+
+        # if no path was provided, use the default handler to be invoked
+        if not path and self.spec.default_handler:
+            path = self.spec.default_handler
+
+        if (self._mock_server and mock is None) or mlconf.use_nuclio_mock(mock):
+            if not self._mock_server:
+                self._set_as_mock(True)
+            mock_server = self._mock_server
+
+            async def send(_, body):
+                # the mock server processes the request synchronously, let the other clients run in between
+                await asyncio.sleep(0)
+                try:
+                    response = mock_server.test(
+                        path, body, method, headers, silent=True
+                    )
+                except Exception as exc:
+                    return type(exc).__name__
+                status_code = getattr(response, "status_code", None)
+                if status_code and status_code >= 400:
+                    return str(status_code)
+                return None
+
+            url = None
+        else:
+            self._mock_server = None
+            url = self._get_invocation_url(path, force_external_address, auth_info)
+            headers = self._enrich_invocation_headers(headers)
+
+            async def send(session, body):
+                try:
+                    status, _ = await request_async(session, method, url, body, headers)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    return type(exc).__name__
+                return str(status) if status >= 400 else None
+
+        logger.info(
+            "Load testing function",
+            url=url or path,
+            mock=url is None,
+            concurrency=concurrency,
+            duration=duration,
+            rate=rate,
+        )
+        load_test = run_load_test(send, bodies, concurrency, duration, rate)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(load_test)
+
+        # a loop is already running in this thread (e.g. in a jupyter notebook) and cannot be blocked on, so run the
+        # load test in its own loop on a separate thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, load_test).result()
+
     def with_sidecar(
         self,
         name: str = None,
@@ -1190,6 +1286,43 @@ class RemoteRuntime(KubeResource):
                 task.cancel()
         return results
 
+    def _get_invocation_url(
+        self, path, force_external_address, auth_info=None, dashboard=""
+    ):
+        if "://" in path:
+            return path
+
+        if not self.status.address:
+            # here we check that if default http trigger is disabled, function contains a custom http trigger
+            # Otherwise, the function is not invokable, so we raise an error
+            if (
+                not self._trigger_of_kind_exists(kind="http")
+                and self.spec.disable_default_http_trigger
+            ):
+                raise mlrun.errors.MLRunPreconditionFailedError(
+                    "Default http trigger creation is disabled and there is no any other custom http trigger, "
+                    "so function can not be invoked via http. Either enable default http trigger creation or "
+                    "create custom http trigger"
+                )
+            state, _, _ = self._get_state(dashboard, auth_info=auth_info)
+            if state not in ["ready", "scaledToZero"]:
+                logger.warning(f"Function is in the {state} state")
+            if not self.status.address:
+                raise ValueError("no function address first run .deploy()")
+
+        return self._resolve_invocation_url(path, force_external_address)
+
+    def _enrich_invocation_headers(self, headers):
+        if headers is None:
+            headers = {}
+
+        # if function is scaled to zero, let the DLX know we want to wake it up
+        full_function_name = get_fullname(
+            self.metadata.name, self.metadata.project, self.metadata.tag
+        )
+        headers.setdefault("x-nuclio-target", full_function_name)
+        return headers
+
     def _resolve_invocation_url(self, path, force_external_address):
         if not path.startswith("/") and path != "":
             path = f"/{path}"
@@ -1308,6 +1441,141 @@ async def submit(session, url, run, semaphore, headers=None):
             return response.status, text, logs, run
 
 
+async def request_async(session, method, url, body=None, headers=None):
+    kwargs = {}
+    if body:
+        if isinstance(body, (str, bytes)):
+            kwargs["data"] = body
+        else:
+            kwargs["json"] = body
+    async with session.request(method, url, headers=headers, **kwargs) as response:
+        content = await response.read()
+        return response.status, content
+
+
+class LoadTestResults:
+    """The results of a function load test (see RemoteRuntime.load_test)"""
+
+    def __init__(self, mode: str, concurrency: int, rate: float = None):
+        self.mode = mode
+        self.concurrency = concurrency
+        self.rate = rate
+        self.duration = 0.0
+        self.requests = 0
+        # the latencies (in seconds) of the successful requests
+        self.latencies: list[float] = []
+        # error (status code or exception name) -> count
+        self.errors: dict[str, int] = {}
+
+    def add(self, latency: float, error: typing.Optional[str] = None):
+        self.requests += 1
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        else:
+            self.latencies.append(latency)
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second"""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.requests if self.requests else 0.0
+
+    def latency_percentile(self, percentile: float) -> typing.Optional[float]:
+        """The latency (in seconds) of the given percentile (0-100) of the successful requests"""
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        # nearest-rank percentile
+        rank = max(int(-(-percentile * len(latencies) // 100)), 1)
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "rate": self.rate,
+            "duration": self.duration,
+            "requests": self.requests,
+            "throughput": self.throughput,
+            "latency_p50": self.latency_percentile(50),
+            "latency_p95": self.latency_percentile(95),
+            "latency_p99": self.latency_percentile(99),
+            "error_rate": self.error_rate,
+            "errors": dict(self.errors),
+        }
+
+    def __repr__(self):
+        latencies = ", ".join(
+            f"p{percentile}={self.latency_percentile(percentile) * 1000:.1f}ms"
+            for percentile in (50, 95, 99)
+            if self.latencies
+        )
+        return (
+            f"LoadTestResults({self.mode}: {self.requests} requests in {self.duration:.2f}s, "
+            f"{self.throughput:.1f} requests/sec, latency: {latencies or 'n/a'}, errors: {self.errors or 'none'})"
+        )
+
+
+async def run_load_test(
+    send: typing.Callable,
+    bodies: list,
+    concurrency: int,
+    duration: float,
+    rate: float = None,
+) -> LoadTestResults:
+    """
+    Send the bodies with the given send coroutine (which gets a session and a body, and returns an error or None) in
+    a closed-loop of concurrent clients, or in an open-loop of a fixed rate when the rate is set
+    """
+    results = LoadTestResults(
+        mode="open-loop" if rate else "closed-loop",
+        concurrency=concurrency,
+        rate=rate,
+    )
+    start = time.monotonic()
+    end = start + duration
+
+    async with ClientSession(connector=TCPConnector(limit=concurrency)) as session:
+        if rate:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def send_at(scheduled, body):
+                async with semaphore:
+                    error = await send(session, body)
+                # measured from the scheduled time, so the time the request waited for the function is included
+                results.add(time.monotonic() - scheduled, error)
+
+            requests = []
+            for index in range(int(duration * rate)):
+                scheduled = start + index / rate
+                await asyncio.sleep(max(scheduled - time.monotonic(), 0))
+                requests.append(
+                    asyncio.ensure_future(
+                        send_at(scheduled, bodies[index % len(bodies)])
+                    )
+                )
+            await asyncio.gather(*requests)
+
+        else:
+            # the clients send the bodies in a round-robin order between them
+            indices = itertools.count()
+
+            async def client():
+                while time.monotonic() < end:
+                    body = bodies[next(indices) % len(bodies)]
+                    request_start = time.monotonic()
+                    error = await send(session, body)
+                    results.add(time.monotonic() - request_start, error)
+
+            await asyncio.gather(*[client() for _ in range(concurrency)])
+
+    results.duration = time.monotonic() - start
+    return results
+
+
 def fake_nuclio_context(body, headers=None):
     return nuclio.Context(), nuclio.Event(body=body, headers=headers)
 
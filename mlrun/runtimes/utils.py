@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
+import contextvars
 import getpass
 import hashlib
 import json
 import os
 import re
+import threading
+import typing
 from io import StringIO
 from sys import stderr
 
@@ -52,6 +56,12 @@ class _ContextStore:
 
 global_context = _ContextStore()
 
+# when set (see code_metadata_cache), maps a code path to its resolved code metadata
+_code_metadata_cache: contextvars.ContextVar[typing.Optional[dict]] = (
+    contextvars.ContextVar("code_metadata_cache", default=None)
+)
+_code_metadata_cache_lock = threading.Lock()
+
 
 def resolve_spark_operator_version():
     try:
@@ -99,6 +109,21 @@ def log_std(db, runobj, out, err="", skip=False, show=True, silent=False):
             raise RunError(err)
 
 
+@contextlib.contextmanager
+def code_metadata_cache():
+    """
+    Cache the code metadata resolved by add_code_metadata within the context, so the git repository of a path is
+    opened only once (e.g. when loading many project functions). The cache is shared with threads that run with a
+    copy of the current context (contextvars.copy_context), which resolve the metadata one at a time, as GitPython
+    isn't thread safe.
+    """
+    token = _code_metadata_cache.set({})
+    try:
+        yield
+    finally:
+        _code_metadata_cache.reset(token)
+
+
 def add_code_metadata(path=""):
     if path:
         if "://" in path:
@@ -107,6 +132,16 @@ def add_code_metadata(path=""):
             path = os.path.dirname(path)
     path = path or "./"
 
+    cache = _code_metadata_cache.get()
+    if cache is None:
+        return _resolve_code_metadata(path)
+    with _code_metadata_cache_lock:
+        if path not in cache:
+            cache[path] = _resolve_code_metadata(path)
+        return cache[path]
+
+
+def _resolve_code_metadata(path):
     try:
         from git import (
             GitCommandNotFound,
@@ -25,7 +25,6 @@ import nuclio
 import mlrun
 from mlrun.errors import err_to_str
 from mlrun.platforms.iguazio import OutputStream
-from mlrun.runtimes.nuclio.function import RemoteRuntime
 
 serving_handler = "handler"
 
@@ -41,6 +40,9 @@ def new_v1_model_server(
     workers=8,
     canary=None,
 ):
+    # import here to avoid circular imports (the nuclio runtime imports the serving init functions)
+    from mlrun.runtimes.nuclio.function import RemoteRuntime
+
     f = RemoteRuntime()
     if not image:
         name, spec, code = nuclio.build_file(
@@ -40,7 +40,6 @@ import pandas
 import semver
 import yaml
 from dateutil import parser
-from mlrun_pipelines.models import PipelineRun
 from pandas import Timedelta, Timestamp
 from yaml.representer import RepresenterError
 
@@ -62,6 +61,10 @@ from .retryer import (  # noqa: F401
     create_step_backoff,
 )
 
+if typing.TYPE_CHECKING:
+    # importing the pipelines models loads kfp, which is only needed when working with pipelines
+    from mlrun_pipelines.models import PipelineRun
+
 yaml.Dumper.ignore_aliases = lambda *args: True
 _missing = object()
 
@@ -138,7 +141,8 @@ missing = object()
 
 is_ipython = False  # is IPython terminal, including Jupyter
 is_jupyter = False  # is Jupyter notebook/lab terminal
-try:
+# IPython is already loaded when running in it, and importing it otherwise would only slow down the import of mlrun
+if "IPython" in sys.modules:
     import IPython.core.getipython
 
     ipy = IPython.core.getipython.get_ipython()
@@ -151,8 +155,6 @@ try:
     )
 
     del ipy
-except ModuleNotFoundError:
-    pass
 
 if is_jupyter and config.nest_asyncio_enabled in ["1", "True"]:
     # bypass Jupyter asyncio bug
@@ -1348,7 +1350,7 @@ def is_link_artifact(artifact):
         return artifact.kind == mlrun.common.schemas.ArtifactCategories.link.value
 
 
-def format_run(run: PipelineRun, with_project=False) -> dict:
+def format_run(run: "PipelineRun", with_project=False) -> dict:
     fields = [
         "id",
         "name",
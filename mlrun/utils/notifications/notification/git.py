@@ -16,11 +16,10 @@ import json
 import os
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.errors
 import mlrun.lists
+import mlrun.utils.notifications.notification_loop
 
 from .base import NotificationBase
 
@@ -148,7 +147,9 @@ class GitNotification(NotificationBase):
             }
             url = f"https://{server}/repos/{repo}/issues/{issue}/comments"
 
-        async with aiohttp.ClientSession() as session:
+        async with mlrun.utils.notifications.notification_loop.client_session(
+            url
+        ) as session:
             resp = await session.post(url, headers=headers, json={"body": message})
             if not resp.ok:
                 resp_text = await resp.text()
@@ -14,11 +14,10 @@
 
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.lists
 import mlrun.utils.helpers
+import mlrun.utils.notifications.notification_loop
 
 from .base import NotificationBase
 
@@ -66,7 +65,9 @@ class SlackNotification(NotificationBase):
 
         data = self._generate_slack_data(message, severity, runs, alert, event_data)
 
-        async with aiohttp.ClientSession() as session:
+        async with mlrun.utils.notifications.notification_loop.client_session(
+            webhook
+        ) as session:
             async with session.post(webhook, json=data) as response:
                 response.raise_for_status()
 
@@ -14,11 +14,10 @@
 
 import typing
 
-import aiohttp
-
 import mlrun.common.schemas
 import mlrun.lists
 import mlrun.utils.helpers
+import mlrun.utils.notifications.notification_loop
 
 from .base import NotificationBase
 
@@ -85,11 +84,17 @@ class WebhookNotification(NotificationBase):
         # we automatically handle it as `ssl=None` for their convenience.
         verify_ssl = verify_ssl and None if url.startswith("https") else None
 
-        async with aiohttp.ClientSession() as session:
+        async with mlrun.utils.notifications.notification_loop.client_session(
+            url
+        ) as session:
             response = await getattr(session, method)(
                 url, headers=headers, json=request_body, ssl=verify_ssl
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
+            finally:
+                # return the connection to the (possibly shared) session's pool
+                response.release()
 
     @staticmethod
     def _serialize_runs_in_request_body(override_body, runs):
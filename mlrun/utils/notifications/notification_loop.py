@@ -0,0 +1,167 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import threading
+import time
+import typing
+import urllib.parse
+
+import aiohttp
+
+import mlrun.config
+import mlrun.errors
+from mlrun.utils import logger
+
+
+class NotificationLoop:
+    """
+    A long-lived event loop, running in a daemon thread, on which the process pushes its async notifications.
+    The loop owns a connection-pooled aiohttp session which is shared by all pushes, so consecutive notifications
+    to the same target reuse connections rather than paying the session setup and TLS handshake per notification.
+    Requests are bounded by a global concurrency limit and rate limited per target (host).
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._semaphore: typing.Optional[asyncio.Semaphore] = None
+        self._targets_locks: dict[str, asyncio.Lock] = collections.defaultdict(
+            asyncio.Lock
+        )
+        self._targets_next_request_time: dict[str, float] = {}
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run_loop, name="mlrun-notifications", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        return not self._closed and self._thread.is_alive()
+
+    def submit(self, coroutine: typing.Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the notification loop, returning a future of its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def is_current_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    @contextlib.asynccontextmanager
+    async def session(self, url: str):
+        """
+        Get the shared session for sending a request to the given url, once the concurrency and the target's rate
+        limits allow it. Must be used from within the notification loop.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(
+                mlrun.mlconf.notifications.max_concurrent_pushes
+            )
+        async with self._semaphore:
+            await self._wait_for_target(urllib.parse.urlparse(url).netloc)
+            yield self._get_session()
+
+    def close(self, timeout: float = 5):
+        if not self.running:
+            return
+        self._closed = True
+        try:
+            self.submit(self._close_session()).result(timeout)
+        except Exception as exc:
+            logger.warning(
+                "Failed closing notifications session",
+                exc=mlrun.errors.err_to_str(exc),
+            )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            config = mlrun.mlconf.notifications
+            connector = aiohttp.TCPConnector(
+                limit=config.max_connections,
+                limit_per_host=config.max_connections_per_target,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=config.request_timeout),
+            )
+        return self._session
+
+    async def _close_session(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _wait_for_target(self, target: str):
+        rate_limit = mlrun.mlconf.notifications.rate_limit_per_target
+        if not rate_limit:
+            return
+
+        # requests to the same target are spaced by the rate limit interval, the lock makes them wait in turns
+        async with self._targets_locks[target]:
+            now = time.monotonic()
+            next_request_time = self._targets_next_request_time.get(target, now)
+            if next_request_time > now:
+                await asyncio.sleep(next_request_time - now)
+            self._targets_next_request_time[target] = max(now, next_request_time) + (
+                1 / float(rate_limit)
+            )
+
+
+_notification_loop: typing.Optional[NotificationLoop] = None
+_notification_loop_lock = threading.Lock()
+
+
+def get_notification_loop() -> NotificationLoop:
+    """Get the process-wide notification loop, starting it on first use"""
+    global _notification_loop
+    if _notification_loop is None or not _notification_loop.running:
+        with _notification_loop_lock:
+            if _notification_loop is None or not _notification_loop.running:
+                _notification_loop = NotificationLoop()
+    return _notification_loop
+
+
+def close_notification_loop():
+    global _notification_loop
+    with _notification_loop_lock:
+        if _notification_loop is not None:
+            _notification_loop.close()
+            _notification_loop = None
+
+
+@contextlib.asynccontextmanager
+async def client_session(url: str):
+    """
+    Get an aiohttp session for sending a notification request to the given url.
+    When running on the notification loop, the shared pooled session is used. Otherwise (e.g. when a notification
+    push is awaited directly on another event loop) a dedicated session is opened for the request.
+    """
+    notification_loop = _notification_loop
+    if notification_loop is not None and notification_loop.is_current_loop():
+        async with notification_loop.session(url) as session:
+            yield session
+    else:
+        async with aiohttp.ClientSession() as session:
+            yield session
@@ -13,12 +13,12 @@
 # limitations under the License.
 
 import asyncio
+import concurrent.futures
 import datetime
 import os
 import re
 import traceback
 import typing
-from concurrent.futures import ThreadPoolExecutor
 
 import mlrun_pipelines.common.ops
 import mlrun_pipelines.models
@@ -37,60 +37,49 @@ from mlrun.utils import logger
 from mlrun.utils.condition_evaluator import evaluate_condition_in_separate_process
 
 from .notification import NotificationBase, NotificationTypes
+from .notification_loop import get_notification_loop
 
 
 class _NotificationPusherBase:
     def _push(
         self, sync_push_callback: typing.Callable, async_push_callback: typing.Callable
     ):
-        if mlrun.utils.helpers.is_running_in_jupyter_notebook():
-            # Running in Jupyter notebook.
-            # In this case, we need to create a new thread, run a separate event loop in
-            # that thread, and use it instead of the main_event_loop.
-            # This is necessary because Jupyter Notebook has its own event loop,
-            # but it runs in the main thread. As long as a cell is running,
-            # the event loop will not execute properly
-            self._run_coroutine_in_jupyter_notebook(
-                coroutine_method=async_push_callback
-            )
+        # async notifications are pushed on the long-lived notification loop, which runs in its own thread and owns
+        # the pooled http session shared by all pushes. this also applies to Jupyter Notebook, whose event loop runs
+        # in the main thread and won't execute properly as long as a cell is running
+        future = get_notification_loop().submit(async_push_callback())
+        if (
+            not self._is_event_loop_running()
+            or mlrun.utils.helpers.is_running_in_jupyter_notebook()
+        ):
+            # in a sync context (e.g. sdk or an api thread) or in a Jupyter Notebook cell, wait for all notifications
+            # to be pushed
+            future.result()
         else:
-            # Either running in mlrun api or sdk. in case of mlrun api we are in a separated thread, thus creating
-            # a new event loop. in case of sdk, we are most likely in main thread, thus using the main event loop.
-            try:
-                event_loop = asyncio.get_event_loop()
-            except RuntimeError:
-                event_loop = asyncio.new_event_loop()
-
-            if not event_loop.is_running():
-                event_loop.run_until_complete(async_push_callback())
-            else:
-                asyncio.run_coroutine_threadsafe(async_push_callback(), event_loop)
+            # an async caller can't be blocked, so the failures are only logged once the push is done
+            future.add_done_callback(self._log_push_failure)
 
         # then push sync notifications
         if not mlrun.config.is_running_as_api():
             sync_push_callback()
 
-    def _run_coroutine_in_jupyter_notebook(self, coroutine_method):
-        """
-        Execute a coroutine in a Jupyter Notebook environment.
-
-        This function creates a new thread pool executor with a single thread and a new event loop.
-        It sets the created event loop as the current event loop.
-        Then, it submits the coroutine to the event loop and waits for its completion.
-
-        This approach is used in Jupyter Notebook to ensure the proper execution of the event loop in a separate thread,
-        allowing for the asynchronous push operation to be executed while the notebook is running.
+    @staticmethod
+    def _log_push_failure(future: concurrent.futures.Future):
+        if future.cancelled():
+            logger.warning("Pushing async notifications was cancelled")
+        elif future.exception() is not None:
+            logger.warning(
+                "Failed to push async notifications",
+                error=mlrun.errors.err_to_str(future.exception()),
+            )
 
-        :param coroutine_method: The coroutine method to be executed.
-        :return: The result of the executed coroutine.
-        """
-        thread_pool_executor = ThreadPoolExecutor(1)
-        async_event_loop = asyncio.new_event_loop()
-        thread_pool_executor.submit(asyncio.set_event_loop, async_event_loop).result()
-        result = thread_pool_executor.submit(
-            async_event_loop.run_until_complete, coroutine_method()
-        ).result()
-        return result
+    @staticmethod
+    def _is_event_loop_running() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
 
 
 class NotificationPusher(_NotificationPusherBase):
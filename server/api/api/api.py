@@ -38,6 +38,7 @@ from server.api.api.endpoints import (
     internal,
     jobs,
     logs,
+    metrics,
     model_endpoints,
     model_monitoring,
     nuclio,
@@ -82,6 +83,14 @@ api_router.include_router(
     dependencies=[Depends(deps.authenticate_request)],
 )
 api_router.include_router(healthz.router, tags=["healthz"])
+api_router.include_router(
+    metrics.router,
+    tags=["metrics"],
+    dependencies=[
+        Depends(deps.authenticate_request),
+        Depends(deps.expose_metrics_endpoint),
+    ],
+)
 api_router.include_router(client_spec.router, tags=["client-spec"])
 api_router.include_router(clusterization_spec.router, tags=["clusterization-spec"])
 api_router.include_router(
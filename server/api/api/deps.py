@@ -75,6 +75,13 @@ def verify_api_state(request: Request):
             raise mlrun.errors.MLRunPreconditionFailedError(message)
 
 
+def expose_metrics_endpoint():
+    if not mlrun.mlconf.httpdb.metrics.enabled:
+        raise mlrun.errors.MLRunPreconditionFailedError(
+            "Metrics endpoint is not enabled"
+        )
+
+
 def expose_internal_endpoints(request: Request):
     if not mlrun.mlconf.debug.expose_internal_api_endpoints:
         path_with_query_string = uvicorn.protocols.utils.get_path_with_query_string(
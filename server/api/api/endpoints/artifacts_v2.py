@@ -142,6 +142,45 @@ async def store_artifact(
     )
 
 
+@router.post(
+    "/projects/{project}/artifacts/bulk-store",
+    response_model=mlrun.common.schemas.StoreArtifactsResponse,
+)
+async def store_artifacts(
+    project: str,
+    store_artifacts_request: mlrun.common.schemas.StoreArtifactsRequest,
+    auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    await run_in_threadpool(
+        server.api.utils.singletons.project_member.get_project_member().ensure_project,
+        db_session,
+        project,
+        auth_info=auth_info,
+    )
+
+    artifacts = [item.artifact for item in store_artifacts_request.artifacts]
+    logger.debug("Storing artifacts", project=project, artifacts_count=len(artifacts))
+    await server.api.utils.auth.verifier.AuthVerifier().query_project_resources_permissions(
+        mlrun.common.schemas.AuthorizationResourceTypes.artifact,
+        artifacts,
+        lambda artifact: (project, artifact.spec.db_key or artifact.metadata.key),
+        mlrun.common.schemas.AuthorizationAction.store,
+        auth_info,
+    )
+    uids = await run_in_threadpool(
+        server.api.crud.Artifacts().store_artifacts,
+        db_session,
+        [artifact.dict(exclude_none=True) for artifact in artifacts],
+        skip_if_exists=[
+            item.skip_if_exists for item in store_artifacts_request.artifacts
+        ],
+        project=project,
+        auth_info=auth_info,
+    )
+    return mlrun.common.schemas.StoreArtifactsResponse(uids=uids)
+
+
 @router.get("/projects/{project}/artifacts")
 async def list_artifacts(
     project: str,
@@ -72,6 +72,7 @@ async def get_log(
     uid: str,
     size: int = -1,
     offset: int = 0,
+    follow: bool = False,
     auth_info: mlrun.common.schemas.AuthInfo = fastapi.Depends(
         server.api.api.deps.authenticate_request
     ),
@@ -90,6 +91,20 @@ async def get_log(
         mlrun.common.schemas.AuthorizationAction.read,
         auth_info,
     )
+    if follow:
+        # server-sent events of new logs and state transitions, until the run is done
+        run_state, events_stream = await server.api.crud.Logs().follow_logs(
+            db_session, project, uid, offset
+        )
+        return fastapi.responses.StreamingResponse(
+            events_stream,
+            media_type="text/event-stream",
+            headers={
+                "x-mlrun-run-state": run_state,
+                "cache-control": "no-cache",
+            },
+        )
+
     run_state, log_stream = await server.api.crud.Logs().get_logs(
         db_session, project, uid, size, offset
     )
@@ -0,0 +1,37 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import http
+
+from fastapi import APIRouter, Response
+
+import server.api.utils.metrics
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    status_code=http.HTTPStatus.OK.value,
+)
+async def metrics():
+    """
+    Get the API server metrics in the prometheus text format: the duration of the HTTP requests (by their route path
+    template) and of the DB queries (by their operation and table), the HTTP requests in flight and the threadpools
+    tasks. The endpoint requires an authenticated request, and is served only when `httpdb.metrics.enabled` is set.
+    """
+    return Response(
+        content=server.api.utils.metrics.ServerMetrics().render(),
+        media_type=server.api.utils.metrics.content_type,
+    )
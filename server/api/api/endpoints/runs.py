@@ -22,6 +22,7 @@ from sqlalchemy.orm import Session
 
 import mlrun.common.runtimes.constants
 import mlrun.common.schemas
+import mlrun.lists
 import server.api.crud
 import server.api.utils.auth.verifier
 import server.api.utils.background_tasks
@@ -193,6 +194,7 @@ async def delete_run(
 )
 @router.get("/projects/{project}/runs")
 async def list_runs(
+    request: Request,
     project: str = None,
     name: str = None,
     uid: list[str] = Query([]),
@@ -270,6 +272,14 @@ async def list_runs(
         max_partitions=max_partitions,
         with_notifications=with_notifications,
     )
+
+    # the runs listing can be requested as an arrow stream of the run list rows, which is much lighter to serialize
+    # and to decode to a dataframe than the full runs (see RunList.to_arrow_stream)
+    if mlrun.lists.arrow_stream_media_type in request.headers.get("accept", ""):
+        return Response(
+            content=await run_in_threadpool(mlrun.lists.RunList(runs).to_arrow_stream),
+            media_type=mlrun.lists.arrow_stream_media_type,
+        )
     return {
         "runs": runs,
         "pagination": page_info,
@@ -76,6 +76,42 @@ class Artifacts(
             producer_id=producer_id,
         )
 
+    def store_artifacts(
+        self,
+        db_session: sqlalchemy.orm.Session,
+        artifacts: list[dict],
+        skip_if_exists: typing.Optional[list[bool]] = None,
+        project: str = None,
+        auth_info: mlrun.common.schemas.AuthInfo = None,
+    ) -> list[typing.Optional[str]]:
+        project = project or mlrun.mlconf.default_project
+        artifacts_to_store = []
+        for artifact in artifacts:
+            if not artifact.setdefault("project", project):
+                artifact["project"] = project
+
+            if artifact["project"] != project:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"Conflicting project name - storing artifact with project {artifact['project']}"
+                    f" into a different project: {project}."
+                )
+
+            self._resolve_artifact_size(artifact, auth_info)
+
+            # TODO: remove this in 1.8.0
+            if mlrun.utils.helpers.is_legacy_artifact(artifact):
+                artifact = mlrun.artifacts.base.convert_legacy_artifact_to_new_format(
+                    artifact
+                ).to_dict()
+            artifacts_to_store.append(artifact)
+
+        return server.api.utils.singletons.db.get_db().store_artifacts(
+            db_session,
+            project,
+            artifacts_to_store,
+            skip_if_exists=skip_if_exists,
+        )
+
     def create_artifact(
         self,
         db_session: sqlalchemy.orm.Session,
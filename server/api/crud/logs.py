@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import base64
+import json
 import os
 import pathlib
 import shutil
+import time
 import typing
 from http import HTTPStatus
 
@@ -24,9 +28,10 @@ from sqlalchemy.orm import Session
 import mlrun.common.schemas
 import mlrun.utils.singleton
 import server.api.api.utils
+import server.api.db.session
 import server.api.utils.clients.log_collector as log_collector
 import server.api.utils.singletons.k8s
-from mlrun.common.runtimes.constants import PodPhases
+from mlrun.common.runtimes.constants import PodPhases, RunStates
 from mlrun.utils import logger
 from server.api.constants import LogSources
 from server.api.utils.singletons.db import get_db
@@ -150,8 +155,123 @@ class Logs(
         :return: run state and logs
         """
         project = project or mlrun.mlconf.default_project
-        run = await self._get_run_for_log(db_session, project, uid)
-        run_state = run.get("status", {}).get("state", "")
+        run_state = await self._get_run_state_for_log(db_session, project, uid)
+        log_stream = self._get_log_stream(
+            db_session, project, uid, size, offset, source
+        )
+        return run_state, log_stream
+
+    async def follow_logs(
+        self,
+        db_session: Session,
+        project: str,
+        uid: str,
+        offset: int = 0,
+        source: LogSources = LogSources.AUTO,
+    ) -> tuple[str, typing.AsyncIterable[str]]:
+        """
+        Follow logs - stream server-sent events of the run state transitions and new log contents, until the run
+        reaches a terminal state and all of its logs were sent, or until the max follow duration has passed
+        :param db_session: db session, used only to verify the run exists, the stream itself uses its own sessions
+        :param project: project name
+        :param uid: run uid
+        :param offset: number of bytes to skip (default 0)
+        :param source: log source (default auto), same as in get_logs
+        :return: run state and the events stream
+        """
+        project = project or mlrun.mlconf.default_project
+        run_state = await self._get_run_state_for_log(db_session, project, uid)
+        return run_state, self._follow_logs_generator(project, uid, offset, source)
+
+    async def _follow_logs_generator(
+        self,
+        project: str,
+        uid: str,
+        offset: int = 0,
+        source: LogSources = LogSources.AUTO,
+    ) -> typing.AsyncIterable[str]:
+        follow_config = mlrun.mlconf.httpdb.logs.follow
+        size = int(mlrun.mlconf.httpdb.logs.pull_logs_default_size_limit)
+        poll_interval = float(follow_config.poll_interval)
+        heartbeat_interval = float(follow_config.heartbeat_interval)
+        deadline = time.monotonic() + float(follow_config.max_duration)
+        last_event_time = time.monotonic()
+        last_state = None
+        while True:
+            # the stream may be long-lived, use a short-lived session per poll to not hold a db connection
+            (
+                run_state,
+                log_contents,
+            ) = await server.api.db.session.run_async_function_with_new_db_session(
+                self._get_run_state_and_logs,
+                project,
+                uid,
+                size,
+                offset,
+                source,
+            )
+            if run_state != last_state:
+                last_state = run_state
+                last_event_time = time.monotonic()
+                yield self._format_follow_logs_event("state", state=run_state)
+
+            if log_contents:
+                last_event_time = time.monotonic()
+                yield self._format_follow_logs_event(
+                    "log",
+                    offset=offset,
+                    content=base64.b64encode(log_contents).decode(),
+                )
+                offset += len(log_contents)
+                if len(log_contents) >= size:
+                    # there are probably more logs pending, no need to wait
+                    continue
+
+            elif run_state in RunStates.terminal_states():
+                # the run has finished and all of its logs were sent
+                return
+
+            if time.monotonic() >= deadline:
+                # the client is expected to reconnect with its last offset
+                return
+
+            if time.monotonic() - last_event_time >= heartbeat_interval:
+                # keep the connection alive (and let the client know we are too) when there is nothing new
+                last_event_time = time.monotonic()
+                yield ": heartbeat\n\n"
+
+            await asyncio.sleep(poll_interval)
+
+    async def _get_run_state_and_logs(
+        self,
+        db_session: Session,
+        project: str,
+        uid: str,
+        size: int = -1,
+        offset: int = 0,
+        source: LogSources = LogSources.AUTO,
+    ) -> tuple[str, bytes]:
+        run_state = await self._get_run_state_for_log(db_session, project, uid)
+        log_contents = b""
+        async for log in self._get_log_stream(
+            db_session, project, uid, size, offset, source
+        ):
+            log_contents += log
+        return run_state, log_contents
+
+    @staticmethod
+    def _format_follow_logs_event(event: str, **data) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    def _get_log_stream(
+        self,
+        db_session: Session,
+        project: str,
+        uid: str,
+        size: int = -1,
+        offset: int = 0,
+        source: LogSources = LogSources.AUTO,
+    ) -> typing.AsyncIterable[bytes]:
         log_stream = None
         if (
             mlrun.mlconf.log_collector.mode
@@ -178,7 +298,6 @@ class Logs(
                     size,
                     offset,
                     source,
-                    run,
                 )
         elif (
             mlrun.mlconf.log_collector.mode
@@ -203,9 +322,8 @@ class Logs(
                 size,
                 offset,
                 source,
-                run,
             )
-        return run_state, log_stream
+        return log_stream
 
     @staticmethod
     async def _get_logs_from_logs_collector(
@@ -239,12 +357,6 @@ class Logs(
         project = project or mlrun.mlconf.default_project
         log_contents = b""
         log_file_exists, log_file = self.log_file_exists_for_run_uid(project, uid)
-        if not run:
-            run = get_db().read_run(db_session, uid, project)
-        if not run:
-            server.api.api.utils.log_and_raise(
-                HTTPStatus.NOT_FOUND.value, project=project, uid=uid
-            )
         if log_file_exists and source in [LogSources.AUTO, LogSources.PERSISTENCY]:
             with log_file.open("rb") as fp:
                 fp.seek(offset)
@@ -252,6 +364,12 @@ class Logs(
         elif source in [LogSources.AUTO, LogSources.K8S]:
             k8s = server.api.utils.singletons.k8s.get_k8s_helper()
             if k8s and k8s.is_running_inside_kubernetes_cluster():
+                if not run:
+                    run = get_db().read_run(db_session, uid, project)
+                if not run:
+                    server.api.api.utils.log_and_raise(
+                        HTTPStatus.NOT_FOUND.value, project=project, uid=uid
+                    )
                 run_kind = run.get("metadata", {}).get("labels", {}).get("kind")
                 pods = server.api.utils.singletons.k8s.get_k8s_helper().get_logger_pods(
                     project, uid, run_kind
@@ -301,13 +419,13 @@ class Logs(
         yield log_contents
 
     @staticmethod
-    async def _get_run_for_log(db_session: Session, project: str, uid: str) -> dict:
-        run = await run_in_threadpool(get_db().read_run, db_session, uid, project)
-        if not run:
-            server.api.api.utils.log_and_raise(
-                HTTPStatus.NOT_FOUND.value, project=project, uid=uid
-            )
-        return run
+    async def _get_run_state_for_log(
+        db_session: Session, project: str, uid: str
+    ) -> str:
+        # only the state is needed, avoid loading the whole run
+        return await run_in_threadpool(
+            get_db().read_run_state, db_session, uid, project
+        )
 
     @staticmethod
     async def _get_log_size_from_log_collector(project: str, run_uid: str) -> int:
@@ -106,6 +106,22 @@ class DBInterface(ABC):
     ):
         pass
 
+    def read_run_state(
+        self,
+        session,
+        uid: str,
+        project: str = None,
+        iter: int = 0,
+    ) -> str:
+        pass
+
+    def read_runs_by_identifiers(
+        self,
+        session,
+        identifiers: list[tuple[str, str, int]],
+    ) -> dict[tuple[str, str, int], dict]:
+        pass
+
     @abstractmethod
     def list_runs(
         self,
@@ -201,6 +217,15 @@ class DBInterface(ABC):
     ):
         pass
 
+    def store_artifacts(
+        self,
+        session,
+        project: str,
+        artifacts: list[dict],
+        skip_if_exists: typing.Optional[list[bool]] = None,
+    ) -> list[typing.Optional[str]]:
+        pass
+
     @abstractmethod
     def read_artifact(
         self,
@@ -17,6 +17,7 @@ import collections
 import functools
 import hashlib
 import pathlib
+import pickle
 import re
 import typing
 import urllib.parse
@@ -391,6 +392,61 @@ class SQLDB(DBInterface):
             self._fill_run_struct_with_notifications(run.notifications, run_struct)
         return run_struct
 
+    def read_run_state(
+        self,
+        session,
+        uid: str,
+        project: str = None,
+        iter: int = 0,
+    ) -> str:
+        """
+        Read only the state column of a run, without loading and unpickling the run body
+        """
+        project = project or config.default_project
+        run_state = (
+            self._query(session, Run, uid=uid, project=project, iteration=iter)
+            .with_entities(Run.state)
+            .one_or_none()
+        )
+        if not run_state:
+            raise mlrun.errors.MLRunNotFoundError(
+                f"Run uid {uid} of project {project} not found"
+            )
+        return run_state[0] or ""
+
+    def read_runs_by_identifiers(
+        self,
+        session,
+        identifiers: list[tuple[str, str, int]],
+    ) -> dict[tuple[str, str, int], dict]:
+        """
+        Read multiple runs using a single query
+        :param identifiers: list of (project, uid, iteration) tuples
+        :return: a mapping of (project, uid, iteration) to the run struct, runs that were not found are omitted
+        """
+        if not identifiers:
+            return {}
+
+        requested = {
+            (project, uid, int(iteration or 0))
+            for project, uid, iteration in identifiers
+        }
+        query = (
+            session.query(Run)
+            .with_entities(Run.project, Run.uid, Run.iteration, Run.body)
+            .filter(Run.uid.in_({uid for _, uid, _ in requested}))
+            .filter(Run.project.in_({project for project, _, _ in requested}))
+        )
+
+        runs = {}
+        for project, uid, iteration, body in query:
+            # uids are unique per project, but the query may also match on uid/project combinations (and
+            # iterations) that were not requested
+            identifier = (project, uid, iteration)
+            if identifier in requested:
+                runs[identifier] = pickle.loads(body)
+        return runs
+
     def list_runs(
         self,
         session,
@@ -723,6 +779,211 @@ class SQLDB(DBInterface):
 
         return uid
 
+    @retry_on_conflict
+    def store_artifacts(
+        self,
+        session,
+        project: str,
+        artifacts: list[dict],
+        skip_if_exists: typing.Optional[list[bool]] = None,
+    ) -> list[typing.Optional[str]]:
+        """
+        Store multiple artifacts of the same project in a single transaction.
+        The artifact key, tag, iteration and producer id are taken from each artifact's metadata (the db key from
+        the spec, if set). Existing artifacts are resolved with a single query (of only the versions with the stored
+        keys, iterations and producer ids) rather than one query per artifact, and the whole batch (including marking
+        the best iteration of link artifacts) is committed once.
+
+        :param session:         The DB session.
+        :param project:         The project the artifacts belong to.
+        :param artifacts:       The artifact dicts to store.
+        :param skip_if_exists:  Per artifact flag - if set, the artifact is not stored when an artifact with the same
+                                key, tag, iteration and producer id already exists.
+        :return: The uids of the stored artifacts, aligned with the given artifacts (None for skipped artifacts).
+        """
+        project = project or config.default_project
+        skip_if_exists = skip_if_exists or [False] * len(artifacts)
+        uids = [None] * len(artifacts)
+
+        artifacts_to_store = []
+        for index, artifact_dict in enumerate(artifacts):
+            metadata = artifact_dict.setdefault("metadata", {})
+            key = artifact_dict.get("spec", {}).get("db_key") or metadata.get("key")
+            if not key:
+                raise mlrun.errors.MLRunInvalidArgumentError("Artifact key is not set")
+            if not metadata.get("key"):
+                metadata["key"] = key
+            if not metadata.get("project"):
+                metadata["project"] = project
+            tag = metadata.get("tag") or "latest"
+            validate_tag_name(tag, "artifact.metadata.tag")
+            artifacts_to_store.append(
+                (
+                    index,
+                    key,
+                    tag,
+                    metadata.get("iter"),
+                    metadata.get("tree"),
+                    artifact_dict,
+                )
+            )
+
+        keys = {key for _, key, *_ in artifacts_to_store}
+        existing_artifacts = []
+        if keys:
+            # only the versions with the stored iteration (and producer id, if given) can match a stored artifact
+            lookups = {
+                (key, iteration or 0, producer_id)
+                for _, key, _, iteration, producer_id, _ in artifacts_to_store
+            }
+            existing_artifacts = (
+                self._query(session, ArtifactV2, project=project)
+                .filter(
+                    or_(
+                        *[
+                            and_(
+                                ArtifactV2.key == key,
+                                ArtifactV2.iteration == iteration,
+                                ArtifactV2.producer_id == producer_id,
+                            )
+                            if producer_id
+                            else and_(
+                                ArtifactV2.key == key,
+                                ArtifactV2.iteration == iteration,
+                            )
+                            for key, iteration, producer_id in lookups
+                        ]
+                    )
+                )
+                .all()
+            )
+
+        # index the existing artifacts by key and iteration, and by key and uid (which are unique per project)
+        existing_artifacts_by_iteration = collections.defaultdict(list)
+        existing_artifacts_by_uid = {}
+
+        def _index_artifact(artifact_record, iteration):
+            existing_artifacts_by_iteration[
+                (artifact_record.key, iteration or 0)
+            ].append(artifact_record)
+            existing_artifacts_by_uid[(artifact_record.key, artifact_record.uid)] = (
+                artifact_record
+            )
+
+        for existing_artifact in existing_artifacts:
+            _index_artifact(existing_artifact, existing_artifact.iteration)
+
+        existing_tags = set()
+        if any(skip_if_exists):
+            existing_tags = set(
+                self._query(session, ArtifactV2.Tag, project=project)
+                .with_entities(ArtifactV2.Tag.obj_id, ArtifactV2.Tag.name)
+                .filter(ArtifactV2.Tag.obj_name.in_(keys))
+                .all()
+            )
+
+        def _find_existing_artifact(key, iteration, producer_id, uid=None, tag=None):
+            if uid:
+                candidates = [existing_artifacts_by_uid.get((key, uid))]
+            else:
+                candidates = existing_artifacts_by_iteration[(key, iteration or 0)]
+            for existing_artifact in candidates:
+                if (
+                    existing_artifact is not None
+                    and existing_artifact.iteration == (iteration or 0)
+                    and (
+                        not producer_id or existing_artifact.producer_id == producer_id
+                    )
+                    and (
+                        not tag
+                        or existing_artifact.id is None
+                        or (existing_artifact.id, tag) in existing_tags
+                    )
+                ):
+                    return existing_artifact
+            return None
+
+        db_artifacts = []
+        best_iteration_artifacts = []
+        artifacts_by_tag = collections.defaultdict(dict)
+        for (
+            index,
+            key,
+            tag,
+            iteration,
+            producer_id,
+            artifact_dict,
+        ) in artifacts_to_store:
+            if skip_if_exists[index] and _find_existing_artifact(
+                key, iteration, producer_id, tag=tag
+            ):
+                logger.debug(
+                    "Artifact already exists, skipping",
+                    project=project,
+                    key=key,
+                    tag=tag,
+                    iteration=iteration,
+                    producer_id=producer_id,
+                )
+                continue
+
+            # link artifacts only mark the best iteration of an existing artifact
+            if (
+                artifact_dict.get("kind")
+                == mlrun.common.schemas.ArtifactCategories.link.value
+            ):
+                uids[index] = self._mark_best_iteration_artifact(
+                    session,
+                    project,
+                    key,
+                    artifact_dict,
+                    artifacts_to_commit=best_iteration_artifacts,
+                )
+                continue
+
+            uid = fill_artifact_object_hash(artifact_dict, iteration, producer_id)
+            db_artifact = _find_existing_artifact(key, iteration, producer_id, uid)
+            if not db_artifact:
+                validate_artifact_key_name(key, "artifact.key")
+                db_artifact = ArtifactV2(project=project, key=key)
+                db_artifact.uid = uid
+                _index_artifact(db_artifact, iteration)
+
+                # tag new artifacts also as "latest", same as when storing a single artifact
+                artifacts_by_tag["latest"][key] = db_artifact
+
+            self._update_artifact_record_from_dict(
+                db_artifact,
+                artifact_dict,
+                project,
+                key,
+                uid,
+                iteration,
+                not iteration,
+                producer_id,
+            )
+            db_artifacts.append(db_artifact)
+            artifacts_by_tag[tag][key] = db_artifact
+            uids[index] = uid
+
+        if db_artifacts:
+            session.add_all(db_artifacts)
+            session.flush()
+            for tag, tagged_artifacts in artifacts_by_tag.items():
+                self.tag_artifacts(
+                    session, tag, list(tagged_artifacts.values()), project, commit=False
+                )
+        if db_artifacts or best_iteration_artifacts:
+            self._commit(session, db_artifacts + best_iteration_artifacts)
+
+        logger.debug(
+            "Stored artifacts",
+            project=project,
+            requested=len(artifacts),
+            stored=len(db_artifacts),
+        )
+        return uids
+
     def list_artifacts(
         self,
         session,
@@ -1069,6 +1330,7 @@ class SQLDB(DBInterface):
         tag_name: str,
         artifacts,
         project: str,
+        commit: bool = True,
     ):
         artifacts_keys = [artifact.key for artifact in artifacts]
         if not artifacts_keys:
@@ -1170,6 +1432,10 @@ class SQLDB(DBInterface):
 
         # commit the changes, including the deletion of the old tags and the creation of the new tags
         # this will also release the locks on the artifacts' rows
+        # when tagging as part of a wider transaction, the caller is responsible for committing
+        if not commit:
+            session.flush()
+            return
         self._commit(session, objects)
 
         logger.debug(
@@ -1186,8 +1452,18 @@ class SQLDB(DBInterface):
         key,
         link_artifact,
         uid=None,
+        artifacts_to_commit: typing.Optional[list] = None,
     ):
-        artifacts_to_commit = []
+        """
+        Mark the iteration the link artifact points to as the best iteration of its artifact.
+
+        :param artifacts_to_commit: When marking as part of a wider transaction, the updated artifacts are added to the
+                                    session and appended to this list, and the caller is responsible for committing
+                                    them. Otherwise, they are committed right away.
+        :return: The uid of the best iteration artifact.
+        """
+        commit = artifacts_to_commit is None
+        artifacts_to_commit = [] if commit else artifacts_to_commit
 
         # get the artifact record from the db
         link_iteration = link_artifact.get("spec", {}).get("link_iteration")
@@ -1250,6 +1526,9 @@ class SQLDB(DBInterface):
         best_iteration_artifact_record.best_iteration = True
         artifacts_to_commit.append(best_iteration_artifact_record)
 
+        if not commit:
+            session.add_all(artifacts_to_commit)
+            return best_iteration_artifact_record.uid
         self._upsert(session, artifacts_to_commit)
 
         return best_iteration_artifact_record.uid
@@ -14,7 +14,6 @@
 #
 import asyncio
 import collections
-import concurrent.futures
 import contextlib
 import datetime
 import traceback
@@ -32,6 +31,7 @@ import mlrun.errors
 import mlrun.lists
 import mlrun.utils
 import mlrun.utils.notifications
+import mlrun.utils.notifications.notification_loop
 import mlrun.utils.version
 import server.api.api.utils
 import server.api.constants
@@ -42,6 +42,7 @@ import server.api.middlewares
 import server.api.runtime_handlers
 import server.api.utils.clients.chief
 import server.api.utils.clients.log_collector
+import server.api.utils.metrics
 import server.api.utils.notification_pusher
 import server.api.utils.time_window_tracker
 from mlrun.config import config
@@ -118,6 +119,12 @@ app.add_middleware(
 app.add_middleware(
     server.api.middlewares.UiClearCacheMiddleware, backend_version=config.version
 )
+app.add_middleware(
+    server.api.middlewares.ResponseCompressionMiddleware,
+    encodings=config.httpdb.compression.encodings,
+    minimum_size=config.httpdb.compression.minimum_size,
+)
+app.add_middleware(server.api.middlewares.MetricsMiddleware)
 app.add_middleware(server.api.middlewares.RequestLoggerMiddleware, logger=logger)
 
 
@@ -176,8 +183,8 @@ async def setup_api():
     )
     loop = asyncio.get_running_loop()
     loop.set_default_executor(
-        concurrent.futures.ThreadPoolExecutor(
-            max_workers=int(config.httpdb.max_workers)
+        server.api.utils.metrics.InstrumentedThreadPoolExecutor(
+            "default_executor", max_workers=int(config.httpdb.max_workers)
         )
     )
 
@@ -211,6 +218,9 @@ async def teardown_api():
     cancel_all_periodic_functions()
     if get_scheduler():
         await get_scheduler().stop()
+    await fastapi.concurrency.run_in_threadpool(
+        mlrun.utils.notifications.notification_loop.close_notification_loop
+    )
 
 
 async def move_api_to_online():
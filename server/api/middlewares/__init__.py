@@ -14,5 +14,7 @@
 #
 
 from .ensure_be_version import EnsureBackendVersionMiddleware
+from .metrics import MetricsMiddleware
 from .request_logger import RequestLoggerMiddleware
+from .response_compression import ResponseCompressionMiddleware
 from .ui_clear_cache import UiClearCacheMiddleware
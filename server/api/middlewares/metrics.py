@@ -0,0 +1,67 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+from starlette.types import Message
+from uvicorn._types import (
+    ASGI3Application,
+    ASGIReceiveCallable,
+    ASGISendCallable,
+    Scope,
+)
+
+import server.api.utils.metrics
+
+
+class MetricsMiddleware:
+    def __init__(
+        self,
+        app: "ASGI3Application",
+    ) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: "Scope", receive: "ASGIReceiveCallable", send: "ASGISendCallable"
+    ) -> None:
+        """
+        This middleware measures the duration of the requests by their route path template (so that requests to
+        different resources of the same route are measured together), and the number of the requests in flight.
+        """
+        if scope["type"] not in ("http",):
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        # the status is 500 unless a response was started, as the exception is transformed to 500 response later
+        status_code = 500
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics = server.api.utils.metrics.ServerMetrics()
+        metrics.requests_in_flight.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.requests_in_flight.dec((method,))
+            # the matched route is set on the scope by the router
+            route = scope.get("route")
+            metrics.request_duration.observe(
+                (method, getattr(route, "path", "unmatched"), str(status_code)),
+                time.perf_counter() - start_time,
+            )
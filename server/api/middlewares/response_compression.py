@@ -0,0 +1,189 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import typing
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import Message
+from uvicorn._types import (
+    ASGI3Application,
+    ASGIReceiveCallable,
+    ASGISendCallable,
+    Scope,
+)
+
+from mlrun.config import config
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# large bodies are compressed and sent in chunks of this size, so that sending starts before the whole body is
+# compressed
+stream_chunk_size = 1024 * 1024
+
+
+class _GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(
+            config.httpdb.compression.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        # sync flush the data that was compressed so far, so that each streamed chunk can be decompressed on arrival
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class _ZstdCompressor:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(
+            level=config.httpdb.compression.zstd_level
+        ).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+            if final
+            else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+
+_compressors = {"gzip": _GzipCompressor}
+if zstandard is not None:
+    _compressors["zstd"] = _ZstdCompressor
+
+
+class ResponseCompressionMiddleware:
+    def __init__(
+        self,
+        app: "ASGI3Application",
+        encodings: str,
+        minimum_size: int,
+    ) -> None:
+        self.app = app
+        self._encodings = [
+            encoding.strip()
+            for encoding in encodings.split(",")
+            if encoding.strip() in _compressors
+        ]
+        self._minimum_size = minimum_size
+
+    async def __call__(
+        self, scope: "Scope", receive: "ASGIReceiveCallable", send: "ASGISendCallable"
+    ) -> None:
+        """
+        This middleware compresses the responses with the preferred encoding that the client accepts.
+        Responses that are smaller than the minimum size, already encoded, or server-sent events aren't compressed.
+        """
+        if scope["type"] not in ("http",) or not self._encodings:
+            return await self.app(scope, receive, send)
+
+        encoding = self._resolve_encoding(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if not encoding:
+
+            async def send_with_vary_header(message: Message) -> None:
+                # the response depends on the accept-encoding header, even when it isn't compressed
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+                await send(message)
+
+            return await self.app(scope, receive, send_with_vary_header)
+
+        start_message: typing.Optional[Message] = None
+        compressor = None
+        compress = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, compress
+            if message["type"] == "http.response.start":
+                # hold the start message until the first body message, whose size determines whether to compress
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start_message is not None:
+                headers = MutableHeaders(scope=start_message)
+                headers.add_vary_header("Accept-Encoding")
+                compress = (
+                    "content-encoding" not in headers
+                    and not headers.get("content-type", "").startswith(
+                        "text/event-stream"
+                    )
+                    and (more_body or len(body) >= self._minimum_size)
+                )
+                if compress:
+                    compressor = _compressors[encoding]()
+                    headers["Content-Encoding"] = encoding
+                    # the length of a compressed body is known only when it is sent whole
+                    if "content-length" in headers:
+                        del headers["content-length"]
+                    if not more_body and len(body) <= stream_chunk_size:
+                        body = compressor.compress(body, final=True)
+                        headers["Content-Length"] = str(len(body))
+                        await send(start_message)
+                        start_message = None
+                        return await send({"type": "http.response.body", "body": body})
+                await send(start_message)
+                start_message = None
+
+            if not compress:
+                return await send(message)
+
+            for offset in range(0, max(len(body), 1), stream_chunk_size):
+                chunk = body[offset : offset + stream_chunk_size]
+                final = not more_body and offset + stream_chunk_size >= len(body)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": compressor.compress(chunk, final=final),
+                        "more_body": not final,
+                    }
+                )
+
+        return await self.app(scope, receive, send_wrapper)
+
+    def _resolve_encoding(self, accept_encoding: str) -> typing.Optional[str]:
+        """
+        Get the encoding to compress the response with, the one with the highest quality value in the accept-encoding
+        header, and by the order of preference of the encodings when there are several
+        """
+        qualities = {}
+        for accepted in accept_encoding.split(","):
+            name, *parameters = accepted.split(";")
+            quality = 1.0
+            for parameter in parameters:
+                key, _, value = parameter.strip().partition("=")
+                if key == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[name.strip().lower()] = quality
+
+        encoding, quality = None, 0.0
+        for candidate in self._encodings:
+            candidate_quality = qualities.get(candidate, qualities.get("*", 0.0))
+            if candidate_quality > quality:
+                encoding, quality = candidate, candidate_quality
+        return encoding
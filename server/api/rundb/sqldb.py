@@ -24,6 +24,7 @@ import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.common.schemas.artifact
 import mlrun.db.factory
+import mlrun.lists
 import mlrun.model_monitoring.model_endpoint
 import server.api.crud
 import server.api.db.session
@@ -139,8 +140,9 @@ class SQLRunDB(RunDBInterface):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        as_df: bool = False,
     ):
-        return self._transform_db_error(
+        runs = self._transform_db_error(
             server.api.db.session.run_function_with_new_db_session,
             server.api.crud.Runs().list_runs,
             name=name,
@@ -164,6 +166,9 @@ class SQLRunDB(RunDBInterface):
             max_partitions=max_partitions,
             with_notifications=with_notifications,
         )
+        if as_df:
+            return mlrun.lists.RunList(runs).to_df()
+        return runs
 
     async def del_run(self, uid, project=None, iter=None):
         return await self._transform_db_error(
@@ -14,9 +14,11 @@
 #
 
 import asyncio
+import collections
 import contextlib
 import copy
 import datetime
+import time
 import typing
 
 import humanfriendly
@@ -61,6 +63,24 @@ class Provider(
         # owner id -> allowed project -> ttl
         self._allowed_project_owners_cache: dict[str, dict[str, datetime]] = {}
 
+        self._decisions_cache_ttl_seconds = humanfriendly.parse_timespan(
+            mlrun.mlconf.httpdb.authorization.opa.decisions_cache_ttl
+        )
+        self._decisions_cache_max_size = int(
+            mlrun.mlconf.httpdb.authorization.opa.decisions_cache_max_size
+        )
+        # (member ids, action, resource) -> (allowed, expiration monotonic time), in insertion order, which is also the
+        # order of expiration as all the decisions have the same ttl
+        self._decisions_cache: collections.OrderedDict[
+            tuple[tuple[str, ...], str, str], tuple[bool, float]
+        ] = collections.OrderedDict()
+        self._filter_request_chunk_size = int(
+            mlrun.mlconf.httpdb.authorization.opa.filter_request_chunk_size
+        )
+        self._max_concurrent_filter_requests = int(
+            mlrun.mlconf.httpdb.authorization.opa.max_concurrent_filter_requests
+        )
+
     async def query_permissions(
         self,
         resource: str,
@@ -92,16 +112,19 @@ class Provider(
             return True
         if self._check_allowed_project_owners_cache(resource, auth_info):
             return True
-        body = self._generate_permission_request_body(resource, action, auth_info)
-        if self._log_level > 5:
-            logger.debug("Sending request to OPA", body=body)
-        async with self._send_request_to_api(
-            "POST", self._permission_query_path, json=body
-        ) as response:
-            response_body = await response.json()
-        if self._log_level > 5:
-            logger.debug("Received response from OPA", body=response_body)
-        allowed = response_body["result"]
+        allowed = self._get_cached_decision(resource, action, auth_info)
+        if allowed is None:
+            body = self._generate_permission_request_body(resource, action, auth_info)
+            if self._log_level > 5:
+                logger.debug("Sending request to OPA", body=body)
+            async with self._send_request_to_api(
+                "POST", self._permission_query_path, json=body
+            ) as response:
+                response_body = await response.json()
+            if self._log_level > 5:
+                logger.debug("Received response from OPA", body=response_body)
+            allowed = response_body["result"]
+            self._cache_decision(resource, action, auth_info, allowed)
         if not allowed and raise_on_forbidden:
             raise mlrun.errors.MLRunAccessDeniedError(
                 f"Not allowed to {action} resource {resource}"
@@ -122,32 +145,73 @@ class Provider(
             auth_info.projects_role, leader_name=self._leader_name
         ):
             return resources
-        opa_resources = []
-        for resource in resources:
-            opa_resources.append(opa_resource_extractor(resource))
-        allowed_by_cache = True
+        opa_resources = [opa_resource_extractor(resource) for resource in resources]
+
+        # resolve each (distinct) resource by the caches, and filter only the rest through opa
+        allowed_opa_resources = set()
+        opa_resources_to_filter = []
+        for opa_resource in dict.fromkeys(opa_resources):
+            if self._check_allowed_project_owners_cache(opa_resource, auth_info):
+                allowed_opa_resources.add(opa_resource)
+                continue
+            allowed = self._get_cached_decision(opa_resource, action, auth_info)
+            if allowed is None:
+                opa_resources_to_filter.append(opa_resource)
+            elif allowed:
+                allowed_opa_resources.add(opa_resource)
+
+        if opa_resources_to_filter:
+            allowed_opa_resources.update(
+                await self._filter_opa_resources(
+                    opa_resources_to_filter, action, auth_info
+                )
+            )
+        return [
+            resource
+            for resource, opa_resource in zip(resources, opa_resources)
+            if opa_resource in allowed_opa_resources
+        ]
+
+    async def _filter_opa_resources(
+        self,
+        opa_resources: list[str],
+        action: mlrun.common.schemas.AuthorizationAction,
+        auth_info: mlrun.common.schemas.AuthInfo,
+    ) -> set[str]:
+        """Filter the allowed resources through opa, in concurrent requests of chunks of the resources"""
+        semaphore = asyncio.Semaphore(max(self._max_concurrent_filter_requests, 1))
+        chunk_size = max(self._filter_request_chunk_size, 1)
+
+        async def _filter_chunk(chunk: list[str]) -> list[str]:
+            body = self._generate_filter_request_body(chunk, action, auth_info)
+            async with semaphore:
+                if self._log_level > 5:
+                    logger.debug("Sending filter request to OPA", body=body)
+                async with self._send_request_to_api(
+                    "POST", self._permission_filter_path, json=body
+                ) as response:
+                    response_body = await response.json()
+            if self._log_level > 5:
+                logger.debug("Received filter response from OPA", body=response_body)
+            return response_body["result"]
+
+        chunks_results = await asyncio.gather(
+            *[
+                _filter_chunk(opa_resources[start : start + chunk_size])
+                for start in range(0, len(opa_resources), chunk_size)
+            ]
+        )
+        allowed_opa_resources = set()
+        for chunk_result in chunks_results:
+            allowed_opa_resources.update(chunk_result)
         for opa_resource in opa_resources:
-            # allow by cache only if all resources allowed by cache
-            if not self._check_allowed_project_owners_cache(opa_resource, auth_info):
-                allowed_by_cache = False
-                break
-        if allowed_by_cache:
-            return resources
-        body = self._generate_filter_request_body(opa_resources, action, auth_info)
-        if self._log_level > 5:
-            logger.debug("Sending filter request to OPA", body=body)
-        async with self._send_request_to_api(
-            "POST", self._permission_filter_path, json=body
-        ) as response:
-            response_body = await response.json()
-        if self._log_level > 5:
-            logger.debug("Received filter response from OPA", body=response_body)
-        allowed_opa_resources = response_body["result"]
-        allowed_resources = []
-        for index, opa_resource in enumerate(opa_resources):
-            if opa_resource in allowed_opa_resources:
-                allowed_resources.append(resources[index])
-        return allowed_resources
+            self._cache_decision(
+                opa_resource,
+                action,
+                auth_info,
+                opa_resource in allowed_opa_resources,
+            )
+        return allowed_opa_resources
 
     def add_allowed_project_for_owner(
         self, project_name: str, auth_info: mlrun.common.schemas.AuthInfo
@@ -199,6 +263,76 @@ class Provider(
         for user_id in user_ids_to_remove:
             del self._allowed_project_owners_cache[user_id]
 
+    def _get_cached_decision(
+        self,
+        resource: str,
+        action: mlrun.common.schemas.AuthorizationAction,
+        auth_info: mlrun.common.schemas.AuthInfo,
+    ) -> typing.Optional[bool]:
+        """
+        Get the cached decision of whether the user is allowed the action on the resource, or on a wildcard resource
+        that covers it. None when there is no such decision cached.
+        """
+        if not self._decisions_cache_ttl_seconds:
+            return None
+        self._clean_expired_decisions_from_cache()
+        member_ids = tuple(sorted(auth_info.get_member_ids()))
+        decision = self._decisions_cache.get((member_ids, str(action), resource))
+        if decision is not None:
+            return decision[0]
+
+        # only allowed decisions of wildcard resources apply to the resources they cover
+        for wildcard_resource in self._get_wildcard_resources(resource):
+            decision = self._decisions_cache.get(
+                (member_ids, str(action), wildcard_resource)
+            )
+            if decision is not None and decision[0]:
+                return True
+        return None
+
+    def _cache_decision(
+        self,
+        resource: str,
+        action: mlrun.common.schemas.AuthorizationAction,
+        auth_info: mlrun.common.schemas.AuthInfo,
+        allowed: bool,
+    ):
+        if not self._decisions_cache_ttl_seconds:
+            return
+        key = (tuple(sorted(auth_info.get_member_ids())), str(action), resource)
+        self._decisions_cache.pop(key, None)
+        self._decisions_cache[key] = (
+            allowed,
+            time.monotonic() + self._decisions_cache_ttl_seconds,
+        )
+        while len(self._decisions_cache) > self._decisions_cache_max_size:
+            self._decisions_cache.popitem(last=False)
+
+    def _clean_expired_decisions_from_cache(self):
+        now = time.monotonic()
+        while self._decisions_cache:
+            key, (_, expiration) = next(iter(self._decisions_cache.items()))
+            if expiration > now:
+                break
+            del self._decisions_cache[key]
+
+    @staticmethod
+    def _get_wildcard_resources(resource: str) -> list[str]:
+        """
+        Get the wildcard resources that cover a project resource, e.g. /projects/<project>/functions/* and
+        /projects/*/functions/* for /projects/<project>/functions/<name>
+        """
+        parts = resource.split("/")
+        # "", "projects", <project>, <resource type>, <resource name>, ...
+        if len(parts) < 5 or parts[1] != "projects" or parts[4] == "*":
+            return []
+        wildcard_resources = []
+        for project in dict.fromkeys([parts[2], "*"]):
+            wildcard_resources.append(
+                "/".join(parts[:2] + [project, parts[3], "*"] + parts[5:])
+            )
+        return wildcard_resources
+
     @contextlib.asynccontextmanager
     async def _send_request_to_api(self, method, path, **kwargs):
         url = f"{self._api_url}{path}"
@@ -347,14 +347,19 @@ class Client(
     async def _convert_requests_response_to_fastapi_response(
         chief_response: aiohttp.ClientResponse,
     ) -> fastapi.Response:
+        # chief_response.headers is of type CaseInsensitiveDict
+        headers = dict(chief_response.headers)
+        # the body is decompressed by the http client, the response is compressed again (if at all) by the worker
+        for header in ["Content-Encoding", "Content-Length"]:
+            headers.pop(header, None)
+            headers.pop(header.lower(), None)
+
         # based on the way we implemented the exception handling for endpoints in MLRun we can expect the media type
         # of the response to be of type application/json, see server.api.http_status_error_handler for reference
         return fastapi.responses.Response(
             content=await chief_response.text(),
             status_code=chief_response.status,
-            headers=dict(
-                chief_response.headers
-            ),  # chief_response.headers is of type CaseInsensitiveDict
+            headers=headers,
             media_type="application/json",
         )
 
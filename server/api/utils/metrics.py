@@ -0,0 +1,287 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import bisect
+import concurrent.futures
+import re
+import threading
+import time
+
+import anyio.to_thread
+import sqlalchemy.engine
+import sqlalchemy.event
+
+import mlrun.utils.singleton
+
+# the content type of the prometheus text exposition format
+content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+request_duration_buckets = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1,
+    2.5,
+    5,
+    7.5,
+    10,
+)
+db_query_duration_buckets = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+)
+
+# the table of a query is the first one it reads from or writes to (skipping subqueries)
+_query_table_regex = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+[`\"]?(\w+)", re.IGNORECASE)
+
+
+class _Metric:
+    type_ = ""
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        # observed from the threadpool threads as well (e.g. db queries)
+        self._lock = threading.Lock()
+
+    def collect(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_}",
+        ]
+
+    def _format_labels(self, labels: tuple, **extra_labels) -> str:
+        pairs = list(zip(self.label_names, labels)) + list(extra_labels.items())
+        if not pairs:
+            return ""
+        formatted = ",".join(
+            f'{name}="{_escape_label_value(value)}"' for name, value in pairs
+        )
+        return f"{{{formatted}}}"
+
+
+class Gauge(_Metric):
+    type_ = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]):
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: tuple = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+    def set(self, labels: tuple = (), value: float = 0):
+        with self._lock:
+            self._values[labels] = value
+
+    def collect(self) -> list[str]:
+        lines = super().collect()
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{self._format_labels(labels)} {value}")
+        return lines
+
+
+class Histogram(_Metric):
+    type_ = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...],
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+        # labels -> (count per bucket (the last is +Inf, not cumulative), sum)
+        self._observations: dict[tuple, tuple[list[int], float]] = {}
+
+    def observe(self, labels: tuple, value: float):
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._observations.get(
+                labels, ([0] * (len(self.buckets) + 1), 0.0)
+            )
+            counts[bucket] += 1
+            self._observations[labels] = (counts, total + value)
+
+    def collect(self) -> list[str]:
+        lines = super().collect()
+        with self._lock:
+            observations = [
+                (labels, list(counts), total)
+                for labels, (counts, total) in self._observations.items()
+            ]
+        for labels, counts, total in observations:
+            cumulative_count = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative_count += count
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(labels, le=bound)} {cumulative_count}"
+                )
+            lines.append(f"{self.name}_sum{self._format_labels(labels)} {total}")
+            lines.append(
+                f"{self.name}_count{self._format_labels(labels)} {cumulative_count}"
+            )
+        return lines
+
+
+class ServerMetrics(metaclass=mlrun.utils.singleton.Singleton):
+    """In-process registry of the API server metrics, exposed in the prometheus text format by the metrics endpoint"""
+
+    def __init__(self):
+        self.request_duration = Histogram(
+            "mlrun_http_request_duration_seconds",
+            "Duration of the HTTP requests, by the route path template",
+            ("method", "route", "status"),
+            request_duration_buckets,
+        )
+        self.requests_in_flight = Gauge(
+            "mlrun_http_requests_in_flight",
+            "Number of the HTTP requests that are being handled",
+            ("method",),
+        )
+        self.db_query_duration = Histogram(
+            "mlrun_db_query_duration_seconds",
+            "Duration of the DB queries, by the query operation and table",
+            ("query",),
+            db_query_duration_buckets,
+        )
+        self.threadpool_tasks_waiting = Gauge(
+            "mlrun_threadpool_tasks_waiting",
+            "Number of the tasks that are waiting for a threadpool thread",
+            ("pool",),
+        )
+        self.threadpool_threads_busy = Gauge(
+            "mlrun_threadpool_threads_busy",
+            "Number of the threadpool threads that are running tasks",
+            ("pool",),
+        )
+
+    def instrument_db_engine(self, engine: sqlalchemy.engine.Engine):
+        """Time the queries that are executed by the engine"""
+        if sqlalchemy.event.contains(
+            engine, "before_cursor_execute", _before_cursor_execute
+        ):
+            return
+        sqlalchemy.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        sqlalchemy.event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    def render(self) -> str:
+        """Render the metrics in the prometheus text format, must be called from the event loop"""
+        self._sample_threadpools()
+        lines = []
+        for metric in [
+            self.request_duration,
+            self.requests_in_flight,
+            self.db_query_duration,
+            self.threadpool_tasks_waiting,
+            self.threadpool_threads_busy,
+        ]:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def _sample_threadpools(self):
+        # the threadpool of fastapi/starlette's run_in_threadpool and of the sync endpoints
+        statistics = anyio.to_thread.current_default_thread_limiter().statistics()
+        self.threadpool_tasks_waiting.set(("anyio",), statistics.tasks_waiting)
+        self.threadpool_threads_busy.set(("anyio",), statistics.borrowed_tokens)
+
+
+class InstrumentedThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Thread pool executor which counts its submitted tasks that are waiting for a thread and that are running, in the
+    threadpool gauges of the server metrics (e.g. the default executor of the loop, used by
+    mlrun.utils.run_in_threadpool)
+    """
+
+    def __init__(self, pool_name: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._labels = (pool_name,)
+        self._metrics = ServerMetrics()
+        self._metrics.threadpool_tasks_waiting.set(self._labels, 0)
+        self._metrics.threadpool_threads_busy.set(self._labels, 0)
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:
+        self._metrics.threadpool_tasks_waiting.inc(self._labels)
+        try:
+            future = super().submit(self._run, fn, *args, **kwargs)
+        except BaseException:
+            self._metrics.threadpool_tasks_waiting.dec(self._labels)
+            raise
+        # a task which is cancelled before it runs is no longer waiting
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _run(self, fn, *args, **kwargs):
+        self._metrics.threadpool_tasks_waiting.dec(self._labels)
+        self._metrics.threadpool_threads_busy.inc(self._labels)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._metrics.threadpool_threads_busy.dec(self._labels)
+
+    def _on_done(self, future: concurrent.futures.Future):
+        if future.cancelled():
+            self._metrics.threadpool_tasks_waiting.dec(self._labels)
+
+
+def resolve_query_name(statement: str) -> str:
+    """The name of a query by its operation and table, e.g. "select runs" """
+    operation = statement.split(None, 1)[0] if statement.strip() else ""
+    match = _query_table_regex.search(statement)
+    return (
+        f"{operation.lower()} {match.group(1).lower()}" if match else operation.lower()
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._mlrun_query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = getattr(context, "_mlrun_query_start_time", None)
+    if start_time is None:
+        return
+    ServerMetrics().db_query_duration.observe(
+        (resolve_query_name(statement),), time.perf_counter() - start_time
+    )
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -15,6 +15,7 @@
 import asyncio
 import copy
 import json
+import time
 import traceback
 import typing
 from datetime import datetime, timedelta
@@ -260,9 +261,13 @@ class Scheduler:
         schedules = []
         for db_schedule in db_schedules:
             schedule = self._transform_and_enrich_db_schedule(
-                db_session, db_schedule, include_last_run, include_credentials
+                db_session, db_schedule, include_credentials=include_credentials
             )
             schedules.append(schedule)
+
+        # resolve the last runs of all schedules at once rather than querying the db per schedule
+        if include_last_run:
+            self._enrich_schedules_with_last_run(db_session, schedules)
         return mlrun.common.schemas.SchedulesOutput(schedules=schedules)
 
     def get_schedule(
@@ -835,39 +840,69 @@ class Scheduler:
                 schedule.next_run_time = None
 
         if include_last_run:
-            self._enrich_schedule_with_last_run(db_session, schedule)
+            self._enrich_schedules_with_last_run(db_session, [schedule])
 
         if include_credentials:
             self._enrich_schedule_with_credentials(schedule)
 
         return schedule
 
-    def _enrich_schedule_with_last_run(
-        self, db_session: Session, schedule_output: mlrun.common.schemas.ScheduleOutput
+    def _enrich_schedules_with_last_run(
+        self,
+        db_session: Session,
+        schedules: list[mlrun.common.schemas.ScheduleOutput],
     ):
-        if schedule_output.last_run_uri:
-            run_data = self._get_last_run(db_session, schedule_output.last_run_uri)
+        last_run_uris = {
+            schedule.last_run_uri for schedule in schedules if schedule.last_run_uri
+        }
+        if not last_run_uris:
+            return
+
+        last_runs = self._get_last_runs(db_session, last_run_uris)
+        for schedule in schedules:
+            if not schedule.last_run_uri:
+                continue
+            run_data = last_runs.get(schedule.last_run_uri)
             if run_data:
-                schedule_output.last_run = run_data
+                schedule.last_run = run_data
             else:
                 # Possibly the last-run was already deleted (ML-4902). Continue, and clear the last_run_uri in
                 # the response.
-                schedule_output.last_run_uri = None
+                logger.debug(
+                    "Failed to find the last run for schedule. Continuing",
+                    project=schedule.project,
+                    schedule_name=schedule.name,
+                    last_run_uri=schedule.last_run_uri,
+                )
+                schedule.last_run_uri = None
 
     @staticmethod
-    def _get_last_run(db_session, last_run_uri):
-        run_project, run_uid, iteration, _ = RunObject.parse_uri(last_run_uri)
-        try:
-            run_data = get_db().read_run(db_session, run_uid, run_project, iteration)
-            return run_data
-        except mlrun.errors.MLRunNotFoundError:
-            logger.debug(
-                "Failed to find the last run for schedule. Continuing",
-                project=run_project,
-                run_uid=run_uid,
-                iteration=iteration,
+    def _get_last_runs(db_session: Session, last_run_uris: set[str]) -> dict:
+        identifiers_by_uri = {}
+        for last_run_uri in last_run_uris:
+            run_project, run_uid, iteration, _ = RunObject.parse_uri(last_run_uri)
+            identifiers_by_uri[last_run_uri] = (
+                run_project,
+                run_uid,
+                int(iteration or 0),
             )
-            return None
+
+        start_time = time.perf_counter_ns()
+        runs = get_db().read_runs_by_identifiers(
+            db_session, list(identifiers_by_uri.values())
+        )
+        elapsed_time_in_ms = (time.perf_counter_ns() - start_time) / 1000 / 1000
+        logger.debug(
+            "Resolved schedules last runs",
+            batch_size=len(identifiers_by_uri),
+            found=len(runs),
+            elapsed_time_in_ms=elapsed_time_in_ms,
+        )
+        return {
+            last_run_uri: runs[identifier]
+            for last_run_uri, identifier in identifiers_by_uri.items()
+            if identifier in runs
+        }
 
     def _enrich_schedule_with_credentials(
         self, schedule_output: mlrun.common.schemas.ScheduleOutput
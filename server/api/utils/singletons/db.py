@@ -13,7 +13,8 @@
 # limitations under the License.
 #
 import mlrun.db
-from mlrun.common.db.sql_session import create_session
+import server.api.utils.metrics
+from mlrun.common.db.sql_session import create_session, get_engine
 from mlrun.config import config
 from mlrun.utils import logger
 from server.api.db.base import DBInterface
@@ -35,6 +36,7 @@ def initialize_db(override_db=None):
         return
     logger.info("Creating sql db", dst=config.httpdb.dsn)
     db = SQLDB(config.httpdb.dsn)
+    server.api.utils.metrics.ServerMetrics().instrument_db_engine(get_engine())
     # set the run db path to the sql db dsn
     mlrun.db.get_or_set_dburl(config.httpdb.dsn)
 
@@ -15,11 +15,13 @@ import base64
 import hashlib
 import random
 import string
+import threading
 import time
 import typing
 
 import kubernetes.client.rest as k8s_client_rest
 import kubernetes.dynamic.exceptions as k8s_dynamic_exceptions
+import kubernetes.watch as k8s_watch
 from kubernetes import client, config
 
 import mlrun
@@ -75,11 +77,136 @@ class SecretTypes:
     v3io_fuse = "v3io/fuse"
 
 
+class SecretsCache:
+    """
+    Cache of the secrets of a namespace, kept up to date by watching the secrets of the namespace in the background.
+    Secrets are served from the cache only while the watch is running, and for no longer than the configured ttl
+    """
+
+    # seconds to wait before restarting a watch that failed
+    watch_retry_interval = 5
+
+    def __init__(self, v1api: client.CoreV1Api, namespace: str):
+        self._v1api = v1api
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        # secret name -> (secret data, None if the secret doesn't exist, monotonic expiry time)
+        self._secrets: dict[str, tuple[typing.Optional[dict], float]] = {}
+        # bumped on every change, so that a read that was in flight during the change isn't cached
+        self._generation = 0
+        self._watching = False
+        self._watch: typing.Optional[k8s_watch.Watch] = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_watch,
+            name=f"secrets-cache-{namespace}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def get(self, secret_name: str) -> typing.Optional[dict]:
+        """
+        Get the data of a secret, from the cache or from the k8s api
+        :return: the secret data, None if the secret doesn't exist
+        """
+        with self._lock:
+            generation = self._generation
+            cached = self._secrets.get(secret_name) if self._watching else None
+        if cached and cached[1] > time.monotonic():
+            return dict(cached[0]) if cached[0] is not None else None
+
+        try:
+            data = self._v1api.read_namespaced_secret(secret_name, self._namespace).data
+        except k8s_client_rest.ApiException as exc:
+            if exc.status != 404:
+                raise
+            data = None
+
+        with self._lock:
+            if self._watching and self._generation == generation:
+                self._secrets[secret_name] = (
+                    dict(data) if data is not None else None,
+                    time.monotonic()
+                    + mlrun.mlconf.secret_stores.kubernetes.secrets_cache.ttl,
+                )
+        return data
+
+    def invalidate(self, secret_name: str):
+        with self._lock:
+            self._generation += 1
+            self._secrets.pop(secret_name, None)
+
+    def stop(self):
+        self._stop_event.set()
+        if self._watch:
+            self._watch.stop()
+
+    def _run_watch(self):
+        while not self._stop_event.is_set():
+            try:
+                # watch from the current state, the cache is empty at this point so older events are irrelevant
+                resource_version = self._v1api.list_namespaced_secret(
+                    self._namespace, limit=1
+                ).metadata.resource_version
+                with self._lock:
+                    self._generation += 1
+                    self._watching = True
+                while not self._stop_event.is_set():
+                    self._watch = k8s_watch.Watch()
+                    for event in self._watch.stream(
+                        self._v1api.list_namespaced_secret,
+                        namespace=self._namespace,
+                        resource_version=resource_version,
+                        timeout_seconds=mlrun.mlconf.secret_stores.kubernetes.secrets_cache.watch_timeout,
+                    ):
+                        resource_version = event["object"].metadata.resource_version
+                        self._handle_event(event)
+            except Exception as exc:
+                if isinstance(exc, k8s_client_rest.ApiException) and exc.status == 403:
+                    # the service account can't list/watch the secrets, retrying would only fail (and warn) again, so
+                    # the secrets of the namespace are read from the k8s api as if the cache was disabled
+                    logger.warning(
+                        "No permission to watch secrets, not caching the secrets of the namespace",
+                        namespace=self._namespace,
+                        exc=mlrun.errors.err_to_str(exc),
+                    )
+                    self._stop_event.set()
+                elif not self._stop_event.is_set():
+                    logger.warning(
+                        "Failed watching secrets, restarting the watch",
+                        namespace=self._namespace,
+                        exc=mlrun.errors.err_to_str(exc),
+                    )
+            finally:
+                # events may be missed until the watch is restarted
+                with self._lock:
+                    self._generation += 1
+                    self._watching = False
+                    self._secrets.clear()
+            self._stop_event.wait(self.watch_retry_interval)
+
+    def _handle_event(self, event: dict):
+        secret: client.V1Secret = event["object"]
+        with self._lock:
+            self._generation += 1
+            # only the cached secrets are kept up to date, the rest are read on their first use
+            if secret.metadata.name in self._secrets:
+                data = None if event["type"] == "DELETED" else dict(secret.data or {})
+                self._secrets[secret.metadata.name] = (
+                    data,
+                    time.monotonic()
+                    + mlrun.mlconf.secret_stores.kubernetes.secrets_cache.ttl,
+                )
+
+
 class K8sHelper(mlsecrets.SecretProviderInterface):
     def __init__(self, namespace=None, silent=False, log=True):
         self.namespace = namespace or mlrun.mlconf.namespace
         self.config_file = mlrun.mlconf.kubernetes.kubeconfig_path or None
         self.running_inside_kubernetes_cluster = False
+        # namespace -> secrets cache, created on the first secret read from the namespace
+        self._secrets_caches: dict[str, SecretsCache] = {}
+        self._secrets_caches_lock = threading.Lock()
         try:
             self._init_k8s_config(log)
             self.v1api = client.CoreV1Api()
@@ -580,6 +707,7 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
                 secrets=secrets,
                 type_=type_,
             )
+            self._invalidate_cached_secret(secret_name, namespace)
             return mlrun.common.schemas.SecretEventActions.created
 
         # Secret exists and we are updating it.
@@ -589,6 +717,7 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
             secret_name=secret_name,
             secrets=secrets,
         )
+        self._invalidate_cached_secret(secret_name, namespace)
         return mlrun.common.schemas.SecretEventActions.updated
 
     def _create_secret(
@@ -712,6 +841,7 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
                 secret_name=secret_name,
             )
             self.v1api.delete_namespaced_secret(secret_name, namespace)
+            self._invalidate_cached_secret(secret_name, namespace)
             return mlrun.common.schemas.SecretEventActions.deleted
 
         # Create a copy of the k8s secret data, filtering out specified secrets if any
@@ -736,10 +866,12 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
             # Update the existing secret with modified data
             k8s_secret.data = secret_data
             self.v1api.replace_namespaced_secret(secret_name, namespace, k8s_secret)
+            self._invalidate_cached_secret(secret_name, namespace)
             return mlrun.common.schemas.SecretEventActions.updated
 
         # No secrets left, so delete the secret
         self.v1api.delete_namespaced_secret(secret_name, namespace)
+        self._invalidate_cached_secret(secret_name, namespace)
         return mlrun.common.schemas.SecretEventActions.deleted
 
     @raise_for_status_code
@@ -881,12 +1013,31 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
         namespace = self.resolve_namespace(namespace)
 
         try:
+            secrets_cache = self._get_secrets_cache(namespace)
+            if secrets_cache:
+                return secrets_cache.get(secret_name)
             k8s_secret = self.v1api.read_namespaced_secret(secret_name, namespace)
         except k8s_client_rest.ApiException:
             return None
 
         return k8s_secret.data
 
+    def _get_secrets_cache(self, namespace: str) -> typing.Optional[SecretsCache]:
+        if (
+            not mlrun.mlconf.secret_stores.kubernetes.secrets_cache.enabled
+            or not self.running_inside_kubernetes_cluster
+        ):
+            return None
+        with self._secrets_caches_lock:
+            if namespace not in self._secrets_caches:
+                self._secrets_caches[namespace] = SecretsCache(self.v1api, namespace)
+            return self._secrets_caches[namespace]
+
+    def _invalidate_cached_secret(self, secret_name: str, namespace: str):
+        secrets_cache = self._secrets_caches.get(namespace)
+        if secrets_cache:
+            secrets_cache.invalidate(secret_name)
+
     def get_project_secret_keys(self, project, namespace="", filter_internal=False):
         secrets_data = self._get_project_secrets_raw_data(project, namespace)
         if not secrets_data:
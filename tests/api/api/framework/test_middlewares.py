@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 
+import http
+import typing
 import unittest.mock
 
 import fastapi.testclient
@@ -21,6 +23,14 @@ import sqlalchemy.orm
 
 import mlrun.common.schemas.constants
 import mlrun.utils.version
+import server.api.crud
+import server.api.middlewares
+import server.api.middlewares.response_compression
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 @pytest.mark.parametrize(
@@ -86,3 +96,107 @@ def test_ensure_be_version_middleware(
         response.headers[mlrun.common.schemas.constants.HeaderNames.backend_version]
         == "dummy-version"
     )
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected_encoding",
+    [
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        # the preferred encoding of the server
+        ("*", "zstd" if zstandard else "gzip"),
+    ],
+)
+def test_response_compression_middleware(
+    db: sqlalchemy.orm.Session,
+    client: fastapi.testclient.TestClient,
+    accept_encoding: str,
+    expected_encoding: typing.Optional[str],
+) -> None:
+    project = "test-compression"
+    for i in range(100):
+        server.api.crud.Runs().store_run(
+            db,
+            {"metadata": {"name": f"run-{i}", "project": project}},
+            f"uid-{i}",
+            project=project,
+        )
+
+    uncompressed_response = client.get(
+        f"projects/{project}/runs", headers={"Accept-Encoding": "identity"}
+    )
+    response = client.get(
+        f"projects/{project}/runs", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert response.status_code == http.HTTPStatus.OK.value
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers.get("Content-Encoding") == expected_encoding
+    assert response.json() == uncompressed_response.json()
+    if expected_encoding:
+        assert (
+            response.num_bytes_downloaded
+            < uncompressed_response.num_bytes_downloaded / 5
+        )
+        assert int(response.headers["Content-Length"]) == response.num_bytes_downloaded
+
+    # small responses aren't compressed
+    response = client.get("healthz", headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == http.HTTPStatus.OK.value
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "encoding",
+    [
+        "gzip",
+        pytest.param(
+            "zstd",
+            marks=pytest.mark.skipif(
+                zstandard is None, reason="zstandard is not installed"
+            ),
+        ),
+    ],
+)
+def test_response_compression_middleware_streaming(monkeypatch, encoding) -> None:
+    monkeypatch.setattr(
+        server.api.middlewares.response_compression, "stream_chunk_size", 1024
+    )
+    lines = [f"line {i}\n" for i in range(1000)]
+    app = fastapi.FastAPI()
+    app.add_middleware(
+        server.api.middlewares.ResponseCompressionMiddleware,
+        encodings=encoding,
+        minimum_size=1024,
+    )
+
+    @app.get("/large")
+    def large():
+        return fastapi.responses.PlainTextResponse("".join(lines))
+
+    @app.get("/stream")
+    def stream():
+        return fastapi.responses.StreamingResponse(
+            (line.encode() for line in lines), media_type="text/plain"
+        )
+
+    @app.get("/events")
+    def events():
+        return fastapi.responses.StreamingResponse(
+            (line.encode() for line in lines), media_type="text/event-stream"
+        )
+
+    with fastapi.testclient.TestClient(app) as test_client:
+        for path in ["large", "stream"]:
+            response = test_client.get(path, headers={"Accept-Encoding": encoding})
+            assert response.headers["Content-Encoding"] == encoding
+            # sent in (compressed) chunks
+            assert "Content-Length" not in response.headers
+            assert response.text == "".join(lines)
+
+        # server-sent events aren't compressed
+        response = test_client.get("events", headers={"Accept-Encoding": encoding})
+        assert "Content-Encoding" not in response.headers
+        assert response.text == "".join(lines)
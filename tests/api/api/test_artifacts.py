@@ -210,6 +210,43 @@ def test_create_artifact(db: Session, unversioned_client: TestClient):
     assert response_data["spec"]["target_path"] == data["spec"]["target_path"]
 
 
+def test_store_artifacts(db: Session, unversioned_client: TestClient):
+    _create_project(unversioned_client, prefix="v1")
+    tree = "some-tree"
+    artifacts = [
+        _generate_artifact_body(key=f"{KEY}-{index}", tree=tree, tag=TAG)
+        for index in range(3)
+    ]
+    url = STORE_API_ARTIFACTS_V2_PATH.format(project=PROJECT) + "/bulk-store"
+    resp = unversioned_client.post(
+        url,
+        json={"artifacts": [{"artifact": artifact} for artifact in artifacts]},
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    uids = resp.json()["uids"]
+    assert len(uids) == 3
+    assert all(uids)
+
+    resp = unversioned_client.get(
+        LIST_API_ARTIFACTS_V2_PATH.format(project=PROJECT) + f"?tag={TAG}"
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    assert len(resp.json()["artifacts"]) == 3
+
+    # existing artifacts are skipped only when requested
+    resp = unversioned_client.post(
+        url,
+        json={
+            "artifacts": [
+                {"artifact": artifacts[0], "skip_if_exists": True},
+                {"artifact": artifacts[1]},
+            ]
+        },
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    assert resp.json()["uids"] == [None, uids[1]]
+
+
 def test_delete_artifacts_after_storing_empty_dict(db: Session, client: TestClient):
     _create_project(client)
     empty_artifact = "{}"
@@ -0,0 +1,148 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import http
+import re
+import threading
+
+import fastapi.testclient
+import pytest
+import sqlalchemy.orm
+
+import mlrun
+import server.api.utils.metrics
+
+
+def test_metrics(
+    db: sqlalchemy.orm.Session,
+    client: fastapi.testclient.TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(mlrun.mlconf.httpdb.metrics, "enabled", True)
+    for project in ["project-1", "project-2"]:
+        response = client.get(f"projects/{project}/runs")
+        assert response.status_code == http.HTTPStatus.OK.value
+    response = client.get("projects/project-1/runs/not-exists")
+    assert response.status_code == http.HTTPStatus.NOT_FOUND.value
+
+    response = client.get("metrics")
+    assert response.status_code == http.HTTPStatus.OK.value
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _parse_samples(response.text)
+
+    # the requests are measured by their route path template
+    route_labels = 'method="GET",route="/api/v1/projects/{project}/runs",status="200"'
+    assert samples[f"mlrun_http_request_duration_seconds_count{{{route_labels}}}"] == 2
+    assert (
+        samples[
+            f'mlrun_http_request_duration_seconds_bucket{{{route_labels},le="+Inf"}}'
+        ]
+        == 2
+    )
+    assert (
+        samples[
+            "mlrun_http_request_duration_seconds_count"
+            '{method="GET",route="/api/v1/projects/{project}/runs/{uid}",status="404"}'
+        ]
+        == 1
+    )
+
+    # the metrics request itself is in flight
+    assert samples['mlrun_http_requests_in_flight{method="GET"}'] == 1
+
+    assert samples['mlrun_db_query_duration_seconds_count{query="select runs"}'] >= 3
+    assert samples['mlrun_threadpool_tasks_waiting{pool="anyio"}'] == 0
+    assert 'mlrun_threadpool_threads_busy{pool="anyio"}' in samples
+
+
+def test_metrics_disabled(
+    db: sqlalchemy.orm.Session, client: fastapi.testclient.TestClient
+) -> None:
+    response = client.get("metrics")
+    assert response.status_code == http.HTTPStatus.PRECONDITION_FAILED.value
+
+
+def test_instrumented_thread_pool_executor():
+    metrics = server.api.utils.metrics.ServerMetrics()
+    task_started = threading.Event()
+    release_task = threading.Event()
+
+    def blocking_task():
+        task_started.set()
+        release_task.wait(timeout=10)
+
+    executor = server.api.utils.metrics.InstrumentedThreadPoolExecutor(
+        "test_pool", max_workers=1
+    )
+    try:
+        running_future = executor.submit(blocking_task)
+        task_started.wait(timeout=10)
+        waiting_future = executor.submit(lambda: None)
+        cancelled_future = executor.submit(lambda: None)
+        assert cancelled_future.cancel()
+
+        # the task that waits for the busy thread is counted until it runs
+        samples = _parse_threadpool_samples(metrics)
+        assert samples['mlrun_threadpool_tasks_waiting{pool="test_pool"}'] == 1
+        assert samples['mlrun_threadpool_threads_busy{pool="test_pool"}'] == 1
+
+        release_task.set()
+        running_future.result(timeout=10)
+        waiting_future.result(timeout=10)
+    finally:
+        release_task.set()
+        executor.shutdown(wait=True)
+
+    samples = _parse_threadpool_samples(metrics)
+    assert samples['mlrun_threadpool_tasks_waiting{pool="test_pool"}'] == 0
+    assert samples['mlrun_threadpool_threads_busy{pool="test_pool"}'] == 0
+
+
+@pytest.mark.parametrize(
+    "statement,expected_query_name",
+    [
+        ("SELECT runs.id, runs.body \nFROM runs \nWHERE runs.uid = ?", "select runs"),
+        (
+            "SELECT count(*) AS count_1 \nFROM (SELECT artifacts_v2.id FROM artifacts_v2)",
+            "select artifacts_v2",
+        ),
+        ("INSERT INTO `projects` (name) VALUES (%s)", "insert projects"),
+        ('UPDATE "runs" SET state=? WHERE runs.id = ?', "update runs"),
+        ("DELETE FROM runs_labels WHERE runs_labels.parent = ?", "delete runs_labels"),
+        ("SELECT 1", "select"),
+    ],
+)
+def test_resolve_query_name(statement: str, expected_query_name: str):
+    assert server.api.utils.metrics.resolve_query_name(statement) == expected_query_name
+
+
+def _parse_threadpool_samples(
+    metrics: server.api.utils.metrics.ServerMetrics,
+) -> dict[str, float]:
+    return _parse_samples(
+        "\n".join(
+            metrics.threadpool_tasks_waiting.collect()
+            + metrics.threadpool_threads_busy.collect()
+        )
+    )
+
+
+def _parse_samples(text: str) -> dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = re.fullmatch(r"(.+) (\S+)", line).groups()
+        samples[name] = float(value)
+    return samples
@@ -21,12 +21,14 @@ from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 
 import fastapi
+import pandas as pd
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.errors
+import mlrun.lists
 import server.api.crud
 import server.api.utils.auth.verifier
 import server.api.utils.background_tasks
@@ -524,6 +526,53 @@ def test_list_runs_single_and_multiple_uids(db: Session, client: TestClient):
         expected_uids.remove(run["metadata"]["uid"])
 
 
+def test_list_runs_as_arrow_stream(db: Session, client: TestClient):
+    project = "my-project"
+    for counter in range(10):
+        uid = f"uid_{counter}"
+        run = {
+            "kind": "job",
+            "metadata": {
+                "name": f"run_{counter % 3}",
+                "uid": uid,
+                "project": project,
+                "iteration": counter % 2,
+                "labels": {"owner": "admin", "counter": str(counter)},
+            },
+            "spec": {"parameters": {"p1": counter, "p2": [1, "a"]}},
+            "status": {
+                "state": "completed",
+                "start_time": datetime.now(timezone.utc).isoformat(),
+                "results": {"accuracy": counter / 10} if counter % 2 else {},
+                "artifacts": [{"preview": [[0.0, float("Nan"), 1.3]]}],
+            },
+        }
+        server.api.crud.Runs().store_run(
+            db, run, uid, iter=counter % 2, project=project
+        )
+
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project=project),
+        params={"iter": True},
+        headers={"Accept": mlrun.lists.arrow_stream_media_type},
+    )
+    assert response.status_code == HTTPStatus.OK.value, response.text
+    assert response.headers["content-type"] == mlrun.lists.arrow_stream_media_type
+    df = mlrun.lists.runs_df_from_arrow_stream(response.content)
+
+    runs = _list_and_assert_objects(client, {"iter": True}, 10, project=project)
+    pd.testing.assert_frame_equal(df, mlrun.lists.RunList(runs).to_df())
+
+    # no runs
+    response = client.get(
+        RUNS_API_ENDPOINT.format(project="other-project"),
+        headers={"Accept": mlrun.lists.arrow_stream_media_type},
+    )
+    df = mlrun.lists.runs_df_from_arrow_stream(response.content)
+    assert list(df.columns) == mlrun.lists.list_header
+    assert df.empty
+
+
 def test_list_runs_with_pagination(db: Session, client: TestClient):
     """
     Test list runs with pagination.
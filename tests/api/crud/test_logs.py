@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import base64
+import json
 import unittest.mock
 
 import fastapi.testclient
 import pytest
 import sqlalchemy.orm
 
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.errors
 import server.api.crud
@@ -77,3 +80,60 @@ class TestLogs:
         else:
             log_size = await server.api.crud.Logs().get_log_size(project, uid)
             assert return_value == log_size
+
+    @pytest.mark.asyncio
+    async def test_follow_logs(
+        self, db: sqlalchemy.orm.Session, client: fastapi.testclient.TestClient
+    ):
+        mlrun.mlconf.log_collector.mode = mlrun.common.schemas.LogsCollectorMode.legacy
+        mlrun.mlconf.httpdb.logs.follow.poll_interval = 0
+        project = "project-name"
+        uid = "m33"
+        data1, data2 = b"ab", b"cd"
+        run = {
+            "metadata": {"name": "run-name"},
+            "status": {"state": mlrun.common.runtimes.constants.RunStates.running},
+        }
+        server.api.crud.Runs().store_run(db, run, uid, project=project)
+        server.api.crud.Logs().store_log(data1, project, uid)
+
+        run_state, events_stream = await server.api.crud.Logs().follow_logs(
+            db, project, uid
+        )
+        assert run_state == mlrun.common.runtimes.constants.RunStates.running
+        events = []
+        async for event in events_stream:
+            events.append(_parse_follow_logs_event(event))
+            if len(events) == 2:
+                # the run writes more logs and then finishes
+                server.api.crud.Logs().store_log(data2, project, uid, append=True)
+                server.api.crud.Runs().update_run(
+                    db,
+                    project,
+                    uid,
+                    iter=0,
+                    data={
+                        "status.state": mlrun.common.runtimes.constants.RunStates.completed
+                    },
+                )
+
+        assert events == [
+            ("state", {"state": mlrun.common.runtimes.constants.RunStates.running}),
+            ("log", {"offset": 0, "content": data1}),
+            ("state", {"state": mlrun.common.runtimes.constants.RunStates.completed}),
+            ("log", {"offset": len(data1), "content": data2}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_follow_logs_run_not_found(self, db: sqlalchemy.orm.Session):
+        with pytest.raises(mlrun.errors.MLRunNotFoundError):
+            await server.api.crud.Logs().follow_logs(db, "project-name", "not-exist")
+
+
+def _parse_follow_logs_event(event: str) -> tuple[str, dict]:
+    lines = event.strip().split("\n")
+    event_type = lines[0].removeprefix("event: ")
+    data = json.loads(lines[1].removeprefix("data: "))
+    if "content" in data:
+        data["content"] = base64.b64decode(data["content"])
+    return event_type, data
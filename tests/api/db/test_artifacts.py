@@ -314,6 +314,110 @@ class TestArtifacts:
             else:
                 assert artifact["spec"]["something"] == "same"
 
+    def test_store_artifacts(self, db: DBInterface, db_session: Session):
+        project = "artifact_project"
+        tree = "artifact_tree"
+        tag = "artifact-tag"
+        artifact_1 = self._generate_artifact(
+            "artifact_key_1", tree=tree, project=project, tag=tag
+        )
+        artifact_2 = self._generate_artifact("artifact_key_2", tree=tree)
+        artifact_3 = self._generate_artifact("artifact_key_3", tree=tree)
+        artifact_3["spec"]["db_key"] = "artifact_db_key_3"
+
+        uids = db.store_artifacts(
+            db_session,
+            project,
+            [
+                copy.deepcopy(artifact_1),
+                copy.deepcopy(artifact_2),
+                copy.deepcopy(artifact_3),
+            ],
+        )
+        assert len(uids) == 3
+        assert all(uids)
+
+        artifacts = db.list_artifacts(db_session, project=project, tag="latest")
+        assert len(artifacts) == 3
+        assert sorted(artifact["spec"]["db_key"] for artifact in artifacts) == [
+            "artifact_db_key_3",
+            "artifact_key_1",
+            "artifact_key_2",
+        ]
+        artifacts = db.list_artifacts(db_session, project=project, tag=tag)
+        assert len(artifacts) == 1
+        assert artifacts[0]["metadata"]["uid"] == uids[0]
+
+        # storing the same artifacts again updates the existing ones, unless they should be skipped if they exist
+        artifact_1["spec"]["something"] = "updated"
+        artifact_2["spec"]["something"] = "changed"
+        new_uids = db.store_artifacts(
+            db_session,
+            project,
+            [copy.deepcopy(artifact_1), copy.deepcopy(artifact_2)],
+            skip_if_exists=[False, True],
+        )
+        assert new_uids[0] and new_uids[0] != uids[0]
+        assert new_uids[1] is None
+
+        artifact = db.read_artifact(
+            db_session, "artifact_key_1", tag=tag, project=project
+        )
+        assert artifact["spec"]["something"] == "updated"
+        artifact = db.read_artifact(db_session, "artifact_key_2", project=project)
+        assert "something" not in artifact["spec"]
+
+        # the previous version of the first artifact is kept, while the tags moved to the new version
+        artifacts = db.list_artifacts(db_session, "artifact_key_1", project=project)
+        assert {artifact["metadata"]["uid"] for artifact in artifacts} == {
+            uids[0],
+            new_uids[0],
+        }
+        artifact_tags = db.list_artifact_tags(db_session, project)
+        assert sorted(artifact_tags) == sorted(["latest", tag])
+
+    def test_store_artifacts_with_link_artifact(
+        self, db: DBInterface, db_session: Session
+    ):
+        project = "artifact_project"
+        key = "artifact_key"
+        tree = "artifact_tree"
+        iteration_artifacts = []
+        for iteration in range(1, 4):
+            artifact = self._generate_artifact(key, tree=tree)
+            artifact["metadata"]["iter"] = iteration
+            iteration_artifacts.append(artifact)
+        # a version of the same key by another producer doesn't match any of the stored artifacts
+        other_producer_artifact = self._generate_artifact(key, tree="other_tree")
+        other_producer_artifact["metadata"]["iter"] = 2
+        db.store_artifacts(
+            db_session, project, iteration_artifacts + [other_producer_artifact]
+        )
+
+        link_artifact = self._generate_artifact(key, kind="link", tree=tree)
+        link_artifact["spec"]["link_iteration"] = 2
+        other_artifact = self._generate_artifact("other_artifact_key", tree=tree)
+
+        # the best iteration is marked within the same transaction that stores the rest of the artifacts
+        with unittest.mock.patch.object(
+            db_session, "commit", wraps=db_session.commit
+        ) as commit:
+            uids = db.store_artifacts(
+                db_session, project, [link_artifact, other_artifact]
+            )
+        assert commit.call_count == 1
+        assert all(uids)
+
+        best_iteration_artifacts = db.list_artifacts(
+            db_session, key, project=project, best_iteration=True
+        )
+        assert len(best_iteration_artifacts) == 1
+        best_iteration_artifact = best_iteration_artifacts[0]
+        assert best_iteration_artifact["metadata"]["tree"] == tree
+        assert best_iteration_artifact["metadata"]["iter"] == 2
+        assert best_iteration_artifact["metadata"]["uid"] == uids[0]
+        assert db.read_artifact(db_session, "other_artifact_key", project=project)
+
     def test_list_artifact_tags_with_category(
         self, db: DBInterface, db_session: Session
     ):
@@ -466,6 +466,38 @@ def test_list_runs_with_same_names(db: DBInterface, db_session: Session):
     assert len(runs) == 4
 
 
+def test_read_runs_by_identifiers(db: DBInterface, db_session: Session):
+    for project_name in ["project1", "project2"]:
+        for uid in ["uid1", "uid2"]:
+            for iteration in [0, 1]:
+                _create_new_run(
+                    db,
+                    db_session,
+                    project=project_name,
+                    uid=uid,
+                    iteration=iteration,
+                )
+
+    identifiers = [
+        ("project1", "uid1", 0),
+        ("project2", "uid2", 1),
+        # not matching identifiers should be omitted, even if each of their fields exists on its own
+        ("project1", "uid2", 2),
+        ("project3", "uid1", 0),
+    ]
+    runs = db.read_runs_by_identifiers(db_session, identifiers)
+    assert list(sorted(runs.keys())) == [
+        ("project1", "uid1", 0),
+        ("project2", "uid2", 1),
+    ]
+    for (project, uid, iteration), run in runs.items():
+        assert run["metadata"]["project"] == project
+        assert run["metadata"]["uid"] == uid
+        assert run["metadata"]["iter"] == iteration
+
+    assert db.read_runs_by_identifiers(db_session, []) == {}
+
+
 def _change_run_record_to_before_align_runs_migration(run, time_before_creation):
     run_dict = run.struct
 
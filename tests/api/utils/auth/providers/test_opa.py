@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import http
 import time
 import typing
 
+import aiohttp.web
 import aioresponses
 import deepdiff
 import pytest
@@ -67,6 +69,64 @@ async def opa_provider() -> (
         await provider._session.close()
 
 
+class FakeOPAServer:
+    """A local opa server that allows the resources in the allowed set, and counts the requests it gets"""
+
+    def __init__(self, permission_query_path: str, permission_filter_path: str):
+        self.allowed_resources = set()
+        self.query_requests = 0
+        self.filter_requests = []
+        self.max_concurrent_filter_requests = 0
+        self._concurrent_filter_requests = 0
+        self.app = aiohttp.web.Application()
+        self.app.router.add_post(permission_query_path, self._query)
+        self.app.router.add_post(permission_filter_path, self._filter)
+
+    async def _query(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        self.query_requests += 1
+        body = await request.json()
+        return aiohttp.web.json_response(
+            {"result": body["input"]["resource"] in self.allowed_resources}
+        )
+
+    async def _filter(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        body = await request.json()
+        self.filter_requests.append(body["input"]["resources"])
+        self._concurrent_filter_requests += 1
+        self.max_concurrent_filter_requests = max(
+            self.max_concurrent_filter_requests, self._concurrent_filter_requests
+        )
+        # let the other concurrent requests arrive
+        await asyncio.sleep(0.05)
+        self._concurrent_filter_requests -= 1
+        return aiohttp.web.json_response(
+            {
+                "result": [
+                    resource
+                    for resource in body["input"]["resources"]
+                    if resource in self.allowed_resources
+                ]
+            }
+        )
+
+
+@pytest_asyncio.fixture()
+async def fake_opa_server(
+    permission_query_path: str,
+    permission_filter_path: str,
+    opa_provider: server.api.utils.auth.providers.opa.Provider,
+) -> typing.AsyncIterator[FakeOPAServer]:
+    fake_server = FakeOPAServer(permission_query_path, permission_filter_path)
+    runner = aiohttp.web.AppRunner(fake_server.app)
+    await runner.setup()
+    site = aiohttp.web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    opa_provider._api_url = f"http://127.0.0.1:{port}"
+    yield fake_server
+    await runner.cleanup()
+
+
 @pytest.mark.asyncio
 async def test_query_permissions_success(
     api_url: str,
@@ -379,3 +439,176 @@ def test_allowed_project_owners_cache_clean_expired(
         )
         is False
     )
+
+
+@pytest.mark.asyncio
+async def test_query_permissions_use_decisions_cache(
+    fake_opa_server: FakeOPAServer,
+    opa_provider: server.api.utils.auth.providers.opa.Provider,
+):
+    allowed_resource = "/projects/project-name/functions/function-name"
+    denied_resource = "/projects/project-name/functions/other-function-name"
+    fake_opa_server.allowed_resources = {allowed_resource}
+    action = mlrun.common.schemas.AuthorizationAction.read
+    auth_info = mlrun.common.schemas.AuthInfo(
+        user_id="user-id", user_group_ids=["user-group-id-1", "user-group-id-2"]
+    )
+
+    for _ in range(3):
+        assert (
+            await opa_provider.query_permissions(allowed_resource, action, auth_info)
+            is True
+        )
+        with pytest.raises(mlrun.errors.MLRunAccessDeniedError):
+            await opa_provider.query_permissions(denied_resource, action, auth_info)
+    assert fake_opa_server.query_requests == 2
+
+    # the decisions are per user and action
+    other_auth_info = mlrun.common.schemas.AuthInfo(user_id="other-user-id")
+    await opa_provider.query_permissions(
+        allowed_resource, action, other_auth_info, raise_on_forbidden=False
+    )
+    await opa_provider.query_permissions(
+        allowed_resource,
+        mlrun.common.schemas.AuthorizationAction.delete,
+        auth_info,
+        raise_on_forbidden=False,
+    )
+    assert fake_opa_server.query_requests == 4
+
+    # once the decisions expire, they are queried again
+    opa_provider._decisions_cache_ttl_seconds = 0.5
+    opa_provider._decisions_cache.clear()
+    fake_opa_server.query_requests = 0
+    assert (
+        await opa_provider.query_permissions(allowed_resource, action, auth_info)
+        is True
+    )
+    fake_opa_server.allowed_resources = set()
+    assert (
+        await opa_provider.query_permissions(allowed_resource, action, auth_info)
+        is True
+    )
+    time.sleep(0.6)
+    assert (
+        await opa_provider.query_permissions(
+            allowed_resource, action, auth_info, raise_on_forbidden=False
+        )
+        is False
+    )
+    assert fake_opa_server.query_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_query_permissions_wildcard_decision(
+    fake_opa_server: FakeOPAServer,
+    opa_provider: server.api.utils.auth.providers.opa.Provider,
+):
+    action = mlrun.common.schemas.AuthorizationAction.read
+    auth_info = mlrun.common.schemas.AuthInfo(user_id="user-id")
+    fake_opa_server.allowed_resources = {"/projects/project-name/functions/*"}
+
+    assert (
+        await opa_provider.query_permissions(
+            "/projects/project-name/functions/*", action, auth_info
+        )
+        is True
+    )
+    # covered by the allowed wildcard decision of the project
+    assert (
+        await opa_provider.query_permissions(
+            "/projects/project-name/functions/function-name", action, auth_info
+        )
+        is True
+    )
+    assert fake_opa_server.query_requests == 1
+
+    # not covered - another project, another resource type
+    for resource in [
+        "/projects/other-project-name/functions/function-name",
+        "/projects/project-name/artifacts/artifact-name",
+    ]:
+        assert (
+            await opa_provider.query_permissions(
+                resource, action, auth_info, raise_on_forbidden=False
+            )
+            is False
+        )
+    assert fake_opa_server.query_requests == 3
+
+    # denied wildcard decisions don't apply to the resources they cover
+    fake_opa_server.allowed_resources = {"/projects/denied-project/runs/uid/logs"}
+    assert (
+        await opa_provider.query_permissions(
+            "/projects/denied-project/runs/*/logs",
+            action,
+            auth_info,
+            raise_on_forbidden=False,
+        )
+        is False
+    )
+    assert (
+        await opa_provider.query_permissions(
+            "/projects/denied-project/runs/uid/logs", action, auth_info
+        )
+        is True
+    )
+    assert fake_opa_server.query_requests == 5
+
+
+@pytest.mark.asyncio
+async def test_filter_by_permissions_chunks_and_cache(
+    fake_opa_server: FakeOPAServer,
+    opa_provider: server.api.utils.auth.providers.opa.Provider,
+):
+    opa_provider._filter_request_chunk_size = 10
+    opa_provider._max_concurrent_filter_requests = 2
+    action = mlrun.common.schemas.AuthorizationAction.read
+    auth_info = mlrun.common.schemas.AuthInfo(user_id="user-id")
+    # every opa resource appears twice
+    resources = [
+        {"uid": i, "opa_resource": f"/projects/project-name/runs/run-{i // 2}"}
+        for i in range(100)
+    ]
+    fake_opa_server.allowed_resources = {
+        f"/projects/project-name/runs/run-{i}" for i in range(0, 50, 3)
+    }
+    expected_allowed_resources = [
+        resource
+        for resource in resources
+        if resource["opa_resource"] in fake_opa_server.allowed_resources
+    ]
+
+    allowed_resources = await opa_provider.filter_by_permissions(
+        resources, lambda resource: resource["opa_resource"], action, auth_info
+    )
+    assert allowed_resources == expected_allowed_resources
+    assert [len(chunk) for chunk in fake_opa_server.filter_requests] == [10] * 5
+    assert fake_opa_server.max_concurrent_filter_requests == 2
+
+    # all the decisions are cached
+    fake_opa_server.filter_requests = []
+    allowed_resources = await opa_provider.filter_by_permissions(
+        resources, lambda resource: resource["opa_resource"], action, auth_info
+    )
+    assert allowed_resources == expected_allowed_resources
+    assert fake_opa_server.filter_requests == []
+    assert (
+        await opa_provider.query_permissions(
+            "/projects/project-name/runs/run-3", action, auth_info
+        )
+        is True
+    )
+    assert fake_opa_server.query_requests == 0
+
+    # only the resources without cached decisions are filtered
+    new_resource = {"uid": 100, "opa_resource": "/projects/project-name/runs/run-50"}
+    fake_opa_server.allowed_resources.add(new_resource["opa_resource"])
+    allowed_resources = await opa_provider.filter_by_permissions(
+        resources + [new_resource],
+        lambda resource: resource["opa_resource"],
+        action,
+        auth_info,
+    )
+    assert allowed_resources == expected_allowed_resources + [new_resource]
+    assert fake_opa_server.filter_requests == [[new_resource["opa_resource"]]]
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import queue
+import time
 import unittest.mock
 from contextlib import nullcontext as does_not_raise
 from unittest import mock
@@ -57,6 +60,45 @@ def k8s_helper():
         return k8s_helper
 
 
+class FakeSecretsWatch:
+    """Streams the secret events that the test puts on the queue"""
+
+    def __init__(self, events: queue.Queue):
+        self._events = events
+        self._stopped = False
+
+    def stream(self, func, **kwargs):
+        while not self._stopped:
+            try:
+                yield self._events.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+    def stop(self):
+        self._stopped = True
+
+
+@pytest.fixture
+def secret_events(k8s_helper, monkeypatch) -> queue.Queue:
+    events = queue.Queue()
+    monkeypatch.setattr(
+        server.api.utils.singletons.k8s.k8s_watch,
+        "Watch",
+        lambda: FakeSecretsWatch(events),
+    )
+    k8s_helper.running_inside_kubernetes_cluster = True
+    k8s_helper.v1api.list_namespaced_secret.return_value = k8s_client.V1SecretList(
+        items=[], metadata=k8s_client.V1ListMeta(resource_version="1")
+    )
+    k8s_helper.v1api.read_namespaced_secret.return_value = k8s_client.V1Secret(
+        data={"key1": base64.b64encode(b"value1").decode()}
+    )
+    secrets_cache = k8s_helper._get_secrets_cache(k8s_helper.namespace)
+    _wait_for(lambda: secrets_cache._watching)
+    yield events
+    secrets_cache.stop()
+
+
 def test_create_new_secret(k8s_helper):
     k8s_helper._read_secret.side_effect = k8s_dynamic_exceptions.NotFoundError(
         k8s_client_rest.ApiException(status=404)
@@ -379,3 +421,133 @@ def test_list_paginated_crds_retry(
         result = list(k8s_helper.list_crds_paginated("group", "v1", "objects", "my-ns"))
         if expected_result is not None:
             assert result == expected_result
+
+
+def test_secrets_cache_reads(k8s_helper, secret_events):
+    for _ in range(3):
+        assert k8s_helper.get_project_secret_data("my-project") == {"key1": "value1"}
+        assert k8s_helper.get_project_secret_keys("my-project") == ["key1"]
+    k8s_helper.v1api.read_namespaced_secret.assert_called_once_with(
+        k8s_helper.get_project_secret_name("my-project"), k8s_helper.namespace
+    )
+
+    # a secret that doesn't exist is cached as well
+    k8s_helper.v1api.read_namespaced_secret.side_effect = k8s_client_rest.ApiException(
+        status=404
+    )
+    for _ in range(3):
+        assert k8s_helper.get_project_secret_data("other-project") == {}
+    assert k8s_helper.v1api.read_namespaced_secret.call_count == 2
+
+    # other errors are not
+    k8s_helper.v1api.read_namespaced_secret.side_effect = k8s_client_rest.ApiException(
+        status=500
+    )
+    for _ in range(3):
+        assert k8s_helper.get_project_secret_data("failing-project") == {}
+    assert k8s_helper.v1api.read_namespaced_secret.call_count == 5
+
+
+def test_secrets_cache_watch_events(k8s_helper, secret_events):
+    secret_name = k8s_helper.get_project_secret_name("my-project")
+    assert k8s_helper.get_project_secret_data("my-project") == {"key1": "value1"}
+
+    secret_events.put(
+        {
+            "type": "MODIFIED",
+            "object": k8s_client.V1Secret(
+                metadata=k8s_client.V1ObjectMeta(
+                    name=secret_name, resource_version="2"
+                ),
+                data={"key1": base64.b64encode(b"value2").decode()},
+            ),
+        }
+    )
+    _wait_for(
+        lambda: k8s_helper.get_project_secret_data("my-project") == {"key1": "value2"}
+    )
+
+    secret_events.put(
+        {
+            "type": "DELETED",
+            "object": k8s_client.V1Secret(
+                metadata=k8s_client.V1ObjectMeta(
+                    name=secret_name, resource_version="3"
+                ),
+            ),
+        }
+    )
+    _wait_for(lambda: k8s_helper.get_project_secret_data("my-project") == {})
+    k8s_helper.v1api.read_namespaced_secret.assert_called_once()
+
+
+def test_secrets_cache_invalidated_on_write(k8s_helper, secret_events):
+    assert k8s_helper.get_project_secret_data("my-project") == {"key1": "value1"}
+    k8s_helper._read_secret.return_value = k8s_client.V1Secret()
+    k8s_helper.store_project_secrets("my-project", {"key2": "value2"})
+
+    k8s_helper.v1api.read_namespaced_secret.return_value = k8s_client.V1Secret(
+        data={
+            "key1": base64.b64encode(b"value1").decode(),
+            "key2": base64.b64encode(b"value2").decode(),
+        }
+    )
+    assert k8s_helper.get_project_secret_data("my-project") == {
+        "key1": "value1",
+        "key2": "value2",
+    }
+    assert k8s_helper.v1api.read_namespaced_secret.call_count == 2
+
+    k8s_helper.delete_project_secrets("my-project", ["key1"])
+    k8s_helper.v1api.read_namespaced_secret.return_value = k8s_client.V1Secret(
+        data={"key2": base64.b64encode(b"value2").decode()}
+    )
+    assert k8s_helper.get_project_secret_data("my-project") == {"key2": "value2"}
+
+
+def test_secrets_cache_ttl(k8s_helper, secret_events):
+    mlrun.mlconf.secret_stores.kubernetes.secrets_cache.ttl = 0
+    for _ in range(3):
+        assert k8s_helper.get_project_secret_data("my-project") == {"key1": "value1"}
+    assert k8s_helper.v1api.read_namespaced_secret.call_count == 3
+
+
+def test_secrets_cache_watch_forbidden(k8s_helper, monkeypatch):
+    monkeypatch.setattr(
+        server.api.utils.singletons.k8s.SecretsCache, "watch_retry_interval", 0
+    )
+    k8s_helper.running_inside_kubernetes_cluster = True
+    k8s_helper.v1api.list_namespaced_secret.side_effect = k8s_client_rest.ApiException(
+        status=403
+    )
+    k8s_helper.v1api.read_namespaced_secret.return_value = k8s_client.V1Secret(
+        data={"key1": base64.b64encode(b"value1").decode()}
+    )
+    secrets_cache = k8s_helper._get_secrets_cache(k8s_helper.namespace)
+    secrets_cache._thread.join(timeout=5)
+
+    # the watch isn't retried, and the secrets are read from the k8s api every time
+    assert not secrets_cache._thread.is_alive()
+    k8s_helper.v1api.list_namespaced_secret.assert_called_once()
+    for _ in range(3):
+        assert k8s_helper.get_project_secret_data("my-project") == {"key1": "value1"}
+    assert k8s_helper.v1api.read_namespaced_secret.call_count == 3
+
+
+def test_secrets_cache_disabled(k8s_helper):
+    mlrun.mlconf.secret_stores.kubernetes.secrets_cache.enabled = False
+    k8s_helper.running_inside_kubernetes_cluster = True
+    k8s_helper.v1api.read_namespaced_secret.return_value = k8s_client.V1Secret(
+        data={"key1": base64.b64encode(b"value1").decode()}
+    )
+    for _ in range(3):
+        assert k8s_helper.get_project_secret_data("my-project") == {"key1": "value1"}
+    assert k8s_helper.v1api.read_namespaced_secret.call_count == 3
+    assert k8s_helper._secrets_caches == {}
+
+
+def _wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for the condition"
+        time.sleep(0.01)
@@ -289,6 +289,62 @@ async def test_get_schedule_last_run_deleted(
     assert schedule.last_run == {}
 
 
+@pytest.mark.asyncio
+async def test_list_schedules_last_run_batched(
+    db: Session,
+    client: tests.api.conftest.TestClient,
+    scheduler: Scheduler,
+    k8s_secrets_mock: tests.api.conftest.K8sSecretsMock,
+):
+    cron_trigger = mlrun.common.schemas.ScheduleCronTrigger(year=1999)
+    project_name = config.default_project
+    create_project(db, project_name)
+    schedule_names = ["schedule-1", "schedule-2", "schedule-without-runs"]
+    for schedule_name in schedule_names:
+        scheduled_object = _create_mlrun_function_and_matching_scheduled_object(
+            db, project_name
+        )
+        scheduler.create_schedule(
+            db,
+            mlrun.common.schemas.AuthInfo(),
+            project_name,
+            schedule_name,
+            mlrun.common.schemas.ScheduleKinds.job,
+            scheduled_object,
+            cron_trigger,
+        )
+
+    run_uids = {}
+    for schedule_name in schedule_names[:2]:
+        response = await scheduler.invoke_schedule(
+            db, mlrun.common.schemas.AuthInfo(), project_name, schedule_name
+        )
+        run_uids[schedule_name] = response["data"]["metadata"]["uid"]
+
+    read_runs_spy = unittest.mock.Mock(wraps=get_db().read_runs_by_identifiers)
+    read_run_spy = unittest.mock.Mock(wraps=get_db().read_run)
+    with (
+        unittest.mock.patch.object(get_db(), "read_runs_by_identifiers", read_runs_spy),
+        unittest.mock.patch.object(get_db(), "read_run", read_run_spy),
+    ):
+        schedules = scheduler.list_schedules(
+            db, project_name, include_last_run=True
+        ).schedules
+
+    # all last runs are resolved in a single query
+    assert read_runs_spy.call_count == 1
+    assert len(read_runs_spy.call_args.args[1]) == 2
+    assert read_run_spy.call_count == 0
+
+    assert len(schedules) == 3
+    for schedule in schedules:
+        if schedule.name in run_uids:
+            assert schedule.last_run["metadata"]["uid"] == run_uids[schedule.name]
+        else:
+            assert schedule.last_run_uri is None
+            assert schedule.last_run == {}
+
+
 @pytest.mark.asyncio
 async def test_create_schedule_mlrun_function(
     db: Session,
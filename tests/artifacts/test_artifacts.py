@@ -637,6 +637,61 @@ def test_register_artifacts(rundb_mock):
     assert artifact.tree == expected_tree
 
 
+def test_register_artifacts_in_bulk(rundb_mock, tmp_path):
+    project = mlrun.new_project("my-projects", save=False)
+    project.spec.artifact_path = str(results_dir)
+    for index in range(3):
+        src_path = tmp_path / f"my-art-{index}.txt"
+        src_path.write_text(f"x={index}")
+        project.set_artifact(
+            f"my-art-{index}",
+            artifact=mlrun.artifacts.Artifact(
+                key=f"my-art-{index}", src_path=str(src_path)
+            ),
+        )
+
+    # an artifact produced by a run, which was already registered
+    run_artifact = mlrun.artifacts.Artifact(key="run-art", body=b"y=1")
+    run_artifact.spec.producer = {
+        "kind": "run",
+        "name": "my-run",
+        "project": "my-projects",
+        "tag": "my-run-uid",
+    }
+    run_artifact.target_path = "v3io:///projects/my-projects/run-art"
+    project.set_artifact("run-art", artifact=run_artifact)
+    rundb_mock._artifacts["run-art"] = run_artifact.to_dict()
+
+    with (
+        unittest.mock.patch.object(
+            rundb_mock, "store_artifacts", wraps=rundb_mock.store_artifacts
+        ) as store_artifacts,
+        unittest.mock.patch.object(rundb_mock, "store_artifact") as store_artifact,
+    ):
+        project.register_artifacts()
+
+    # all artifacts are stored with a single request, existing run artifacts are skipped
+    store_artifact.assert_not_called()
+    assert store_artifacts.call_count == 1
+    stored_artifacts = store_artifacts.call_args.args[0]
+    assert [artifact["metadata"]["key"] for artifact in stored_artifacts] == [
+        "my-art-0",
+        "my-art-1",
+        "my-art-2",
+        "run-art",
+    ]
+    assert store_artifacts.call_args.kwargs["skip_if_exists"] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+    for index in range(3):
+        artifact = project.get_artifact(f"my-art-{index}")
+        assert artifact.target_path.startswith(str(results_dir))
+        assert mlrun.get_dataitem(artifact.target_path).get() == f"x={index}".encode()
+
+
 def test_producer_in_exported_artifact():
     project_name = "my-project"
     project = mlrun.new_project(project_name, save=False)
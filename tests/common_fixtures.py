@@ -270,6 +270,18 @@ class RunDBMock:
         self._artifacts[key] = artifact
         return artifact
 
+    def store_artifacts(self, artifacts, project="", skip_if_exists=None):
+        skip_if_exists = skip_if_exists or [False] * len(artifacts)
+        uids = []
+        for artifact, skip in zip(artifacts, skip_if_exists):
+            key = artifact["spec"].get("db_key") or artifact["metadata"]["key"]
+            if skip and key in self._artifacts:
+                uids.append(None)
+                continue
+            self._artifacts[key] = artifact
+            uids.append(key)
+        return uids
+
     def read_artifact(self, key, tag=None, iter=None, project="", tree=None, uid=None):
         return self._artifacts.get(key, None)
 
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -23,6 +25,8 @@ import mlrun
 import mlrun.errors
 from mlrun.artifacts import ModelArtifact
 from mlrun.artifacts.base import LinkArtifact
+from mlrun.datastore.base import DataStore
+from mlrun.datastore.filestore import FileStore
 from mlrun.datastore.inmem import InMemoryStore
 from tests.conftest import rundb_path
 
@@ -361,3 +365,103 @@ def test_item_to_real_path_map(virtual_path: str, tmpdir: Path) -> None:
     assert data.get() == b"abc", "failed put/get test"
     assert data.stat().size == 3, "got wrong file size"
     assert os.path.isfile(os.path.join(tmpdir, "test1.txt"))
+
+
+class _SlowInMemoryStore(InMemoryStore):
+    """In-memory store with ranged reads that take a while, recording the reads and their concurrency"""
+
+    supports_ranged_get = True
+
+    def __init__(self, latency=0.05, fail_at_offset=None):
+        super().__init__()
+        self.latency = latency
+        self.fail_at_offset = fail_at_offset
+        self.reads = []
+        self.max_concurrent_reads = 0
+        self._concurrent_reads = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, size=None, offset=0):
+        with self._lock:
+            self.reads.append((offset, size))
+            self._concurrent_reads += 1
+            self.max_concurrent_reads = max(
+                self.max_concurrent_reads, self._concurrent_reads
+            )
+        try:
+            time.sleep(self.latency)
+            if offset == self.fail_at_offset:
+                raise ConnectionError("connection reset")
+            return super().get(key, size=size, offset=offset)
+        finally:
+            with self._lock:
+                self._concurrent_reads -= 1
+
+
+class _RangedFileStore(FileStore):
+    supports_ranged_get = True
+    download = DataStore.download
+
+
+@pytest.mark.parametrize("size", [1_000_000, 1_000_001, 999_999])
+def test_ranged_download(tmpdir: Path, size: int) -> None:
+    mlrun.mlconf.storage.download.chunk_size = 100_000
+    mlrun.mlconf.storage.download.max_concurrency = 4
+    data = os.urandom(size)
+    store = _SlowInMemoryStore()
+    store.put("model.bin", data)
+    target_path = str(tmpdir / "model.bin")
+
+    start = time.monotonic()
+    store.download("model.bin", target_path)
+    duration = time.monotonic() - start
+
+    with open(target_path, "rb") as fp:
+        assert fp.read() == data
+    assert len(store.reads) == -(-size // 100_000)
+    assert all(read_size <= 100_000 for _, read_size in store.reads)
+    assert store.max_concurrent_reads == 4
+    # 10-11 reads of 50ms each, 4 at a time
+    assert duration < len(store.reads) * store.latency * 0.75
+
+
+def test_ranged_download_small_object(tmpdir: Path) -> None:
+    mlrun.mlconf.storage.download.chunk_size = 100_000
+    store = _SlowInMemoryStore(latency=0)
+    store.put("model.bin", b"abc")
+    target_path = str(tmpdir / "model.bin")
+
+    store.download("model.bin", target_path)
+
+    with open(target_path, "rb") as fp:
+        assert fp.read() == b"abc"
+    assert store.reads == [(0, None)]
+
+
+def test_ranged_download_failure(tmpdir: Path) -> None:
+    mlrun.mlconf.storage.download.chunk_size = 100_000
+    mlrun.mlconf.storage.download.max_concurrency = 2
+    store = _SlowInMemoryStore(latency=0.01, fail_at_offset=300_000)
+    store.put("model.bin", os.urandom(1_000_000))
+    target_path = str(tmpdir / "model.bin")
+
+    with pytest.raises(ConnectionError):
+        store.download("model.bin", target_path)
+
+    # no partially written file is left, and the remaining reads were cancelled
+    assert not os.path.exists(target_path)
+    assert len(store.reads) < 10
+
+
+def test_ranged_download_file_store(tmpdir: Path) -> None:
+    mlrun.mlconf.storage.download.chunk_size = 1_000
+    data = os.urandom(10_500)
+    source_path = str(tmpdir / "source.bin")
+    with open(source_path, "wb") as fp:
+        fp.write(data)
+    target_path = str(tmpdir / "target.bin")
+
+    _RangedFileStore(None, "file", "file").download(source_path, target_path)
+
+    with open(target_path, "rb") as fp:
+        assert fp.read() == data
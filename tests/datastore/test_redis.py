@@ -0,0 +1,121 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import unittest.mock
+
+import fakeredis
+import pytest
+from storey.dtypes import RedisError
+
+import mlrun
+from mlrun.datastore.redis import RedisPipelineDriver, RedisStore
+
+num_keys = 250
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def round_trips(redis_client):
+    """Count the requests sent to redis, a pipeline is sent as a single request"""
+    connection_class = type(redis_client.connection_pool.get_connection("_"))
+    send_packed_command = connection_class.send_packed_command
+    requests = []
+
+    def _send_packed_command(connection, *args, **kwargs):
+        requests.append(args)
+        return send_packed_command(connection, *args, **kwargs)
+
+    with unittest.mock.patch.object(
+        connection_class, "send_packed_command", _send_packed_command
+    ):
+        yield requests
+
+
+async def _save_and_load_keys(driver: RedisPipelineDriver, attributes):
+    await asyncio.gather(
+        *[
+            driver._save_key(
+                "", "project/table", f"key-{i}", None, False, {"x": i, "y": i * 2}
+            )
+            for i in range(num_keys)
+        ]
+    )
+    return await asyncio.gather(
+        *[
+            driver._load_by_key("", "project/table", f"key-{i}", attributes)
+            for i in range(num_keys)
+        ]
+    )
+
+
+@pytest.mark.parametrize("attributes", ["*", ["x", "y"]])
+@pytest.mark.parametrize(
+    "pipeline_size, expected_round_trips",
+    [(1, 2 * num_keys), (100, 6), (1000, 2)],
+)
+def test_redis_pipeline_driver(
+    redis_client, round_trips, attributes, pipeline_size, expected_round_trips
+):
+    driver = RedisPipelineDriver(
+        redis_client=redis_client, key_prefix="/", pipeline_size=pipeline_size
+    )
+
+    values = asyncio.run(_save_and_load_keys(driver, attributes))
+
+    assert values == [{"x": i, "y": i * 2} for i in range(num_keys)]
+    assert len(round_trips) == expected_round_trips
+
+
+def test_redis_pipeline_driver_missing_keys_and_errors(redis_client):
+    redis_client.set("{/project/table:bad-key}:static", "not a hash")
+    driver = RedisPipelineDriver(redis_client=redis_client, key_prefix="/")
+
+    async def _load_keys():
+        return await asyncio.gather(
+            driver._load_by_key("", "project/table", "missing-key", ["x"]),
+            driver._load_by_key("", "project/table", "missing-key", "*"),
+            driver._load_by_key("", "project/table", "bad-key", ["x"]),
+            return_exceptions=True,
+        )
+
+    missing_attributes, missing_all, error = asyncio.run(_load_keys())
+
+    # only the command that failed in the pipeline fails
+    assert missing_attributes == {}
+    assert missing_all == {}
+    assert isinstance(error, RedisError)
+
+
+def test_redis_store_recursive_rm(redis_client, round_trips):
+    mlrun.mlconf.redis.pipeline_size = 100
+    store = RedisStore(
+        mlrun.datastore.store_manager, "redis", "redis", endpoint="localhost"
+    )
+    store._redis = redis_client
+    for i in range(num_keys):
+        store.put(f"/dir/file-{i}", "data")
+    store.put("/other/file", "data")
+    round_trips.clear()
+
+    store.rm("/dir/", recursive=True)
+
+    assert store.listdir("/dir/") == []
+    assert store.listdir("/other/") == ["/other/file"]
+    # the keys are scanned and deleted in pages and pipelines of up to 100 keys
+    assert len(round_trips) < 10
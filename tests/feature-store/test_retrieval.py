@@ -0,0 +1,478 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import mlrun
+import mlrun.feature_store as fstore
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store.retrieval.base import _query_to_filters
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+from mlrun.feature_store.retrieval.materialization import VectorMaterialization
+from mlrun.model import DataTarget
+
+num_rows = 10_000
+
+
+def _create_feature_set(
+    name: str, df: pd.DataFrame, path: str, timestamp_key: str = None
+) -> fstore.FeatureSet:
+    # small row groups, so that the filters skip most of the file
+    df.to_parquet(path, row_group_size=1_000, index=False)
+    feature_set = fstore.FeatureSet(
+        name,
+        entities=[fstore.Entity("patient_id", value_type="int")],
+        timestamp_key=timestamp_key,
+    )
+    for column, dtype in df.dtypes.items():
+        if column not in ["patient_id", timestamp_key]:
+            value_type = {"int64": "int", "float64": "float"}.get(dtype.name, "str")
+            feature_set.add_feature(fstore.Feature(name=column, value_type=value_type))
+    feature_set.spec.targets = [ParquetTarget(path=path)]
+    feature_set.status.update_target(DataTarget(kind="parquet", path=path))
+    return feature_set
+
+
+@pytest.fixture
+def feature_sets(tmp_path) -> dict[str, fstore.FeatureSet]:
+    rng = np.random.default_rng(seed=42)
+    patients = pd.DataFrame(
+        {
+            "patient_id": np.arange(num_rows),
+            "heart_rate": rng.random(num_rows) * 100,
+            "city": rng.choice(["tel-aviv", "haifa"], num_rows),
+            "timestamp": pd.Timestamp("2023-12-31")
+            + pd.to_timedelta(np.arange(num_rows), unit="s"),
+        }
+    )
+    measurements = pd.DataFrame(
+        {
+            "patient_id": np.arange(num_rows),
+            "blood_pressure": rng.random(num_rows) * 100,
+            "timestamp": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(np.arange(num_rows), unit="s"),
+        }
+    )
+    return {
+        "patients": _create_feature_set(
+            "patients",
+            patients,
+            str(tmp_path / "patients.parquet"),
+            timestamp_key="timestamp",
+        ),
+        "measurements": _create_feature_set(
+            "measurements",
+            measurements,
+            str(tmp_path / "measurements.parquet"),
+            timestamp_key="timestamp",
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    ("query", "expected_filters"),
+    [
+        ("a > 1", [("a", ">", 1)]),
+        ("1 < a", [("a", ">", 1)]),
+        (
+            "a > 1 and b == 'x' & c <= -2.5",
+            [("a", ">", 1), ("b", "==", "x"), ("c", "<=", -2.5)],
+        ),
+        ("0 < a < 10", [("a", ">", 0), ("a", "<", 10)]),
+        ("a in [1, 2]", [("a", "in", [1, 2])]),
+        ("a == ['x', 'y']", [("a", "in", ["x", "y"])]),
+        # a disjunction, a negation or a non-literal operand can't be pushed down
+        ("a > 1 or b < 2", []),
+        ("a > 1 | b < 2", []),
+        ("~(a > 1)", []),
+        ("a != 1", []),
+        ("a not in [1, 2]", []),
+        ("a > b", []),
+        ("a > @value", []),
+        ("`a b` > 1", []),
+        ("(a > 1 or b < 2) and c == 3", [("c", "==", 3)]),
+    ],
+)
+def test_query_to_filters(query, expected_filters):
+    assert sorted(_query_to_filters(query)) == sorted(expected_filters)
+
+
+@pytest.mark.parametrize(
+    ("features", "kwargs", "expected_rows_read"),
+    [
+        (
+            ["patients.*"],
+            {"entity_rows": pd.DataFrame({"patient_id": [5, 7_000, 9_999]})},
+            [3],
+        ),
+        (
+            ["patients.*", "measurements.blood_pressure"],
+            {
+                "entity_rows": pd.DataFrame({"patient_id": [5, 7_000, 9_999]}),
+                "query": "heart_rate > 10",
+            },
+            [3, 3],
+        ),
+        (
+            ["patients.*"],
+            {"query": "heart_rate > 90 and city == 'haifa'"},
+            [pytest.approx(num_rows * 0.05, rel=0.2)],
+        ),
+        # the query isn't pushed down to the right side of an as-of join
+        (
+            ["measurements.blood_pressure", "patients.heart_rate"],
+            {"query": "heart_rate > 90 and blood_pressure < 10"},
+            [pytest.approx(num_rows * 0.1, rel=0.2), num_rows],
+        ),
+    ],
+)
+def test_offline_vector_pushdown(feature_sets, features, kwargs, expected_rows_read):
+    # read the feature sets in order, to match the rows read by each of them
+    mlrun.mlconf.feature_store.offline_concurrent_reads = 1
+
+    def get_offline_vector(rows_read: list[int]):
+        vector = fstore.FeatureVector("vector", features)
+        vector.feature_set_objects = {
+            name: feature_set
+            for name, feature_set in feature_sets.items()
+            if any(feature.startswith(f"{name}.") for feature in features)
+        }
+        read_parquet = pd.read_parquet
+
+        def read_parquet_spy(*args, **kw):
+            df = read_parquet(*args, **kw)
+            rows_read.append(len(df))
+            return df
+
+        with unittest.mock.patch("pandas.read_parquet", read_parquet_spy):
+            return LocalFeatureMerger(vector).start(**kwargs).to_dataframe()
+
+    rows_read = []
+    mlrun.mlconf.feature_store.offline_pushdown.enabled = False
+    expected_df = get_offline_vector(rows_read)
+    assert rows_read == [num_rows] * len(expected_rows_read)
+
+    rows_read = []
+    mlrun.mlconf.feature_store.offline_pushdown.enabled = True
+    df = get_offline_vector(rows_read)
+    assert rows_read == expected_rows_read
+    pd.testing.assert_frame_equal(df, expected_df)
+
+
+@pytest.mark.parametrize("concurrent_reads", [1, 2])
+def test_offline_vector_concurrent_reads(feature_sets, concurrent_reads):
+    mlrun.mlconf.feature_store.offline_concurrent_reads = concurrent_reads
+    get_engine_df = LocalFeatureMerger._get_engine_df
+    lock = threading.Lock()
+    reads = {"running": 0, "max_running": 0}
+
+    def slow_get_engine_df(*args, **kwargs):
+        with lock:
+            reads["running"] += 1
+            reads["max_running"] = max(reads["max_running"], reads["running"])
+        time.sleep(0.2)
+        try:
+            return get_engine_df(*args, **kwargs)
+        finally:
+            with lock:
+                reads["running"] -= 1
+
+    vector = fstore.FeatureVector(
+        "vector", ["patients.heart_rate", "measurements.blood_pressure"]
+    )
+    vector.feature_set_objects = dict(feature_sets)
+    with unittest.mock.patch.object(
+        LocalFeatureMerger, "_get_engine_df", slow_get_engine_df
+    ):
+        df = LocalFeatureMerger(vector).start().to_dataframe()
+
+    assert reads["max_running"] == concurrent_reads
+    assert list(df.columns) == ["heart_rate", "blood_pressure"]
+    assert len(df) == num_rows
+
+
+@pytest.fixture
+def as_of_feature_sets(tmp_path) -> dict[str, fstore.FeatureSet]:
+    rng = np.random.default_rng(seed=42)
+    num_patients = 100
+    # unique timestamps, so that the as-of join result doesn't depend on the order of equal timestamps
+    timestamps = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        rng.permutation(num_rows), unit="s"
+    )
+    measurements = pd.DataFrame(
+        {
+            "patient_id": rng.integers(0, num_patients, num_rows),
+            "heart_rate": rng.integers(40, 180, num_rows),
+            "blood_pressure": rng.random(num_rows) * 100,
+            "timestamp": timestamps,
+        }
+    )
+    patients = pd.DataFrame(
+        {
+            "patient_id": np.arange(num_patients),
+            "age": rng.integers(20, 90, num_patients),
+        }
+    )
+    return {
+        "measurements": _create_feature_set(
+            "measurements",
+            measurements,
+            str(tmp_path / "measurements.parquet"),
+            timestamp_key="timestamp",
+        ),
+        "patients": _create_feature_set(
+            "patients", patients, str(tmp_path / "patients.parquet")
+        ),
+    }
+
+
+def test_offline_vector_chunked_join(as_of_feature_sets, tmp_path):
+    rng = np.random.default_rng(seed=7)
+    num_entity_rows = 5_000
+    timestamps = pd.Timestamp("2023-12-31 23:00") + pd.to_timedelta(
+        rng.integers(0, num_rows * 1_200, num_entity_rows), unit="ms"
+    )
+    entity_rows = pd.DataFrame(
+        {
+            # some of the patients in the earlier chunks have no measurements or details
+            "patient_id": np.where(
+                timestamps < timestamps.sort_values()[num_entity_rows // 2],
+                rng.integers(0, 120, num_entity_rows),
+                rng.integers(0, 100, num_entity_rows),
+            ),
+            "timestamp": timestamps,
+        }
+    )
+
+    def get_offline_vector(target, engine_args):
+        vector = fstore.FeatureVector(
+            "vector",
+            ["measurements.heart_rate", "measurements.blood_pressure", "patients.age"],
+            with_indexes=True,
+        )
+        vector.feature_set_objects = dict(as_of_feature_sets)
+        merger = LocalFeatureMerger(vector, **engine_args)
+        with unittest.mock.patch.object(vector, "save"):
+            response = merger.start(
+                entity_rows=entity_rows,
+                entity_timestamp_column="timestamp",
+                target=target,
+            )
+        return merger, response
+
+    _, expected_response = get_offline_vector(
+        ParquetTarget(path=str(tmp_path / "expected.parquet")), {}
+    )
+    expected_df = expected_response.to_dataframe()
+
+    merger, response = get_offline_vector(
+        ParquetTarget(path=str(tmp_path / "chunked") + "/", partitioned=False),
+        {"chunksize": 1_000},
+    )
+    assert merger._result_df is None
+    assert len(list((tmp_path / "chunked").iterdir())) == 5
+    df = response.to_dataframe()
+
+    sort_columns = ["patient_id", "timestamp"]
+    pd.testing.assert_frame_equal(
+        df.reset_index().sort_values(sort_columns, ignore_index=True),
+        expected_df.reset_index().sort_values(sort_columns, ignore_index=True),
+        check_like=True,
+        # the chunked vector is loaded from the target, which stores the timestamps in microseconds
+        check_dtype=False,
+    )
+    # the patients without details are dropped by the (inner) join, and the rows that precede the measurements or
+    # have no measurements have no heart rate, so it's a float in the earlier chunks and an integer in the later ones
+    vector_df = df.reset_index()
+    assert len(vector_df) == (entity_rows["patient_id"] < 100).sum()
+    assert vector_df["patient_id"].max() < 100
+    assert vector_df["heart_rate"].isna().any()
+    assert vector_df["age"].notna().all()
+
+    # the chunks are rewritten with the unified types of all the chunks
+    chunk_schemas = [
+        pq.read_schema(path) for path in (tmp_path / "chunked").rglob("*.parquet")
+    ]
+    assert len(chunk_schemas) == 5
+    for schema in chunk_schemas:
+        assert schema.equals(chunk_schemas[0])
+    assert chunk_schemas[0].field("age").type == pa.int64()
+    assert chunk_schemas[0].field("heart_rate").type == pa.float64()
+
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "chunked").sort_values(
+            sort_columns, ignore_index=True
+        ),
+        pd.read_parquet(tmp_path / "expected.parquet").sort_values(
+            sort_columns, ignore_index=True
+        ),
+        check_like=True,
+    )
+
+
+def test_offline_vector_materialization(tmp_path):
+    mlrun.mlconf.feature_store.offline_concurrent_reads = 1
+    mlrun.mlconf.feature_store.offline_materialization.enabled = True
+    mlrun.mlconf.feature_store.offline_materialization.path = str(
+        tmp_path / "materialized"
+    )
+    rng = np.random.default_rng(seed=42)
+    num_patients = 50
+
+    def generate(start: int, num: int, **columns) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "patient_id": rng.integers(0, num_patients, num),
+                **{name: rng.random(num) * scale for name, scale in columns.items()},
+                "timestamp": pd.Timestamp("2024-01-01")
+                + pd.to_timedelta(start + rng.permutation(num) * 2, unit="s"),
+            }
+        )
+
+    data = {
+        "measurements": generate(1, 1_000, blood_pressure=100),
+        "vitals": generate(0, 1_000, heart_rate=200),
+        "patients": pd.DataFrame(
+            {
+                "patient_id": np.arange(num_patients),
+                "age": rng.integers(20, 90, num_patients),
+            }
+        ),
+    }
+    feature_sets = {}
+
+    def ingest(name: str, df: pd.DataFrame):
+        data[name] = df
+        feature_sets[name] = _create_feature_set(
+            name,
+            df,
+            str(tmp_path / f"{name}.parquet"),
+            timestamp_key="timestamp" if "timestamp" in df.columns else None,
+        )
+        for target in feature_sets[name].status.targets:
+            target.updated = str(pd.Timestamp.now())
+
+    for name, df in data.items():
+        ingest(name, df)
+
+    # the number of rows of each digest of the feature sets data
+    digested_rows = []
+    get_data_digest = VectorMaterialization._get_data_digest
+
+    def get_data_digest_spy(*args, **kwargs):
+        digest, max_time = get_data_digest(*args, **kwargs)
+        digested_rows.append(digest[0])
+        return digest, max_time
+
+    def get_offline_vector() -> tuple[pd.DataFrame, list[int]]:
+        digested_rows.clear()
+        vector = fstore.FeatureVector(
+            "vector",
+            ["measurements.blood_pressure", "vitals.heart_rate", "patients.age"],
+            with_indexes=True,
+        )
+        vector.feature_set_objects = dict(feature_sets)
+        rows_read = []
+        get_engine_df = LocalFeatureMerger._get_engine_df
+
+        def get_engine_df_spy(*args, **kwargs):
+            df = get_engine_df(*args, **kwargs)
+            rows_read.append(len(df))
+            return df
+
+        with (
+            unittest.mock.patch.object(vector, "save"),
+            unittest.mock.patch.object(
+                LocalFeatureMerger, "_get_engine_df", get_engine_df_spy
+            ),
+            unittest.mock.patch.object(
+                VectorMaterialization,
+                "_get_data_digest",
+                staticmethod(get_data_digest_spy),
+            ),
+        ):
+            df = LocalFeatureMerger(vector).start().to_dataframe()
+        return df, rows_read
+
+    def get_expected_vector() -> pd.DataFrame:
+        mlrun.mlconf.feature_store.offline_materialization.enabled = False
+        try:
+            return get_offline_vector()[0]
+        finally:
+            mlrun.mlconf.feature_store.offline_materialization.enabled = True
+
+    df, rows_read = get_offline_vector()
+    assert rows_read == [1_000, 1_000, num_patients]
+    assert digested_rows == [1_000, 1_000]
+    pd.testing.assert_frame_equal(df, get_expected_vector())
+
+    # nothing was ingested, the materialized vector is reused
+    reused_df, rows_read = get_offline_vector()
+    assert rows_read == []
+    pd.testing.assert_frame_equal(reused_df, df)
+
+    # new rows were ingested, only the new measurements are joined
+    ingest(
+        "measurements",
+        pd.concat([data["measurements"], generate(3_001, 100, blood_pressure=100)]),
+    )
+    ingest("vitals", pd.concat([data["vitals"], generate(3_000, 100, heart_rate=200)]))
+    df, rows_read = get_offline_vector()
+    assert rows_read == [100, 1_100, num_patients]
+    # the data up to the watermark is validated, and only the new rows are added to the digests
+    assert digested_rows == [1_000, 1_000, 100, 100]
+    assert len(df) == 1_100
+    assert len(list((tmp_path / "materialized").glob("*/*.parquet"))) == 2
+    # the appended rows follow the existing ones
+    pd.testing.assert_frame_equal(
+        df.reset_index().sort_values(["patient_id", "timestamp"], ignore_index=True),
+        get_expected_vector()
+        .reset_index()
+        .sort_values(["patient_id", "timestamp"], ignore_index=True),
+    )
+
+    # more rows were ingested, the incrementally updated digest is valid for another append
+    ingest(
+        "measurements",
+        pd.concat([data["measurements"], generate(5_001, 50, blood_pressure=100)]),
+    )
+    df, rows_read = get_offline_vector()
+    assert rows_read == [50, 1_100, num_patients]
+    assert digested_rows == [1_100, 50]
+    assert len(df) == 1_150
+    assert len(list((tmp_path / "materialized").glob("*/*.parquet"))) == 3
+    pd.testing.assert_frame_equal(
+        df.reset_index().sort_values(["patient_id", "timestamp"], ignore_index=True),
+        get_expected_vector()
+        .reset_index()
+        .sort_values(["patient_id", "timestamp"], ignore_index=True),
+    )
+
+    # rows before the watermark were changed, the vector is regenerated
+    vitals = data["vitals"].copy()
+    vitals.loc[vitals.index[0], "heart_rate"] = -1
+    ingest("vitals", vitals)
+    df, rows_read = get_offline_vector()
+    assert rows_read == [1_150, 1_100, num_patients]
+    assert len(list((tmp_path / "materialized").glob("*/*.parquet"))) == 1
+    pd.testing.assert_frame_equal(df, get_expected_vector())
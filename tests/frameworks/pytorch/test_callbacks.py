@@ -0,0 +1,257 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import unittest.mock
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+import mlrun
+from mlrun.frameworks.pytorch import (
+    Callback,
+    CheckpointCallback,
+    EarlyStoppingCallback,
+    PyTorchMLRunInterface,
+)
+from mlrun.frameworks.pytorch.callbacks_handler import CallbacksHandler
+
+
+class _EpochEndCallback(Callback):
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+        self.epochs = []
+
+    def on_epoch_end(self, epoch: int):
+        self.epochs.append(epoch)
+        return self.result
+
+
+def _get_data_loader(num_rows: int = 16) -> DataLoader:
+    generator = torch.Generator().manual_seed(0)
+    x = torch.randn(num_rows, 4, generator=generator)
+    y = x @ torch.tensor([[1.0], [-2.0], [0.5], [3.0]])
+    return DataLoader(TensorDataset(x, y), batch_size=4)
+
+
+def _train(
+    callbacks: list, epochs: int, learning_rate: float = 0.1, context=None
+) -> torch.nn.Module:
+    torch.manual_seed(0)
+    model = torch.nn.Linear(4, 1)
+    PyTorchMLRunInterface(
+        model=model,
+        context=context if context is not None else unittest.mock.Mock(labels={}),
+    ).train(
+        training_set=_get_data_loader(),
+        validation_set=_get_data_loader(),
+        loss_function=torch.nn.MSELoss(),
+        optimizer=torch.optim.SGD(model.parameters(), lr=learning_rate),
+        epochs=epochs,
+        callbacks=callbacks,
+        use_cuda=False,
+    )
+    return model
+
+
+def _run_epochs(callback: Callback, loss_values: list[float], model=None):
+    # run the callback through the epochs of a training with the given validation losses
+    callback.on_setup(
+        model=model or torch.nn.Linear(4, 1),
+        validation_set=_get_data_loader(),
+        loss_function=torch.nn.MSELoss(),
+        metric_functions=[],
+    )
+    callback.on_run_begin()
+    for epoch, loss_value in enumerate(loss_values):
+        callback.on_validation_end(
+            loss_value=torch.tensor(loss_value), metric_values=[]
+        )
+        if callback.on_epoch_end(epoch=epoch) is False:
+            break
+    callback.on_run_end()
+
+
+@pytest.mark.parametrize(
+    "results, expected_result",
+    [
+        # callbacks that don't return a value don't affect the result
+        ([None, None], True),
+        ([None, True], True),
+        ([True, True], True),
+        ([None, False], False),
+        ([True, 0], False),
+    ],
+)
+def test_callbacks_handler_results(results, expected_result):
+    callbacks_handler = CallbacksHandler(
+        callbacks=[
+            (f"callback_{index}", _EpochEndCallback(result=result))
+            for index, result in enumerate(results)
+        ]
+    )
+    assert callbacks_handler.on_epoch_end(epoch=0) is expected_result
+
+
+def test_callback_stops_training():
+    stopping_callback = _EpochEndCallback(result=False)
+    other_callback = _EpochEndCallback(result=None)
+    _train(
+        callbacks=[("stopping", stopping_callback), ("other", other_callback)],
+        epochs=5,
+    )
+    # all the callbacks are called at the end of the epoch in which the training is stopped
+    assert stopping_callback.epochs == [0]
+    assert other_callback.epochs == [0]
+
+
+@pytest.mark.parametrize(
+    "loss_values, patience, min_delta, expected_best_epoch, expected_stopped_epoch",
+    [
+        ([1.0, 0.9, 0.8, 0.7], 2, 0.0, 4, None),
+        ([1.0, 0.9, 0.95, 0.92, 0.8], 2, 0.0, 2, 4),
+        # improvements of less than the minimal delta are not counted
+        ([1.0, 0.95, 0.8, 0.75, 0.72, 0.5], 2, 0.1, 3, 5),
+        ([1.0, 1.0, 0.5], 1, 0.0, 1, 2),
+    ],
+)
+def test_early_stopping_patience(
+    loss_values, patience, min_delta, expected_best_epoch, expected_stopped_epoch
+):
+    callback = EarlyStoppingCallback(patience=patience, min_delta=min_delta)
+    _run_epochs(callback=callback, loss_values=loss_values)
+    assert callback.get_best_epoch() == expected_best_epoch
+    assert callback.get_best_value() == pytest.approx(
+        loss_values[expected_best_epoch - 1]
+    )
+    assert callback.get_stopped_epoch() == expected_stopped_epoch
+
+
+def test_early_stopping_stops_training():
+    epochs_callback = _EpochEndCallback(result=True)
+    early_stopping_callback = EarlyStoppingCallback(patience=2)
+    # the model isn't trained, so the validation loss doesn't improve after the first epoch
+    _train(
+        callbacks=[epochs_callback, early_stopping_callback],
+        epochs=10,
+        learning_rate=0.0,
+    )
+    assert early_stopping_callback.get_best_epoch() == 1
+    assert early_stopping_callback.get_stopped_epoch() == 3
+    assert epochs_callback.epochs == [0, 1, 2]
+
+
+@pytest.mark.parametrize("callback_class", [EarlyStoppingCallback, CheckpointCallback])
+def test_callbacks_require_validation_set(callback_class):
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        callback_class().on_setup(
+            model=torch.nn.Linear(4, 1), loss_function=torch.nn.MSELoss()
+        )
+
+
+def test_checkpoint_top_k(tmp_path):
+    model = torch.nn.Linear(4, 1)
+
+    class SetWeightsCallback(CheckpointCallback):
+        def on_epoch_end(self, epoch: int) -> bool:
+            # mark the parameters with the epoch, to validate which epoch was checkpointed
+            with torch.no_grad():
+                model.weight.fill_(epoch + 1)
+            return super().on_epoch_end(epoch=epoch)
+
+    callback = SetWeightsCallback(top_k=2, output_directory=str(tmp_path))
+    _run_epochs(callback=callback, loss_values=[0.5, 0.4, 0.6, 0.3, 0.45], model=model)
+
+    checkpoints = callback.get_checkpoints()
+    assert [checkpoint["epoch"] for checkpoint in checkpoints] == [4, 2]
+    assert [checkpoint["value"] for checkpoint in checkpoints] == pytest.approx(
+        [0.3, 0.4]
+    )
+    # the checkpoints that dropped out of the top are deleted
+    assert sorted(os.listdir(tmp_path)) == [
+        "checkpoint_epoch_2.pt",
+        "checkpoint_epoch_4.pt",
+    ]
+    for checkpoint in checkpoints:
+        state_dict = torch.load(checkpoint["path"])
+        assert torch.all(state_dict["weight"] == checkpoint["epoch"])
+
+
+def test_checkpoints_logged_once_written(tmp_path):
+    logged = []
+
+    def log_artifact(key, local_path, labels, **kwargs):
+        # the checkpoint is logged only after it was written
+        assert os.path.exists(local_path)
+        logged.append((key, labels["epoch"]))
+
+    context = unittest.mock.Mock(log_artifact=log_artifact)
+    callback = CheckpointCallback(
+        context=context, top_k=2, output_directory=str(tmp_path)
+    )
+    callback.on_setup(
+        model=torch.nn.Linear(4, 1),
+        validation_set=_get_data_loader(),
+        loss_function=torch.nn.MSELoss(),
+        metric_functions=[],
+    )
+    callback.on_run_begin()
+    for epoch, loss_value in enumerate([0.5, 0.4, 0.6, 0.3]):
+        callback.on_validation_end(
+            loss_value=torch.tensor(loss_value), metric_values=[]
+        )
+        callback.on_epoch_end(epoch=epoch)
+    # wait for the submitted writes, the checkpoints are logged during the run
+    callback._executor.submit(lambda: None).result()
+
+    # only the ranks that changed are logged again on every new checkpoint
+    expected_logged = [
+        ("checkpoint_1", 1),
+        ("checkpoint_1", 2),
+        ("checkpoint_2", 1),
+        ("checkpoint_1", 4),
+        ("checkpoint_2", 2),
+    ]
+    assert logged == expected_logged
+    callback.on_run_end()
+    assert logged == expected_logged
+
+
+def _train_with_checkpoints(context: mlrun.MLClientCtx, epochs: int, top_k: int):
+    checkpoint_callback = CheckpointCallback(context=context, top_k=top_k)
+    _train(callbacks=[checkpoint_callback], epochs=epochs, context=context)
+    context.log_result(
+        "kept_epochs",
+        [checkpoint["epoch"] for checkpoint in checkpoint_callback.get_checkpoints()],
+    )
+
+
+def test_checkpoints_logged_to_context(rundb_mock, tmp_path):
+    train_run = mlrun.new_function().run(
+        artifact_path=str(tmp_path),
+        handler=_train_with_checkpoints,
+        params={"epochs": 3, "top_k": 2},
+    )
+
+    # the validation loss improves every epoch, the last two are kept and logged by their rank
+    assert train_run.outputs["kept_epochs"] == [3, 2]
+    assert "checkpoint_1" in train_run.outputs
+    assert "checkpoint_2" in train_run.outputs
+    assert "checkpoint_3" not in train_run.outputs
+    assert sorted(path.name for path in tmp_path.rglob("*.pt")) == [
+        "checkpoint_1.pt",
+        "checkpoint_2.pt",
+    ]
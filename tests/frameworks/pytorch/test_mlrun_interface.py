@@ -0,0 +1,223 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from mlrun.frameworks.pytorch import Callback, PyTorchMLRunInterface
+
+NUM_ROWS = 16
+
+
+class _RecordingCallback(Callback):
+    def __init__(self):
+        super().__init__()
+        self.steps = []
+        self.losses = []
+        self.metrics = []
+
+    def on_optimizer_step_end(self):
+        self.steps.append("optimizer")
+
+    def on_scheduler_step_end(self):
+        self.steps.append("scheduler")
+
+    def on_train_loss_end(self, loss_value):
+        self.losses.append(float(loss_value))
+
+    def on_train_metrics_end(self, metric_values):
+        self.metrics.append([float(metric_value) for metric_value in metric_values])
+
+
+def mean_target(y_pred, y_true):
+    return y_true.mean()
+
+
+def _get_dataset() -> TensorDataset:
+    generator = torch.Generator().manual_seed(0)
+    x = torch.randn(NUM_ROWS, 4, generator=generator)
+    y = x @ torch.tensor([[1.0], [-2.0], [0.5], [3.0]])
+    return TensorDataset(x, y + 0.1 * torch.randn(NUM_ROWS, 1, generator=generator))
+
+
+def _train(training_set: DataLoader, scheduler: bool = False, **train_kwargs):
+    torch.manual_seed(0)
+    model = torch.nn.Linear(4, 1)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    PyTorchMLRunInterface(model=model, context=unittest.mock.Mock(labels={})).train(
+        training_set=training_set,
+        loss_function=torch.nn.MSELoss(),
+        optimizer=optimizer,
+        scheduler=torch.optim.lr_scheduler.StepLR(optimizer, step_size=1)
+        if scheduler
+        else None,
+        use_cuda=False,
+        **train_kwargs,
+    )
+    return model
+
+
+def _assert_same_parameters(model, expected_model, atol: float = 1e-5):
+    for parameter, expected_parameter in zip(
+        model.parameters(), expected_model.parameters()
+    ):
+        torch.testing.assert_close(parameter, expected_parameter, atol=atol, rtol=0)
+
+
+@pytest.mark.parametrize(
+    "gradient_accumulation_steps, expected_batches",
+    [
+        (4, [list(range(NUM_ROWS))]),
+        # the last accumulation of the epoch has fewer batches
+        (3, [list(range(12)), list(range(12, NUM_ROWS))]),
+    ],
+)
+def test_gradient_accumulation(gradient_accumulation_steps, expected_batches):
+    # accumulating the gradients of small batches is the same as a step on the accumulated batch
+    model = _train(
+        training_set=DataLoader(_get_dataset(), batch_size=4),
+        epochs=2,
+        gradient_accumulation_steps=gradient_accumulation_steps,
+    )
+    expected_model = _train(
+        training_set=DataLoader(_get_dataset(), batch_sampler=expected_batches),
+        epochs=2,
+    )
+    _assert_same_parameters(model, expected_model)
+
+
+def test_mixed_precision():
+    torch.manual_seed(0)
+    expected_model = torch.nn.Linear(4, 1)
+    optimizer = torch.optim.SGD(expected_model.parameters(), lr=0.1)
+    for x, y_true in DataLoader(_get_dataset(), batch_size=4):
+        optimizer.zero_grad()
+        torch.nn.MSELoss()(expected_model(x), y_true).backward()
+        optimizer.step()
+
+    # without autocast, the training is the same as a plain training loop
+    model = _train(training_set=DataLoader(_get_dataset(), batch_size=4))
+    _assert_same_parameters(model, expected_model)
+
+    # with autocast, within the precision of bfloat16
+    model = _train(
+        training_set=DataLoader(_get_dataset(), batch_size=4),
+        mixed_precision="bfloat16",
+    )
+    _assert_same_parameters(model, expected_model, atol=5e-2)
+
+
+@pytest.mark.parametrize("mixed_precision", [False, "bfloat16"])
+def test_gradient_scaler_only_for_float16(monkeypatch, mixed_precision):
+    def gradient_scaler(*args, **kwargs):
+        raise AssertionError("The gradient scaler is only needed for float16")
+
+    monkeypatch.setattr(torch.amp, "GradScaler", gradient_scaler, raising=False)
+    monkeypatch.setattr(torch.cuda.amp, "GradScaler", gradient_scaler)
+    _train(
+        training_set=DataLoader(_get_dataset(), batch_size=4),
+        mixed_precision=mixed_precision,
+    )
+
+
+def test_scaled_optimizer_step_with_horovod():
+    interface = PyTorchMLRunInterface(
+        model=torch.nn.Linear(4, 1), context=unittest.mock.Mock(labels={})
+    )
+    manager = unittest.mock.MagicMock()
+    interface._optimizer = manager.optimizer
+    interface._gradient_scaler = manager.scaler
+    interface._use_horovod = True
+
+    interface._optimizer_step()
+
+    # the gradients are unscaled only after the allreduce, which the step itself must not wait for again
+    assert manager.mock_calls == [
+        unittest.mock.call.optimizer.synchronize(),
+        unittest.mock.call.scaler.unscale_(manager.optimizer),
+        unittest.mock.call.optimizer.skip_synchronize(),
+        unittest.mock.call.optimizer.skip_synchronize().__enter__(),
+        unittest.mock.call.scaler.step(manager.optimizer),
+        unittest.mock.call.optimizer.skip_synchronize().__exit__(None, None, None),
+        unittest.mock.call.scaler.update(),
+    ]
+
+
+def test_scheduler_steps_only_with_the_optimizer():
+    callback = _RecordingCallback()
+    _train(
+        training_set=DataLoader(_get_dataset(), batch_size=2),
+        scheduler=True,
+        scheduler_step_frequency="batch",
+        gradient_accumulation_steps=4,
+        callbacks=[callback],
+    )
+    assert callback.steps == ["optimizer", "scheduler"] * 2
+
+
+@pytest.mark.parametrize("metrics_frequency", [1, 3, 8])
+def test_metrics_frequency(metrics_frequency):
+    callback = _RecordingCallback()
+    _train(
+        training_set=DataLoader(_get_dataset(), batch_size=2),
+        metric_functions=[mean_target],
+        metrics_frequency=metrics_frequency,
+        callbacks=[callback],
+    )
+
+    # the metrics are averaged over all the batches since the last update (the last update may have fewer batches)
+    y = _get_dataset().tensors[1].view(-1, 2).mean(dim=1)
+    expected_metrics = [
+        y[start : start + metrics_frequency].mean().item()
+        for start in range(0, len(y), metrics_frequency)
+    ]
+    assert len(callback.losses) == len(expected_metrics)
+    assert [metrics[0] for metrics in callback.metrics] == pytest.approx(
+        expected_metrics
+    )
+
+
+def test_metrics_frequency_host_syncs(monkeypatch):
+    syncs = []
+    tensor_float = torch.Tensor.__float__
+    tensor_item = torch.Tensor.item
+
+    def counting_float(tensor):
+        syncs.append(tensor)
+        return tensor_float(tensor)
+
+    def counting_item(tensor):
+        syncs.append(tensor)
+        return tensor_item(tensor)
+
+    monkeypatch.setattr(torch.Tensor, "__float__", counting_float)
+    monkeypatch.setattr(torch.Tensor, "item", counting_item)
+
+    def count_syncs(metrics_frequency: int) -> int:
+        syncs.clear()
+        _train(
+            training_set=DataLoader(_get_dataset(), batch_size=1),
+            metric_functions=[mean_target],
+            metrics_frequency=metrics_frequency,
+        )
+        return len(syncs)
+
+    # the loss and the metric are read by the host only once per update, instead of every batch
+    assert (
+        count_syncs(metrics_frequency=1) - count_syncs(metrics_frequency=4)
+        == (NUM_ROWS - NUM_ROWS // 4) * 2
+    )
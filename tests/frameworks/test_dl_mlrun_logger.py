@@ -0,0 +1,70 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import pytest
+
+from mlrun.frameworks._dl_common.loggers.mlrun_logger import MLRunLogger
+
+num_epochs = 10
+num_metrics = 5
+num_iterations = 4
+
+
+@pytest.mark.parametrize(
+    ("logging_frequency", "expected_writes"),
+    [(1, num_epochs), (3, 4), (num_epochs, 1), (20, 1)],
+)
+def test_log_epoch_to_context_frequency(logging_frequency, expected_writes):
+    context = unittest.mock.Mock(parameters={}, artifact_path="")
+    logger = MLRunLogger(context=context, logging_frequency=logging_frequency)
+    logger.log_static_hyperparameter("batch_size", 32)
+    for epoch in range(num_epochs):
+        logger.log_epoch()
+        logger.log_dynamic_hyperparameter("lr", 0.1 / (epoch + 1))
+        for metric in range(num_metrics):
+            for iteration in range(num_iterations):
+                logger.log_training_result(f"metric_{metric}", iteration)
+                logger.log_validation_result(f"metric_{metric}", iteration)
+            logger.log_training_summary(f"metric_{metric}", epoch)
+            logger.log_validation_summary(f"metric_{metric}", epoch)
+        logger.log_epoch_to_context(epoch=epoch)
+
+    # all the results of an epoch are logged at once:
+    assert context.log_result.call_count == 0
+    assert context.log_results.call_count == num_epochs
+    assert context.log_results.call_args.args[0] == {
+        "batch_size": 32,
+        "lr": 0.1 / num_epochs,
+        **{
+            f"training_metric_{metric}": num_epochs - 1 for metric in range(num_metrics)
+        },
+        **{
+            f"validation_metric_{metric}": num_epochs - 1
+            for metric in range(num_metrics)
+        },
+    }
+
+    # the epochs are written per the logging frequency, and the remaining ones at the end of the run:
+    writes_during_training = num_epochs // logging_frequency
+    assert context.commit.call_count == writes_during_training
+    assert context.log_artifact.call_count == writes_during_training * num_metrics * 2
+    logger.log_run(model_handler=unittest.mock.Mock())
+    assert context.log_artifact.call_count == (
+        expected_writes * num_metrics * 2
+        # the summaries and the dynamic hyperparameters charts:
+        + num_metrics
+        + 1
+    )
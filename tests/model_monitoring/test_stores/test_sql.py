@@ -23,6 +23,7 @@ from typing import Optional, Union, cast
 from zoneinfo import ZoneInfo
 
 import pytest
+import sqlalchemy
 
 import mlrun.common.schemas
 import mlrun.model_monitoring
@@ -238,6 +239,59 @@ class TestSQLStore:
 
         cls.assert_application_record(event=event_v2, new_sql_store=new_sql_store)
 
+    @classmethod
+    def test_sql_write_application_events(
+        cls,
+        event: _AppResultEvent,
+        event_v2: _AppResultEvent,
+        metric_event: _AppResultEvent,
+        new_sql_store: SQLStoreBase,
+    ):
+        other_app_event = event.copy()
+        other_app_event[WriterEvent.APPLICATION_NAME] = "other-app"
+
+        statements = []
+        sqlalchemy.event.listen(
+            new_sql_store.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        # The 2nd event of the same result is expected to overwrite the 1st one
+        new_sql_store.write_application_events(
+            events=[event.copy(), other_app_event, event_v2.copy()]
+        )
+        # A single bulk statement for all the events
+        assert len(statements) == 1
+
+        cls.assert_application_record(event=event_v2, new_sql_store=new_sql_store)
+        with new_sql_store.engine.connect() as connection:
+            assert (
+                connection.execute(
+                    sqlalchemy.select(sqlalchemy.func.count()).select_from(
+                        new_sql_store.application_results_table.__table__
+                    )
+                ).scalar()
+                == 2
+            )
+
+        # Existing records are updated by the upsert
+        event_v3 = event_v2.copy()
+        event_v3[ResultData.RESULT_VALUE] = 7.5
+        new_sql_store.write_application_events(events=[event_v3])
+        cls.assert_application_record(event=event_v3, new_sql_store=new_sql_store)
+
+        new_sql_store.write_application_events(
+            events=[metric_event], kind=WriterEventKind.METRIC
+        )
+        metrics = new_sql_store.get_model_endpoint_metrics(
+            endpoint_id=metric_event[WriterEvent.ENDPOINT_ID],
+            type=ModelEndpointMonitoringMetricType.METRIC,
+        )
+        assert [metric.name for metric in metrics] == [
+            metric_event[MetricData.METRIC_NAME]
+        ]
+
     @staticmethod
     def assert_application_record(event: _AppResultEvent, new_sql_store: SQLStoreBase):
         criteria = [
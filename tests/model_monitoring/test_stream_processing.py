@@ -12,10 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+import unittest.mock
+
 import pytest
+import sqlalchemy
+import storey
 
 import mlrun
-from mlrun.model_monitoring.stream_processing import EventStreamProcessor
+import mlrun.common.schemas
+from mlrun.common.schemas.model_monitoring.constants import EventFieldType
+from mlrun.model_monitoring.stream_processing import (
+    EventStreamProcessor,
+    UpdateEndpoint,
+)
 
 
 @pytest.mark.parametrize("tsdb_connector", ["v3io", "taosws"])
@@ -55,3 +65,69 @@ def test_plot_monitoring_serving_graph(tsdb_connector, endpoint_store):
     print("Feed this to graphviz, or to https://dreampuf.github.io/GraphvizOnline")
     print()
     print(graph)
+
+
+@pytest.mark.parametrize(
+    "flush_interval_secs, expected_updates_count", [(0, 40), (60, 2)]
+)
+def test_update_endpoint_write_behind(
+    tmp_path, flush_interval_secs, expected_updates_count
+):
+    project_name = "test-stream-processing"
+    store = mlrun.model_monitoring.get_store_object(
+        project=project_name,
+        store_connection_string=f"sqlite:///{tmp_path / 'test.db'}",
+    )
+    store.create_tables()
+    endpoint_ids = ["ep1", "ep2"]
+    for endpoint_id in endpoint_ids:
+        store.write_model_endpoint(
+            mlrun.common.schemas.ModelEndpoint(
+                metadata=mlrun.common.schemas.ModelEndpointMetadata(
+                    project=project_name, uid=endpoint_id
+                ),
+                spec=mlrun.common.schemas.ModelEndpointSpec(
+                    function_uri=f"{project_name}/my-fn", model="model:latest"
+                ),
+            ).flat_dict()
+        )
+
+    updates = []
+    sqlalchemy.event.listen(
+        store.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: updates.append(statement)
+        if statement.startswith("UPDATE")
+        else None,
+    )
+
+    step = UpdateEndpoint(
+        project=project_name,
+        flush_interval_secs=flush_interval_secs,
+        max_pending_updates=1000,
+    )
+    with unittest.mock.patch(
+        "mlrun.model_monitoring.get_store_object", return_value=store
+    ) as get_store_object:
+        controller = storey.build_flow([storey.SyncEmitSource(), step]).run()
+        for i in range(20):
+            for endpoint_id in endpoint_ids:
+                controller.emit(
+                    {
+                        EventFieldType.ENDPOINT_ID: endpoint_id,
+                        EventFieldType.LABELS: "{}",
+                        EventFieldType.ERROR_COUNT: i,
+                        EventFieldType.LAST_REQUEST: datetime.datetime(
+                            2024, 1, 1, 0, 0, i
+                        ),
+                    }
+                )
+        controller.terminate()
+        controller.await_termination()
+
+    get_store_object.assert_called_once()
+    assert len(updates) == expected_updates_count
+    for endpoint_id in endpoint_ids:
+        record = store.get_model_endpoint(endpoint_id=endpoint_id)
+        assert record[EventFieldType.ERROR_COUNT] == 19
+        assert record[EventFieldType.LAST_REQUEST] == "2024-01-01T00:00:19"
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import datetime
 import json
 import os
@@ -20,6 +21,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 import semver
+import storey
 import v3io.dataplane.kv
 import v3io_frames.client
 
@@ -333,3 +335,100 @@ class TestTSDB:
     ) -> None:
         event, kind = ModelMonitoringWriter._reconstruct_event(event)
         writer._tsdb_connector.write_application_event(event, kind)
+
+
+@pytest.mark.parametrize(
+    ("store_type", "flush_interval_secs", "expected_single_writes"),
+    [
+        (mm_schemas.ModelEndpointTarget.SQL, 1, 0),
+        (mm_schemas.ModelEndpointTarget.SQL, 0, 5),
+        (mm_schemas.ModelEndpointTarget.V3IO_NOSQL, 1, 5),
+    ],
+)
+def test_write_to_store_batching(
+    event: _AppResultEvent,
+    store_type: str,
+    flush_interval_secs: float,
+    expected_single_writes: int,
+) -> None:
+    store = Mock(type=store_type)
+    with patch("mlrun.model_monitoring.get_store_object", return_value=store):
+        with patch("mlrun.model_monitoring.get_tsdb_connector"):
+            writer = ModelMonitoringWriter(
+                project=TEST_PROJECT,
+                store_batch_max_events=3,
+                store_batch_flush_interval_secs=flush_interval_secs,
+            )
+
+    event, kind = ModelMonitoringWriter._reconstruct_event(event)
+    for _ in range(5):
+        writer._write_to_store(event=event.copy(), kind=kind)
+    assert store.write_application_event.call_count == expected_single_writes
+
+    writer.flush()
+    assert [
+        len(call.kwargs["events"])
+        for call in store.write_application_events.call_args_list
+    ] == ([3, 2] if not expected_single_writes else [])
+
+
+def _sql_store_writer(store: Mock, **kwargs) -> ModelMonitoringWriter:
+    with patch("mlrun.model_monitoring.get_store_object", return_value=store):
+        with patch("mlrun.model_monitoring.get_tsdb_connector"):
+            return ModelMonitoringWriter(project=TEST_PROJECT, **kwargs)
+
+
+def test_write_to_store_failed_flush_keeps_events(event: _AppResultEvent) -> None:
+    store = Mock(type=mm_schemas.ModelEndpointTarget.SQL)
+    store.write_application_events.side_effect = [RuntimeError("db is down"), None]
+    writer = _sql_store_writer(
+        store, store_batch_max_events=10, store_batch_flush_interval_secs=1
+    )
+
+    event, kind = ModelMonitoringWriter._reconstruct_event(event)
+    for _ in range(3):
+        writer._write_to_store(event=event.copy(), kind=kind)
+    with pytest.raises(RuntimeError, match="db is down"):
+        writer.flush()
+    writer._write_to_store(event=event.copy(), kind=kind)
+
+    # the events of the failed flush are written by the next one, before the newer event
+    writer.flush()
+    assert len(store.write_application_events.call_args.kwargs["events"]) == 4
+    writer.flush()
+    assert store.write_application_events.call_count == 2
+
+
+def test_write_to_store_timed_flush_retries(event: _AppResultEvent) -> None:
+    store = Mock(type=mm_schemas.ModelEndpointTarget.SQL)
+    store.write_application_events.side_effect = [RuntimeError("db is down"), None]
+    writer = _sql_store_writer(
+        store, store_batch_max_events=10, store_batch_flush_interval_secs=0.05
+    )
+    event, kind = ModelMonitoringWriter._reconstruct_event(event)
+
+    async def write_events():
+        for _ in range(2):
+            writer._write_to_store(event=event.copy(), kind=kind)
+        await asyncio.sleep(0.5)
+
+    asyncio.run(write_events())
+    assert store.write_application_events.call_count == 2
+    assert len(store.write_application_events.call_args.kwargs["events"]) == 2
+    assert writer._store_events_count == 0
+
+
+def test_write_to_store_flushed_on_flow_termination(event: _RawEvent) -> None:
+    store = Mock(type=mm_schemas.ModelEndpointTarget.SQL)
+    writer = _sql_store_writer(
+        store, store_batch_max_events=10, store_batch_flush_interval_secs=60
+    )
+    controller = storey.build_flow([storey.SyncEmitSource(), writer]).run()
+    for _ in range(3):
+        controller.emit(event.copy())
+    assert store.write_application_events.call_count == 0
+
+    controller.terminate()
+    controller.await_termination()
+    store.write_application_events.assert_called_once()
+    assert len(store.write_application_events.call_args.kwargs["events"]) == 3
@@ -131,6 +131,91 @@ def test_sync_functions_unavailable_file():
         project.sync_functions()
 
 
+def test_sync_functions_concurrently(rundb_mock, tmp_path):
+    project = mlrun.new_project("project-name", context=str(tmp_path), save=False)
+    function_names = [f"func-{index}" for index in range(10)]
+    for function_name in function_names:
+        function_path = tmp_path / f"{function_name}.py"
+        function_path.write_text(
+            f"def {function_name.replace('-', '_')}():\n    pass\n"
+        )
+        project.set_function(
+            str(function_path),
+            function_name,
+            kind="job",
+            image="mlrun/mlrun",
+            handler=function_name.replace("-", "_"),
+        )
+
+    mlrun.mlconf.projects.sync_functions.compiled_functions_cache_size = 0
+    with unittest.mock.patch(
+        "mlrun.runtimes.utils._resolve_code_metadata", return_value="some-origin"
+    ) as resolve_code_metadata:
+        functions = project.sync_functions()
+
+    # the git metadata is resolved once for the project context and once for the functions directory (which is
+    # the same path in this case), rather than once per function
+    assert resolve_code_metadata.call_count == 1
+    # functions are kept in the order of their definitions
+    assert list(functions.keys()) == function_names
+    for function_name, function in functions.items():
+        assert function.metadata.name == function_name
+        assert function.spec.build.code_origin == "some-origin"
+
+
+def test_sync_functions_resolves_repo_commit_once(rundb_mock, tmp_path):
+    project = mlrun.new_project("project-name", context=str(tmp_path), save=False)
+    for index in range(5):
+        project.set_function(
+            func=mlrun.new_function(f"func-{index}", kind="job", image="mlrun/mlrun"),
+            name=f"func-{index}",
+        )
+    project.spec.origin_url = "git://github.com/org/repo.git"
+    project.spec.repo = unittest.mock.Mock()
+    head = unittest.mock.PropertyMock(
+        return_value=unittest.mock.Mock(commit=unittest.mock.Mock(hexsha="sha"))
+    )
+    type(project.spec.repo).head = head
+
+    project.sync_functions(always=True)
+
+    # the repository isn't thread safe, so its commit is read once before the functions are loaded concurrently
+    assert head.call_count == 1
+
+
+def test_sync_functions_compiled_functions_cache(rundb_mock, tmp_path, monkeypatch):
+    mlrun.mlconf.projects.sync_functions.compiled_functions_cache_size = 10
+    function_path = tmp_path / "handler.py"
+    function_path.write_text("def handler():\n    pass\n")
+    project = mlrun.new_project("project-name", save=False)
+    project.set_function(
+        str(function_path), "func", kind="job", image="mlrun/mlrun", handler="handler"
+    )
+    mlrun.projects.project._compiled_functions_cache.clear()
+
+    with unittest.mock.patch(
+        "mlrun.projects.project.code_to_function",
+        wraps=mlrun.projects.project.code_to_function,
+    ) as code_to_function:
+        first_function = project.sync_functions()["func"]
+        second_function = project.sync_functions()["func"]
+        assert code_to_function.call_count == 1
+        assert first_function is not second_function
+        assert first_function.to_dict() == second_function.to_dict()
+
+        # changing the code invalidates the cache
+        function_path.write_text("def handler():\n    return 1\n")
+        project.sync_functions()
+        assert code_to_function.call_count == 2
+
+        # so does changing any of the configuration
+        monkeypatch.setattr(mlrun.mlconf, "default_project", "other-default-project")
+        project.sync_functions()
+        assert code_to_function.call_count == 3
+        project.sync_functions()
+        assert code_to_function.call_count == 3
+
+
 def test_export_project_dir_doesnt_exist():
     project_name = "project-name"
     project_file_path = (
@@ -27,6 +27,7 @@ from tempfile import mkdtemp
 from uuid import uuid4
 
 import deepdiff
+import pandas as pd
 import pytest
 import requests_mock as requests_mock_package
 
@@ -311,6 +312,30 @@ def test_runs(create_server):
     assert not runs, "found runs in after delete"
 
 
+def test_list_runs_as_df(create_server):
+    server: Server = create_server()
+    db = server.conn
+    prj = "p181"
+    db.create_project(mlrun.new_project(prj, save=False))
+
+    for i in range(25):
+        run = RunObject().to_dict()
+        run["metadata"]["name"] = f"run-name-{i % 3}"
+        run["metadata"]["labels"] = {"index": str(i)}
+        run.setdefault("spec", {})["parameters"] = {"p1": i, "p2": "value"}
+        run["status"]["state"] = "completed"
+        run["status"]["results"] = {"accuracy": i / 25}
+        db.store_run(run, f"uid_{i}", prj)
+
+    list_runs_kwargs = {
+        "project": prj,
+        "start_time_from": datetime.datetime.now() - datetime.timedelta(days=1),
+    }
+    df = db.list_runs(as_df=True, **list_runs_kwargs)
+    assert len(df) == 25
+    pd.testing.assert_frame_equal(df, db.list_runs(**list_runs_kwargs).to_df())
+
+
 def test_basic_auth(create_server):
     user, password = "bugs", "bunny"
     env = {
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import pandas as pd
 import pytest
 
 import mlrun
@@ -43,3 +44,18 @@ def test_nopdb():
     # expected to fail
     with pytest.raises(mlrun.errors.MLRunBadRequestError):
         rundb.read_run("123")
+
+
+def test_nopdb_list_runs_as_df(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.httpdb.nop_db, "raise_error", False)
+    rundb = mlrun.get_run_db()
+    assert isinstance(rundb, mlrun.db.nopdb.NopDB)
+
+    df = rundb.list_runs(as_df=True)
+    assert isinstance(df, pd.DataFrame)
+    assert df.empty
+    assert list(df.columns) == mlrun.lists.list_header
+
+    # the project passes the flag to its db
+    project = mlrun.new_project("nopdb-project", save=False)
+    pd.testing.assert_frame_equal(project.list_runs(as_df=True), df)
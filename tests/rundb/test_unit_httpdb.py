@@ -14,8 +14,11 @@
 #
 # test_httpdb.py actually holds integration tests (that should be migrated to tests/integration/sdk_api/httpdb)
 # currently we are running it in the integration tests CI step so adding this file for unit tests for the httpdb
+import base64
 import enum
 import io
+import json
+import time
 import unittest.mock
 
 import pytest
@@ -313,3 +316,102 @@ def test_watch_logs_continue():
     assert (
         adapter.call_count == len(log_lines) + 1
     ), "should have called the adapter once per log line, and one more time at the end of log"
+
+
+def test_watch_logs_follow(monkeypatch):
+    log_chunks = [b"Firstrow", b"Secondrow", b"Smiley\xf0\x9f\x98\x86", b"LastRow"]
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    run_uid = "some-uid"
+    project = "some-project"
+    adapter = requests_mock.Adapter()
+    requested_offsets = []
+
+    def _event(event, **data):
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    def callback(request, context):
+        offset = int(request.qs["offset"][0])
+        requested_offsets.append(offset)
+        context.status_code = 200
+        context.headers["content-type"] = "text/event-stream"
+        events = ""
+        if offset == 0:
+            # first stream ends while the run is still running (e.g. max follow duration), the client should
+            # reconnect from the last offset
+            events += _event("state", state="running")
+            for chunk in log_chunks[:2]:
+                events += _event(
+                    "log", offset=offset, content=base64.b64encode(chunk).decode()
+                )
+                offset += len(chunk)
+            events += ": heartbeat\n\n"
+        else:
+            events += _event("state", state="running")
+            for chunk in log_chunks[2:]:
+                events += _event(
+                    "log", offset=offset, content=base64.b64encode(chunk).decode()
+                )
+                offset += len(chunk)
+            events += _event("state", state="completed")
+        return events.encode()
+
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}",
+        content=callback,
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    mlrun.mlconf.httpdb.logs.follow.mode = "enabled"
+    monkeypatch.setattr(mlrun.mlconf.httpdb.logs, "pull_logs_default_interval", 0)
+    with unittest.mock.patch("builtins.print") as print_mock:
+        state, offset = db.watch_log(run_uid, project=project)
+
+    assert state == "completed"
+    assert offset == len(b"".join(log_chunks))
+    assert requested_offsets == [0, len(b"".join(log_chunks[:2]))]
+    assert adapter.call_count == 2
+    assert all(request.qs["follow"] == ["true"] for request in adapter.request_history)
+    printed = "".join(call.args[0] for call in print_mock.call_args_list)
+    assert printed == "FirstrowSecondrowSmiley😆LastRow"
+
+
+def test_watch_logs_follow_reconnects_without_state(monkeypatch):
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    run_uid = "some-uid"
+    project = "some-project"
+    adapter = requests_mock.Adapter()
+
+    def _event(event, **data):
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    def callback(request, context):
+        context.status_code = 200
+        context.headers["content-type"] = "text/event-stream"
+        if adapter.call_count < 3:
+            # the stream is closed before the state was sent, the client should keep following
+            return b": heartbeat\n\n"
+        return (
+            _event("state", state="completed")
+            + _event("log", offset=0, content=base64.b64encode(b"LastRow").decode())
+        ).encode()
+
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}",
+        content=callback,
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    monkeypatch.setattr(mlrun.mlconf.httpdb.logs.follow, "mode", "enabled")
+    monkeypatch.setattr(mlrun.mlconf.httpdb.logs, "pull_logs_default_interval", 3)
+    sleep_mock = unittest.mock.MagicMock()
+    monkeypatch.setattr(time, "sleep", sleep_mock)
+    with unittest.mock.patch("builtins.print"):
+        state, offset = db.watch_log(run_uid, project=project)
+
+    assert state == "completed"
+    assert offset == len(b"LastRow")
+    assert adapter.call_count == 3
+    # the client waits between the reconnects
+    assert sleep_mock.call_args_list == [unittest.mock.call(3)] * 2
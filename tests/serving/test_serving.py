@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import http.server
 import json
 import os
 import pathlib
+import threading
 import time
 
 import pandas as pd
@@ -751,6 +754,91 @@ def test_mock_invoke():
     mlrun.mlconf.mock_nuclio_deployment = mock_nuclio_config
 
 
+@pytest.mark.parametrize("rate", [None, 50])
+def test_mock_load_test(rate):
+    mlrun.new_project("x", save=False)
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=100))
+
+    # every third request fails, with no inputs to predict
+    bodies = [testdata, testdata_2, '{"inputs": []}']
+    results = fn.load_test(
+        "/v2/models/my/infer", bodies, concurrency=3, duration=1, rate=rate, mock=True
+    )
+    assert results.mode == ("open-loop" if rate else "closed-loop")
+    if rate:
+        assert results.requests == 50
+    assert results.requests == len(results.latencies) + results.errors["400"]
+    assert results.errors["400"] == results.requests // 3
+    assert 0 < results.latency_percentile(50) <= results.latency_percentile(99)
+    assert results.throughput > 0
+    assert results.to_dict()["errors"] == results.errors
+
+
+@pytest.mark.parametrize("inside_running_loop", [False, True])
+def test_mock_load_test_after_event_loop_use(inside_running_loop):
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=100))
+
+    def load_test():
+        return fn.load_test(
+            "/v2/models/my/infer", [testdata], concurrency=2, duration=0.2, mock=True
+        )
+
+    # an earlier asyncio.run() leaves no current event loop in the main thread
+    asyncio.run(asyncio.sleep(0))
+    if inside_running_loop:
+
+        async def load_test_from_coroutine():
+            return load_test()
+
+        results = asyncio.run(load_test_from_coroutine())
+    else:
+        results = load_test()
+
+    assert results.requests > 0
+    assert results.errors == {}
+
+
+def test_load_test_live_address():
+    requests_paths = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):  # noqa: N802
+            requests_paths.append(self.path)
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            status = 200 if body["inputs"] else 500
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        fn = mlrun.new_function("tests", kind="serving")
+        results = fn.load_test(
+            f"http://127.0.0.1:{server.server_port}/v2/models/my/infer",
+            [{"inputs": [5]}, {"inputs": []}],
+            concurrency=2,
+            duration=2,
+            rate=20,
+            mock=False,
+        )
+    finally:
+        server.shutdown()
+        thread.join()
+
+    assert results.requests == 40
+    assert len(results.latencies) == 20
+    assert results.errors == {"500": 20}
+    assert results.error_rate == 0.5
+    assert set(requests_paths) == {"/v2/models/my/infer"}
+
+
 def test_add_route_exceeds_max_steps():
     """Test adding a route when the maximum number of steps is exceeded."""
     host = create_graph_server(graph=RouterStep())
@@ -0,0 +1,81 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mlrun
+
+
+def _import_mlrun_in_subprocess(code: str = "pass") -> set[str]:
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; import mlrun; {code}; print(json.dumps(list(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        # with a configured dbpath, importing mlrun connects to the API (which loads the db client)
+        env={key: value for key, value in os.environ.items() if key != "MLRUN_DBPATH"},
+    )
+    return set(json.loads(process.stdout.splitlines()[-1]))
+
+
+def test_import_mlrun_is_lazy():
+    modules = _import_mlrun_in_subprocess()
+    for module in ["kfp", "nuclio", "mlrun.runtimes", "mlrun.projects", "mlrun.db"]:
+        assert module not in modules
+
+    modules = _import_mlrun_in_subprocess("mlrun.code_to_function")
+    assert "mlrun.run" in modules
+    assert "mlrun.runtimes" in modules
+
+
+@pytest.mark.parametrize("name", mlrun.__all__)
+def test_public_api_attributes(name):
+    assert getattr(mlrun, name) is not None
+    assert name in dir(mlrun)
+
+
+def test_lazy_submodules():
+    assert mlrun.runtimes.__name__ == "mlrun.runtimes"
+    assert mlrun.feature_store.__name__ == "mlrun.feature_store"
+    assert not hasattr(mlrun, "not_an_attribute")
+    with pytest.raises(AttributeError):
+        mlrun.not_an_attribute
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "mlrun.runtimes",
+        "mlrun.launcher.factory",
+        "mlrun.serving",
+        "mlrun.feature_store",
+        "mlrun.__main__",
+    ],
+)
+def test_import_submodule_first(module):
+    # without the eager imports of mlrun/__init__.py, the submodules are the entry points of the import cycles
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        check=True,
+        env={key: value for key, value in os.environ.items() if key != "MLRUN_DBPATH"},
+    )
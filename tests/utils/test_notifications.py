@@ -17,6 +17,7 @@ import builtins
 import copy
 import hashlib
 import json
+import time
 import unittest.mock
 from contextlib import nullcontext as does_not_raise
 
@@ -26,6 +27,7 @@ import tabulate
 
 import mlrun.common.schemas.notification
 import mlrun.utils.notifications
+import mlrun.utils.notifications.notification_loop
 import server.api.api.utils
 import server.api.constants
 import server.api.crud
@@ -469,6 +471,109 @@ async def test_webhook_notification(monkeypatch, test_method):
     )
 
 
+def test_webhook_notifications_share_pooled_session(monkeypatch):
+    requests_mock = unittest.mock.AsyncMock(return_value=unittest.mock.MagicMock())
+    monkeypatch.setattr(aiohttp.ClientSession, "post", requests_mock)
+    notification_pusher = mlrun.utils.notifications.CustomNotificationPusher(
+        ["webhook"]
+    )
+    notification_pusher.add_notification("webhook", {"url": "https://test-url"})
+
+    try:
+        notification_pusher.push("first-message", "info")
+        notification_loop = (
+            mlrun.utils.notifications.notification_loop.get_notification_loop()
+        )
+        session = notification_loop._session
+        assert session is not None
+
+        notification_pusher.push("second-message", "info")
+        assert requests_mock.call_count == 2
+        assert notification_loop._session is session
+        assert not session.closed
+    finally:
+        mlrun.utils.notifications.notification_loop.close_notification_loop()
+    assert session.closed
+
+
+@pytest.mark.parametrize("in_jupyter_notebook", [False, True])
+def test_push_from_running_event_loop(monkeypatch, in_jupyter_notebook):
+    monkeypatch.setattr(
+        mlrun.utils.helpers,
+        "is_running_in_jupyter_notebook",
+        lambda: in_jupyter_notebook,
+    )
+    mock_warning = unittest.mock.MagicMock()
+    monkeypatch.setattr(
+        mlrun.utils.notifications.notification_pusher.logger, "warning", mock_warning
+    )
+    notification_pusher = mlrun.utils.notifications.CustomNotificationPusher([])
+
+    async def failing_push():
+        await asyncio.sleep(0.1)
+        raise RuntimeError("push failed")
+
+    async def push_from_coroutine():
+        notification_pusher._push(lambda: None, failing_push)
+
+    try:
+        if in_jupyter_notebook:
+            # the push is waited for, as the baseline Jupyter Notebook push did
+            with pytest.raises(RuntimeError, match="push failed"):
+                asyncio.run(push_from_coroutine())
+        else:
+            # an async caller is not blocked, the failure is logged once the push is done
+            asyncio.run(push_from_coroutine())
+            assert mock_warning.call_count == 0
+            for _ in range(50):
+                if mock_warning.called:
+                    break
+                time.sleep(0.1)
+            mock_warning.assert_called_once()
+            assert "push failed" in mock_warning.call_args.kwargs["error"]
+    finally:
+        mlrun.utils.notifications.notification_loop.close_notification_loop()
+
+
+def test_notification_loop_rate_limit_per_target(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.notifications, "rate_limit_per_target", 10)
+    notification_loop = (
+        mlrun.utils.notifications.notification_loop.get_notification_loop()
+    )
+    request_times = {}
+
+    async def send_request(url):
+        async with notification_loop.session(url):
+            request_times.setdefault(url, []).append(time.monotonic())
+
+    async def send_requests():
+        await asyncio.gather(
+            *[
+                send_request(url)
+                for url in ["http://target-a/hook", "http://target-b/hook"] * 3
+            ]
+        )
+
+    try:
+        notification_loop.submit(send_requests()).result()
+    finally:
+        mlrun.utils.notifications.notification_loop.close_notification_loop()
+
+    for times in request_times.values():
+        assert len(times) == 3
+        # requests to the same target are spaced by the rate limit interval
+        assert all(later - earlier >= 0.09 for earlier, later in zip(times, times[1:]))
+
+    # different targets are not limited by each other
+    assert (
+        abs(
+            request_times["http://target-a/hook"][0]
+            - request_times["http://target-b/hook"][0]
+        )
+        < 0.09
+    )
+
+
 @pytest.mark.parametrize(
     "ipython_active,expected_console_call_amount,expected_ipython_call_amount",
     [